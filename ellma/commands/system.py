@@ -543,13 +543,14 @@ class SystemCommands(BaseCommand):
         }
 
         try:
-            # Check for SSH connections
-            ssh_connections = [conn for conn in psutil.net_connections()
+            # Check for SSH connections (only TCP sockets are ever
+            # established or listening, so the UDP tables are not read)
+            ssh_connections = [conn for conn in psutil.net_connections(kind='tcp')
                              if conn.laddr and conn.laddr.port == 22 and conn.status == psutil.CONN_ESTABLISHED]
             security_status["ssh_connections"] = len(ssh_connections)
 
             # List open ports
-            open_ports = [conn.laddr.port for conn in psutil.net_connections()
+            open_ports = [conn.laddr.port for conn in psutil.net_connections(kind='tcp')
                          if conn.status == psutil.CONN_LISTEN and conn.laddr]
             security_status["open_ports"] = sorted(set(open_ports))
 
@@ -14,6 +14,7 @@ import time
 import psutil
 import platform
 import subprocess
+from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from rich.console import Console
@@ -50,6 +51,25 @@ from ..utils import (
 import logging
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=256)
+def _format_bytes(size: int) -> str:
+    """Format bytes into a human-readable string.
+    
+    Results are memoized at module level so that repeated values (zero,
+    common cache sizes, totals) are shared across command instances.
+    
+    Args:
+        size: Size in bytes
+        
+    Returns:
+        Formatted string with appropriate unit (B, KB, MB, GB, TB)
+    """
+    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+        if size < 1024.0:
+            return f"{size:.1f} {unit}"
+        size /= 1024.0
+    return f"{size:.1f} PB"
+
 class CommandError(Exception):
     """Base exception for command-related errors."""
     pass
@@ -150,11 +170,7 @@ class BaseCommand:
         Returns:
             Formatted string with appropriate unit (B, KB, MB, GB, TB)
         """
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} PB"
+        return _format_bytes(size)
     
     def _format_timedelta(self, td: timedelta) -> str:
         """Format a timedelta into a human-readable string.
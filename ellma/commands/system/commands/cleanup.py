@@ -17,8 +17,8 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn
 
-from ..commands import BaseCommand, CommandResult
-from ...utils import (
+from ..commands import BaseCommand, CommandResult, _format_bytes
+from ..utils import (
     cleanup_temp_files,
     cleanup_old_logs
 )
@@ -105,14 +105,13 @@ class CleanupCommand(BaseCommand):
             
             # Calculate totals
             results["end_time"] = datetime.now().isoformat()
-            results["total_freed"] = sum(
-                task.get("freed", 0) 
-                for task in results["tasks"].values()
-            )
-            results["total_files"] = sum(
-                task.get("deleted", 0) 
-                for task in results["tasks"].values()
-            )
+            total_freed = 0
+            total_files = 0
+            for task_result in results["tasks"].values():
+                total_freed += task_result.get("freed", 0)
+                total_files += task_result.get("deleted", 0)
+            results["total_freed"] = total_freed
+            results["total_files"] = total_files
             
             # Display summary
             self._display_summary(results)
@@ -715,7 +714,12 @@ class CleanupCommand(BaseCommand):
         Args:
             results: Dictionary containing cleanup results.
         """
-        if results.get("dry_run"):
+        tasks = results.get("tasks") or {}
+        total_files = results.get("total_files", 0)
+        total_freed = results.get("total_freed", 0)
+        dry_run = results.get("dry_run", False)
+
+        if dry_run:
             self.console.print("\n[bold yellow]DRY RUN: No files were actually deleted[/bold yellow]\n")
         
         # Create summary table
@@ -727,36 +731,54 @@ class CleanupCommand(BaseCommand):
         )
         
         table.add_column("Task", style="cyan")
-        table.add_column("Files Deleted", justify="right")
-        table.add_column("Space Freed", justify="right")
-        table.add_column("Failed", justify="right")
-        
+
+        # Failures are counted in dry runs too (files that cannot be read),
+        # so the column is only left out of dry runs that had none
+        total_failed = sum(task.get("failed", 0) for task in tasks.values())
+        show_failed = not dry_run or total_failed > 0
+
+        if dry_run:
+            table.add_column("Would Delete", justify="right")
+            table.add_column("Space To Free", justify="right")
+        else:
+            table.add_column("Files Deleted", justify="right")
+            table.add_column("Space Freed", justify="right")
+        if show_failed:
+            table.add_column("Failed", justify="right")
+
         # Add rows for each task
-        for task_name, task in results.get("tasks", {}).items():
-            table.add_row(
+        for task_name, task in tasks.items():
+            row = [
                 task_name.replace("_", " ").title(),
                 str(task.get("deleted", 0)),
-                self._format_bytes(task.get("freed", 0)),
-                str(task.get("failed", 0))
-            )
-        
+                _format_bytes(task.get("freed", 0))
+            ]
+            if show_failed:
+                row.append(str(task.get("failed", 0)))
+            table.add_row(*row)
+
         # Add total row
         table.add_section()
-        table.add_row(
+        total_row = [
             "[bold]Total[/bold]",
-            f"[bold]{results.get('total_files', 0)}[/bold]",
-            f"[bold]{self._format_bytes(results.get('total_freed', 0))}[/bold]",
-            f"[bold]{sum(t.get('failed', 0) for t in results.get('tasks', {}).values())}"
-        )
-        
+            f"[bold]{total_files}[/bold]",
+            f"[bold]{_format_bytes(total_freed)}[/bold]"
+        ]
+        if show_failed:
+            total_row.append(f"[bold]{total_failed}[/bold]")
+        table.add_row(*total_row)
+
         self.console.print(table)
-        
+
         # Show warning if there were failures
-        if any(task.get("failed", 0) > 0 for task in results.get("tasks", {}).values()):
+        if total_failed > 0:
             self.console.print("\n[bold yellow]Warning: Some operations failed. You may need to run as administrator/root.[/bold yellow]")
         
         # Show total space freed
-        self.console.print(f"\n[bold]Total space freed:[/bold] {self._format_bytes(results.get('total_freed', 0))}")
+        if dry_run:
+            self.console.print(f"\n[bold]Total space to free:[/bold] {_format_bytes(total_freed)}")
+        else:
+            self.console.print(f"\n[bold]Total space freed:[/bold] {_format_bytes(total_freed)}")
 
 def execute(temp: bool = True, logs: bool = False, cache: bool = False, 
            downloads: bool = False, trash: bool = False, 
@@ -1,15 +1,30 @@
-""
+"""
 System configuration command.
 
 This module provides the `config` command which displays system and agent configuration.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional
+from types import MappingProxyType
+import platform
+import socket
+
+import psutil
+
 from ..commands import BaseCommand, CommandResult
-from rich.console import Console
+from ..core import get_platform_info
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 
+# This would be replaced with actual agent information
+_AGENT_INFO = MappingProxyType({
+    "version": "1.0.0",
+    "status": "running",
+    "startup_time": "2023-11-15T12:00:00Z",
+    "config_file": "~/.ellma/config.yaml"
+})
+
 class ConfigCommand(BaseCommand):
     """Display system and agent configuration."""
     
@@ -47,7 +62,6 @@ class ConfigCommand(BaseCommand):
         Returns:
             Dictionary containing platform information.
         """
-        import platform
         return {
             "system": platform.system(),
             "node": platform.node(),
@@ -65,9 +79,6 @@ class ConfigCommand(BaseCommand):
         Returns:
             Dictionary containing hardware information.
         """
-        import psutil
-        import socket
-        
         # Get CPU info
         cpu_info = {
             "physical_cores": psutil.cpu_count(logical=False),
@@ -86,6 +97,13 @@ class ConfigCommand(BaseCommand):
         except Exception:
             pass
         
+        # Host identity; core caches the address lookup between calls
+        try:
+            host_info = get_platform_info()
+            hostname, ip_address = host_info["hostname"], host_info["ip_address"]
+        except (socket.error, UnicodeError):
+            hostname, ip_address = socket.gethostname(), "127.0.0.1"
+        
         # Get memory info
         svmem = psutil.virtual_memory()
         swap = psutil.swap_memory()
@@ -102,25 +120,19 @@ class ConfigCommand(BaseCommand):
                 "swap_free": self._format_bytes(swap.free),
                 "swap_percent": f"{swap.percent}%"
             },
-            "hostname": socket.gethostname(),
-            "ip_address": socket.gethostbyname(socket.gethostname())
+            "hostname": hostname,
+            "ip_address": ip_address
         }
         
         return hardware_info
     
-    def _get_agent_info(self) -> Dict[str, Any]:
+    def _get_agent_info(self) -> Mapping[str, Any]:
         """Get agent information.
         
         Returns:
-            Dictionary containing agent information.
+            Read-only mapping containing agent information.
         """
-        # This would be replaced with actual agent information
-        return {
-            "version": "1.0.0",
-            "status": "running",
-            "startup_time": "2023-11-15T12:00:00Z",
-            "config_file": "~/.ellma/config.yaml"
-        }
+        return _AGENT_INFO
     
     def _display_config(self, config_data: Dict[str, Any]) -> None:
         """Display the configuration in a formatted way.
@@ -129,12 +141,12 @@ class ConfigCommand(BaseCommand):
             config_data: Dictionary containing configuration data.
         """
         # System Information
-        self.console.print(Panel.fit(
+        system_panel = Panel.fit(
             "[bold]System Information[/bold]\n" +
             "\n".join(f"[cyan]{k}:[/cyan] {v}" for k, v in config_data["system"].items()),
             title="System",
             border_style="blue"
-        ))
+        )
         
         # Hardware Information
         hardware = config_data["hardware"]
@@ -172,11 +184,11 @@ class ConfigCommand(BaseCommand):
         hardware_panel.add_column("Memory")
         hardware_panel.add_row(cpu_table, memory_table)
         
-        self.console.print(Panel.fit(
+        hardware_panel = Panel.fit(
             hardware_panel,
             title="Hardware",
             border_style="green"
-        ))
+        )
         
         # Network Info
         network_table = Table(show_header=False, box=None)
@@ -186,11 +198,11 @@ class ConfigCommand(BaseCommand):
         network_table.add_row("Hostname", hardware["hostname"])
         network_table.add_row("IP Address", hardware["ip_address"])
         
-        self.console.print(Panel.fit(
+        network_panel = Panel.fit(
             network_table,
             title="Network",
             border_style="yellow"
-        ))
+        )
         
         # Agent Info
         agent_table = Table(show_header=False, box=None)
@@ -201,11 +213,14 @@ class ConfigCommand(BaseCommand):
         for key, value in agent_info.items():
             agent_table.add_row(key.replace('_', ' ').title(), str(value))
         
-        self.console.print(Panel.fit(
+        agent_panel = Panel.fit(
             agent_table,
             title="Agent",
             border_style="magenta"
-        ))
+        )
+        
+        # Render all panels in a single print to avoid one terminal write per panel
+        self.console.print(Group(system_panel, hardware_panel, network_panel, agent_panel))
 
 def execute(*args, **kwargs) -> CommandResult:
     """Execute the config command.
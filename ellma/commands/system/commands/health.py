@@ -5,16 +5,19 @@ This module provides the `health` command which performs a quick health check.
 """
 
 from typing import Dict, Any, List
+from contextlib import nullcontext
 from datetime import datetime
 import psutil
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn
+from rich.style import Style
+from rich.text import Text
 
 from ..commands import BaseCommand, CommandResult
-from ...core import (
+from ..core import (
     get_resource_usage,
     get_uptime,
     get_load_average
@@ -23,6 +26,14 @@ from ...core import (
 class HealthCommand(BaseCommand):
     """Perform a quick system health check."""
     
+    # Pre-styled status cells so table rows skip Rich's markup parser
+    _STATUS_TEXT = {
+        "ok": Text("OK", style=Style(color="green")),
+        "warning": Text("WARNING", style=Style(color="yellow")),
+        "critical": Text("CRITICAL", style=Style(color="red")),
+        "unknown": Text("UNKNOWN", style=Style(color="blue"))
+    }
+    
     def execute(self, *args, **kwargs) -> CommandResult:
         """Execute the health command.
         
@@ -33,34 +44,43 @@ class HealthCommand(BaseCommand):
             # Get basic system information
             health_data = {}
             
-            with Progress(
+            # Only show a spinner on interactive terminals; when output is
+            # redirected it just burns a refresh thread and ANSI writes.
+            show_progress = self.console.is_terminal
+            progress_cm = Progress(
                 SpinnerColumn(),
                 "* Performing health check...",
                 console=self.console,
                 transient=True
-            ) as progress:
-                task = progress.add_task("Checking...", total=4)
+            ) if show_progress else nullcontext()
+            
+            with progress_cm as progress:
+                task = progress.add_task("Checking...", total=4) if show_progress else None
+                
+                def advance(description: str) -> None:
+                    if task is not None:
+                        progress.update(task, advance=1, description=description)
                 
                 # Get resource usage
                 resources = get_resource_usage()
                 health_data["resources"] = resources
-                progress.update(task, advance=1, description="Checking resources...")
+                advance("Checking resources...")
                 
                 # Get system load
                 load_avg = get_load_average()
                 if load_avg:
                     health_data["load_average"] = load_avg
-                progress.update(task, advance=1, description="Checking system load...")
+                advance("Checking system load...")
                 
                 # Get uptime
                 uptime = get_uptime()
                 health_data["uptime"] = uptime
-                progress.update(task, advance=1, description="Checking uptime...")
+                advance("Checking uptime...")
                 
                 # Calculate health status
                 health_status = self._calculate_health_status(health_data)
                 health_data["status"] = health_status
-                progress.update(task, advance=1, description="Finalizing...")
+                advance("Finalizing...")
                 
                 # Display the results
                 self._display_health_status(health_data)
@@ -220,12 +240,12 @@ class HealthCommand(BaseCommand):
         if load_avg:
             status_table.add_row("Load Average", ", ".join(f"{load:.2f}" for load in load_avg[:3]))
         
-        # Display status table
-        self.console.print(Panel(
+        # Collect everything and render it with a single print
+        renderables = [Panel(
             status_table,
             title="[bold]System Health Status[/bold]",
             border_style=color
-        ))
+        )]
         
         # Display metrics
         metrics = status.get("metrics", {})
@@ -281,37 +301,35 @@ class HealthCommand(BaseCommand):
                 metrics_table.add_row(
                     "Load Average (1/5/15 min)",
                     f"{load['1min']['value']:.2f} / {load['5min']['value']:.2f} / {load['15min']['value']:.2f}",
-                    ", ".join([
+                    Text(", ").join([
                         self._format_status(load[interval].get("status", "unknown"))
                         for interval in ["1min", "5min", "15min"]
                     ])
                 )
             
-            self.console.print(metrics_table)
+            renderables.append(metrics_table)
         
         # Display issues if any
         issues = status.get("issues", [])
         if issues:
-            self.console.print("\n[bold]Issues:[/bold]")
-            for issue in issues:
-                self.console.print(f"  • [yellow]{issue}[/yellow]")
+            renderables.append("\n[bold]Issues:[/bold]")
+            renderables.extend(f"  • [yellow]{issue}[/yellow]" for issue in issues)
+        
+        self.console.print(Group(*renderables))
     
-    def _format_status(self, status: str) -> str:
+    def _format_status(self, status: str) -> Text:
         """Format status with appropriate color.
         
         Args:
             status: Status string (ok, warning, critical, unknown).
             
         Returns:
-            Formatted status string with color.
+            Styled status text.
         """
-        status_map = {
-            "ok": "[green]OK[/green]",
-            "warning": "[yellow]WARNING[/yellow]",
-            "critical": "[red]CRITICAL[/red]",
-            "unknown": "[blue]UNKNOWN[/blue]"
-        }
-        return status_map.get(status.lower(), f"[blue]{status.upper()}[/blue]")
+        text = self._STATUS_TEXT.get(status.lower())
+        if text is None:
+            text = Text(status.upper(), style=Style(color="blue"))
+        return text
 
 def execute(*args, **kwargs) -> CommandResult:
     """Execute the health command.
@@ -4,17 +4,350 @@ Network ports command.
 This module provides the `ports` command which lists network connections and open ports.
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple
+from concurrent.futures import Future, wait
+from functools import partial
+import queue
 import socket
+import threading
 import psutil
-from ipaddress import ip_address
 
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
 from ..commands import BaseCommand, CommandResult
-from ...core import get_network_info
+from ..core import get_network_info
+
+# Common ports and their services
+_COMMON_PORTS: Dict[int, str] = {
+    20: "FTP (Data)",
+    21: "FTP (Control)",
+    22: "SSH",
+    23: "Telnet",
+    25: "SMTP",
+    53: "DNS",
+    67: "DHCP Server",
+    68: "DHCP Client",
+    69: "TFTP",
+    80: "HTTP",
+    88: "Kerberos",
+    110: "POP3",
+    111: "RPC",
+    119: "NNTP",
+    123: "NTP",
+    135: "MS RPC",
+    137: "NetBIOS Name",
+    138: "NetBIOS Datagram",
+    139: "NetBIOS Session",
+    143: "IMAP",
+    161: "SNMP",
+    162: "SNMP Trap",
+    179: "BGP",
+    194: "IRC",
+    389: "LDAP",
+    443: "HTTPS",
+    445: "SMB",
+    465: "SMTPS",
+    514: "Syslog",
+    515: "LPD",
+    587: "SMTP (Submission)",
+    631: "IPP (Printing)",
+    636: "LDAPS",
+    873: "rsync",
+    902: "VMware Server",
+    989: "FTPS (Data)",
+    990: "FTPS (Control)",
+    993: "IMAPS",
+    995: "POP3S",
+    1080: "SOCKS Proxy",
+    1194: "OpenVPN",
+    1433: "MS SQL Server",
+    1521: "Oracle DB",
+    1723: "PPTP",
+    2049: "NFS",
+    2082: "cPanel",
+    2083: "cPanel SSL",
+    2086: "WHM",
+    2087: "WHM SSL",
+    2095: "Webmail",
+    2096: "Webmail SSL",
+    2181: "ZooKeeper",
+    2375: "Docker",
+    2376: "Docker TLS",
+    2377: "Docker Swarm",
+    2380: "etcd",
+    2483: "Oracle DB SSL",
+    2484: "Oracle DB",
+    3000: "Node.js",
+    3128: "Squid",
+    3268: "Microsoft Global Catalog",
+    3269: "Microsoft Global Catalog SSL",
+    3306: "MySQL",
+    3389: "RDP",
+    3690: "Subversion",
+    4369: "Erlang Port Mapper",
+    5000: "UPnP",
+    5001: "Synology",
+    5432: "PostgreSQL",
+    5500: "VNC Server",
+    5601: "Kibana",
+    5672: "RabbitMQ",
+    5900: "VNC",
+    5938: "TeamViewer",
+    5984: "CouchDB",
+    6000: "X11",
+    6379: "Redis",
+    6443: "Kubernetes API Server",
+    6666: "IRC",
+    7001: "WebLogic",
+    7002: "WebLogic SSL",
+    7077: "Spark",
+    7199: "Cassandra",
+    7474: "Neo4j",
+    7687: "Neo4j Bolt",
+    8000: "HTTP Alt",
+    8005: "Tomcat Shutdown",
+    8008: "HTTP Alt",
+    8009: "AJP",
+    8020: "HDFS",
+    8042: "Hadoop NodeManager",
+    8080: "HTTP Proxy",
+    8081: "HTTP Proxy Alt",
+    8088: "Hadoop ResourceManager",
+    8089: "Splunk",
+    8090: "Atlassian",
+    8091: "Couchbase",
+    8092: "Couchbase SSL",
+    8096: "Plex",
+    8140: "Puppet",
+    8200: "GoCD",
+    8222: "VMware Authd",
+    8243: "HTTPS Alt",
+    8333: "Bitcoin",
+    8400: "Commvault",
+    8443: "HTTPS Alt",
+    8500: "Consul",
+    8530: "WSUS",
+    8531: "WSUS SSL",
+    8761: "Eureka",
+    8888: "Jupyter",
+    8983: "Solr",
+    9000: "SonarQube",
+    9001: "Tor",
+    9042: "Cassandra Native",
+    9060: "WebLogic Console",
+    9080: "WebSphere",
+    9090: "Prometheus",
+    9092: "Kafka",
+    9100: "Node Exporter",
+    9160: "Cassandra Thrift",
+    9200: "Elasticsearch",
+    9300: "Elasticsearch Transport",
+    9411: "Git",
+    9443: "VMware vSphere",
+    9999: "JIRA",
+    10000: "Webmin",
+    10050: "Zabbix Agent",
+    10051: "Zabbix Server",
+    10250: "Kubelet",
+    10255: "Kubelet Read-Only",
+    10256: "Kube Proxy",
+    11211: "Memcached",
+    12017: "MongoDB",
+    12201: "Splunk",
+    12489: "NSClient++",
+    15672: "RabbitMQ Management",
+    16379: "Redis Sentinel",
+    16509: "Kubernetes API",
+    18080: "Jenkins",
+    20000: "Docker Swarm",
+    20720: "Symantec AV",
+    24800: "Synergy",
+    25565: "Minecraft",
+    27017: "MongoDB",
+    27018: "MongoDB SSL",
+    27019: "MongoDB Shard",
+    28015: "RethinkDB",
+    28017: "MongoDB Web",
+    30000: "Kubernetes NodePort",
+    31337: "Back Orifice",
+    32768: "RPC",
+    37777: "Dahua CCTV",
+    50000: "SAP",
+    50070: "Hadoop NameNode",
+    50075: "Hadoop DataNode",
+    50090: "Hadoop SecondaryNameNode",
+    54328: "PostgreSQL",
+    60010: "HBase Master"
+}
+
+# Protocol names keyed by (socket family, socket type)
+_PROTOCOLS: Dict[Tuple[int, int], str] = {
+    (int(socket.AF_INET), int(socket.SOCK_STREAM)): "TCP",
+    (int(socket.AF_INET6), int(socket.SOCK_STREAM)): "TCP",
+    (int(socket.AF_INET), int(socket.SOCK_DGRAM)): "UDP",
+    (int(socket.AF_INET6), int(socket.SOCK_DGRAM)): "UDP",
+    (int(socket.AF_INET), int(socket.SOCK_RAW)): "IP",
+    (int(socket.AF_INET6), int(socket.SOCK_RAW)): "IP",
+}
+
+# psutil hands out these same string objects as connection statuses, so
+# comparisons against them hit CPython's identity fast path
+_LISTEN = psutil.CONN_LISTEN
+_ESTABLISHED = psutil.CONN_ESTABLISHED
+
+# Connection table columns as (header, style)
+_TABLE_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("Proto", "cyan"),
+    ("Local Address", "green"),
+    ("Foreign Address", "yellow"),
+    ("Status", "blue"),
+)
+_TABLE_COLUMNS_PROC = _TABLE_COLUMNS + (("PID/Program", "magenta"),)
+
+# Upper bound on concurrent reverse DNS lookups
+_RESOLVER_WORKERS = 16
+
+# Seconds to wait for a batch of reverse lookups before showing bare IPs
+_RESOLVE_TIMEOUT = 0.5
+
+class _DaemonExecutor:
+    """Minimal thread pool whose workers never delay interpreter exit.
+    
+    ThreadPoolExecutor joins its workers at exit, so a getnameinfo() call
+    hung on a dead resolver would hold the process open long after its
+    deadline. These workers are daemon threads and are simply dropped.
+    """
+    
+    def __init__(self, max_workers: int, thread_name_prefix: str) -> None:
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._work_queue: "queue.SimpleQueue[Tuple[Future, Callable[..., Any], tuple]]" = queue.SimpleQueue()
+        self._workers = 0
+        self._lock = threading.Lock()
+    
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Schedule fn(*args) and return a Future for its result."""
+        future: Future = Future()
+        self._work_queue.put((future, fn, args))
+        with self._lock:
+            if self._workers < self._max_workers:
+                self._workers += 1
+                threading.Thread(
+                    target=self._work,
+                    name=f"{self._thread_name_prefix}_{self._workers}",
+                    daemon=True
+                ).start()
+        return future
+    
+    def _work(self) -> None:
+        while True:
+            future, fn, args = self._work_queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+# Completed reverse lookups (hostname or None), oldest first
+_HOSTNAME_CACHE_SIZE = 1024
+_hostname_cache: Dict[str, Optional[str]] = {}
+
+# Lookups still running, so later calls wait on them instead of resubmitting
+_pending_lookups: Dict[str, Future] = {}
+_lookups_lock = threading.Lock()
+
+# Runs the blocking resolver calls so a hung lookup can be abandoned
+_resolver = _DaemonExecutor(max_workers=_RESOLVER_WORKERS, thread_name_prefix="ports-resolver")
+
+def _lookup_hostname(ip: str) -> Optional[str]:
+    """Reverse-resolve an IP address using the system resolver.
+    
+    Args:
+        ip: IP address to resolve.
+        
+    Returns:
+        Hostname, or None if the address could not be resolved.
+    """
+    try:
+        hostname = socket.getnameinfo((ip, 0), 0)[0]
+    except (socket.gaierror, socket.herror, socket.timeout):
+        return None
+    return hostname if hostname != ip else None
+
+def _store_hostname(ip: str, future: Future) -> None:
+    """Move a finished lookup from the pending table into the hostname cache."""
+    with _lookups_lock:
+        _pending_lookups.pop(ip, None)
+        _hostname_cache[ip] = None if future.exception() else future.result()
+        
+        # Drop the oldest entries once the cache is full
+        while len(_hostname_cache) > _HOSTNAME_CACHE_SIZE:
+            del _hostname_cache[next(iter(_hostname_cache))]
+
+def _resolve_ips(ips: Iterable[str], timeout: float = _RESOLVE_TIMEOUT) -> Dict[str, Optional[str]]:
+    """Reverse-resolve addresses concurrently within a single deadline.
+    
+    Every uncached address is submitted to the resolver pool at once, or
+    joins a lookup already running for it, and all of them share one
+    deadline. Finished lookups, including ones that found no hostname, are
+    cached for the lifetime of the process; lookups that miss the deadline
+    keep running and are cached once they finish.
+    
+    Args:
+        ips: IP addresses to resolve.
+        timeout: Seconds to wait for all lookups together.
+        
+    Returns:
+        Hostname for every address, or None if it could not be resolved
+        before the deadline.
+    """
+    hostnames: Dict[str, Optional[str]] = {}
+    pending: Dict[str, Future] = {}
+    submitted: Dict[str, Future] = {}
+    with _lookups_lock:
+        for ip in set(ips):
+            if ip in _hostname_cache:
+                hostnames[ip] = _hostname_cache[ip]
+            elif ip in _pending_lookups:
+                pending[ip] = _pending_lookups[ip]
+            else:
+                pending[ip] = submitted[ip] = _pending_lookups[ip] = _resolver.submit(_lookup_hostname, ip)
+    
+    # Registered outside the lock: a lookup that already finished runs its
+    # callback right away
+    for ip, future in submitted.items():
+        future.add_done_callback(partial(_store_hostname, ip))
+    
+    if pending:
+        wait(pending.values(), timeout=timeout)
+        for ip, future in pending.items():
+            # Addresses that missed the deadline stay unresolved for this call
+            hostnames[ip] = future.result() if future.done() and not future.exception() else None
+    
+    return hostnames
+
+def _format_ip(ip: str, hostnames: Optional[Dict[str, Optional[str]]], is_v6: bool) -> str:
+    """Format an IP address for display, optionally with its hostname.
+    
+    Args:
+        ip: IP address.
+        hostnames: Hostnames resolved up front, or None to show bare IPs.
+        is_v6: Whether the address is IPv6 and needs brackets.
+        
+    Returns:
+        Formatted address string.
+    """
+    display_ip = f"[{ip}]" if is_v6 else ip
+    
+    # Only prefetched hostnames are used; nothing is resolved per row
+    hostname = hostnames.get(ip) if hostnames else None
+    if hostname:  # Only use if we got a real hostname
+        return f"{hostname} ({display_ip})"
+    
+    return display_ip
 
 class PortsCommand(BaseCommand):
     """List network connections and open ports."""
@@ -23,6 +356,7 @@ class PortsCommand(BaseCommand):
                listening_only: bool = True,
                resolve: bool = False,
                process_info: bool = False,
+               show_cmdline: bool = False,
                *args, **kwargs) -> CommandResult:
         """Execute the ports command.
         
@@ -30,13 +364,15 @@ class PortsCommand(BaseCommand):
             listening_only: Only show listening ports.
             resolve: Resolve IP addresses to hostnames.
             process_info: Show process information.
+            show_cmdline: Include the process command line with process information.
             
         Returns:
             CommandResult: Contains network connection information.
         """
         try:
-            # Get network connections
-            connections = self._get_connections(listening_only, resolve, process_info)
+            # Get network connections; materialized once since they are both
+            # displayed and returned to the caller
+            connections = list(self._get_connections(listening_only, resolve, process_info, show_cmdline))
             
             # Display connections
             self._display_connections(connections, process_info)
@@ -48,66 +384,108 @@ class PortsCommand(BaseCommand):
             self.console.print(f"[red]Error:[/red] {error_msg}")
             return CommandResult(success=False, error=error_msg)
     
-    def _get_connections(self, listening_only: bool, resolve: bool, process_info: bool) -> List[Dict[str, Any]]:
-        """Get network connections with optional filtering and resolution.
+    def _get_connections(self, listening_only: bool, resolve: bool, process_info: bool,
+                         show_cmdline: bool = False) -> Iterator[Dict[str, Any]]:
+        """Yield network connections with optional filtering and resolution.
         
         Args:
             listening_only: Only include listening connections.
             resolve: Resolve IP addresses to hostnames.
             process_info: Include process information.
+            show_cmdline: Include the process command line (an extra /proc read per pid).
             
-        Returns:
-            List of connection dictionaries.
+        Yields:
+            Connection dictionaries.
         """
-        connections = []
+        # Process details keyed by pid, so sockets sharing a process only hit /proc once
+        proc_cache: Dict[int, Dict[str, Any]] = {}
+        
+        # UDP sockets never enter the LISTEN state, so skip them when only
+        # listening sockets are wanted
+        kind = 'tcp' if listening_only else 'inet'
+        net_connections = psutil.net_connections(kind=kind)
+        
+        # Resolve every address concurrently under one deadline; the loop
+        # below only reads the results and never waits on DNS
+        hostnames = self._prefetch_hostnames(net_connections, listening_only) if resolve else None
         
         # Get all connections
-        for conn in psutil.net_connections(kind='inet'):
+        for conn in net_connections:
             try:
                 # Skip if listening_only is True and connection is not listening
-                if listening_only and conn.status != 'LISTEN':
+                if listening_only and conn.status != _LISTEN:
                     continue
                 
                 # Skip connections without local address
-                if not hasattr(conn, 'laddr') or not conn.laddr:
+                if not conn.laddr:
                     continue
                 
+                is_v6 = conn.family == socket.AF_INET6
+                local_address = self._format_address(conn.laddr, hostnames, is_v6)
                 connection = {
                     "protocol": self._get_protocol(conn.family, conn.type),
-                    "local_address": self._format_address(conn.laddr, resolve),
+                    "local_address": local_address,
                     "local_port": conn.laddr.port,
+                    "local_endpoint": f"{local_address}:{conn.laddr.port}",
                     "status": conn.status
                 }
                 
                 # Add remote address if available
-                if hasattr(conn, 'raddr') and conn.raddr:
+                if conn.raddr:
+                    remote_address = self._format_address(conn.raddr, hostnames, is_v6)
                     connection.update({
-                        "remote_address": self._format_address(conn.raddr, resolve),
-                        "remote_port": conn.raddr.port
+                        "remote_address": remote_address,
+                        "remote_port": conn.raddr.port,
+                        "remote_endpoint": f"{remote_address}:{conn.raddr.port}"
                     })
                 
                 # Add process info if requested and available
-                if process_info and hasattr(conn, 'pid') and conn.pid:
-                    try:
-                        proc = psutil.Process(conn.pid)
-                        with proc.oneshot():
-                            connection.update({
-                                "pid": conn.pid,
-                                "process_name": proc.name(),
-                                "process_cmdline": " ".join(proc.cmdline()),
-                                "process_username": proc.username(),
-                                "process_status": proc.status()
-                            })
-                    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                        connection["pid"] = conn.pid
-                        connection["process_info"] = "[not found]"
+                if process_info and conn.pid:
+                    info = proc_cache.get(conn.pid)
+                    if info is None:
+                        try:
+                            proc = psutil.Process(conn.pid)
+                            with proc.oneshot():
+                                info = {
+                                    "process_name": proc.name(),
+                                    "process_username": proc.username(),
+                                    "process_status": proc.status()
+                                }
+                                if show_cmdline:
+                                    info["process_cmdline"] = " ".join(proc.cmdline())
+                        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                            info = {"process_info": "[not found]"}
+                        proc_cache[conn.pid] = info
+                    
+                    connection["pid"] = conn.pid
+                    connection.update(info)
                 
-                connections.append(connection)
+                yield connection
                 
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 continue
+    
+    def _prefetch_hostnames(self, net_connections: Iterable[Any], listening_only: bool) -> Dict[str, Optional[str]]:
+        """Resolve the unique addresses of the given connections in parallel.
+        
+        Args:
+            net_connections: Connections as returned by psutil.net_connections().
+            listening_only: Only consider listening connections.
+            
+        Returns:
+            Hostname for every address, or None if it was not resolved in time.
+        """
+        ips = set()
+        for conn in net_connections:
+            if listening_only and conn.status != _LISTEN:
+                continue
+            if conn.laddr and conn.laddr.ip:
+                ips.add(conn.laddr.ip)
+            if conn.raddr and conn.raddr.ip:
+                ips.add(conn.raddr.ip)
         
-        return connections
+        # Addresses that miss the deadline map to None for the rest of the call
+        return _resolve_ips(ips)
     
     def _get_protocol(self, family: int, type_: int) -> str:
         """Get protocol name from socket family and type.
@@ -119,13 +497,9 @@ class PortsCommand(BaseCommand):
         Returns:
             Protocol name as string.
         """
-        if family == socket.AF_INET or family == socket.AF_INET6:
-            if type_ == socket.SOCK_STREAM:
-                return "TCP"
-            elif type_ == socket.SOCK_DGRAM:
-                return "UDP"
-            elif type_ == socket.SOCK_RAW:
-                return "IP"
+        protocol = _PROTOCOLS.get((family, type_))
+        if protocol is not None:
+            return protocol
         
         # Fallback to string representation
         try:
@@ -133,12 +507,14 @@ class PortsCommand(BaseCommand):
         except (ValueError, AttributeError):
             return f"Unknown ({family}/{type_})"
     
-    def _format_address(self, addr: Any, resolve: bool = False) -> str:
+    def _format_address(self, addr: Any, hostnames: Optional[Dict[str, Optional[str]]] = None,
+                        is_v6: bool = False) -> str:
         """Format a network address.
         
         Args:
             addr: Address object with ip and port attributes.
-            resolve: Whether to resolve IP to hostname.
+            hostnames: Hostnames resolved up front, or None to show bare IPs.
+            is_v6: Whether the address belongs to an IPv6 socket.
             
         Returns:
             Formatted address string.
@@ -146,22 +522,7 @@ class PortsCommand(BaseCommand):
         if not hasattr(addr, 'ip') or not addr.ip:
             return ""
         
-        ip = addr.ip
-        
-        # Handle IPv6 addresses
-        if ':' in ip and not ip.startswith('['):
-            ip = f"[{ip}]"
-        
-        # Resolve IP to hostname if requested
-        if resolve:
-            try:
-                hostname = socket.getnameinfo((addr.ip, 0), 0)[0]
-                if hostname != addr.ip:  # Only use if we got a real hostname
-                    return f"{hostname} ({ip})"
-            except (socket.gaierror, socket.herror, socket.timeout):
-                pass
-        
-        return ip
+        return _format_ip(addr.ip, hostnames, is_v6)
     
     def _display_connections(self, connections: List[Dict[str, Any]], show_process_info: bool = False) -> None:
         """Display network connections in a table.
@@ -183,244 +544,71 @@ class PortsCommand(BaseCommand):
         )
         
         # Add columns
-        table.add_column("Proto", style="cyan")
-        table.add_column("Local Address", style="green")
-        table.add_column("Foreign Address", style="yellow")
-        table.add_column("Status", style="blue")
+        for name, style in (_TABLE_COLUMNS_PROC if show_process_info else _TABLE_COLUMNS):
+            table.add_column(name, style=style)
         
-        if show_process_info:
-            table.add_column("PID/Program", style="magenta")
-        
-        # Add rows
+        # Add rows, gathering the summary counts and local ports in the same pass
+        listening = 0
+        established = 0
+        ports_seen = set()
         for conn in connections:
-            # Format local address
-            local_addr = f"{conn['local_address']}:{conn['local_port']}"
-            
-            # Format remote address if available
-            remote_addr = ""
-            if 'remote_address' in conn and 'remote_port' in conn:
-                remote_addr = f"{conn['remote_address']}:{conn['remote_port']}"
+            # Unpack once; endpoints are pre-joined when the connection is collected
+            protocol = conn['protocol']
+            local_port = conn.get('local_port')
+            local_addr = conn['local_endpoint']
+            remote_addr = conn.get('remote_endpoint', '')
             
-            # Format status
-            status = conn.get('status', '').upper()
-            
-            # Format process info if available
-            process_info = ""
-            if show_process_info:
-                if 'process_name' in conn:
-                    process_info = f"{conn.get('pid', '')}/{conn['process_name']}"
-                elif 'pid' in conn:
-                    process_info = str(conn['pid'])
+            # psutil already reports statuses in upper case
+            status = conn.get('status') or ''
+            if status == _LISTEN:
+                listening += 1
+            elif status == _ESTABLISHED:
+                established += 1
             
-            # Add row to table
-            row = [
-                conn['protocol'],
-                local_addr,
-                remote_addr,
-                status
-            ]
+            if local_port:
+                ports_seen.add(local_port)
             
+            # Add row to table, with process info if available
             if show_process_info:
-                row.append(process_info)
-            
-            table.add_row(*row)
+                pid = conn.get('pid')
+                process_name = conn.get('process_name')
+                process_info = ""
+                if process_name is not None:
+                    process_info = f"{pid if pid is not None else ''}/{process_name}"
+                elif pid is not None:
+                    process_info = str(pid)
+                table.add_row(protocol, local_addr, remote_addr, status, process_info)
+            else:
+                table.add_row(protocol, local_addr, remote_addr, status)
         
         # Display table
         self.console.print(table)
         
         # Show summary
         total = len(connections)
-        listening = sum(1 for c in connections if c.get('status') == 'LISTEN')
-        established = sum(1 for c in connections if c.get('status') == 'ESTABLISHED')
         
         self.console.print(f"[dim]Total: {total} connections ({listening} listening, {established} established)[/dim]")
         
         # Show common ports information
-        self._display_common_ports(connections)
+        self._display_common_ports(ports_seen)
     
-    def _display_common_ports(self, connections: List[Dict[str, Any]]) -> None:
+    def _display_common_ports(self, ports_seen: Set[int]) -> None:
         """Display information about common ports.
         
         Args:
-            connections: List of connection dictionaries.
+            ports_seen: Local ports used by the listed connections.
         """
-        # Common ports and their services
-        common_ports = {
-            20: "FTP (Data)",
-            21: "FTP (Control)",
-            22: "SSH",
-            23: "Telnet",
-            25: "SMTP",
-            53: "DNS",
-            67: "DHCP Server",
-            68: "DHCP Client",
-            69: "TFTP",
-            80: "HTTP",
-            88: "Kerberos",
-            110: "POP3",
-            111: "RPC",
-            119: "NNTP",
-            123: "NTP",
-            135: "MS RPC",
-            137: "NetBIOS Name",
-            138: "NetBIOS Datagram",
-            139: "NetBIOS Session",
-            143: "IMAP",
-            161: "SNMP",
-            162: "SNMP Trap",
-            179: "BGP",
-            194: "IRC",
-            389: "LDAP",
-            443: "HTTPS",
-            445: "SMB",
-            465: "SMTPS",
-            514: "Syslog",
-            515: "LPD",
-            587: "SMTP (Submission)",
-            631: "IPP (Printing)",
-            636: "LDAPS",
-            873: "rsync",
-            902: "VMware Server",
-            989: "FTPS (Data)",
-            990: "FTPS (Control)",
-            993: "IMAPS",
-            995: "POP3S",
-            1080: "SOCKS Proxy",
-            1194: "OpenVPN",
-            1433: "MS SQL Server",
-            1521: "Oracle DB",
-            1723: "PPTP",
-            2049: "NFS",
-            2082: "cPanel",
-            2083: "cPanel SSL",
-            2086: "WHM",
-            2087: "WHM SSL",
-            2095: "Webmail",
-            2096: "Webmail SSL",
-            2181: "ZooKeeper",
-            2375: "Docker",
-            2376: "Docker TLS",
-            2377: "Docker Swarm",
-            2380: "etcd",
-            2483: "Oracle DB SSL",
-            2484: "Oracle DB",
-            3000: "Node.js",
-            3128: "Squid",
-            3268: "Microsoft Global Catalog",
-            3269: "Microsoft Global Catalog SSL",
-            3306: "MySQL",
-            3389: "RDP",
-            3690: "Subversion",
-            4369: "Erlang Port Mapper",
-            5000: "UPnP",
-            5001: "Synology",
-            5432: "PostgreSQL",
-            5500: "VNC Server",
-            5601: "Kibana",
-            5672: "RabbitMQ",
-            5900: "VNC",
-            5938: "TeamViewer",
-            5984: "CouchDB",
-            6000: "X11",
-            6379: "Redis",
-            6443: "Kubernetes API Server",
-            6666: "IRC",
-            7001: "WebLogic",
-            7002: "WebLogic SSL",
-            7077: "Spark",
-            7199: "Cassandra",
-            7474: "Neo4j",
-            7687: "Neo4j Bolt",
-            8000: "HTTP Alt",
-            8005: "Tomcat Shutdown",
-            8008: "HTTP Alt",
-            8009: "AJP",
-            8020: "HDFS",
-            8042: "Hadoop NodeManager",
-            8080: "HTTP Proxy",
-            8081: "HTTP Proxy Alt",
-            8088: "Hadoop ResourceManager",
-            8089: "Splunk",
-            8090: "Atlassian",
-            8091: "Couchbase",
-            8092: "Couchbase SSL",
-            8096: "Plex",
-            8140: "Puppet",
-            8200: "GoCD",
-            8222: "VMware Authd",
-            8243: "HTTPS Alt",
-            8333: "Bitcoin",
-            8400: "Commvault",
-            8443: "HTTPS Alt",
-            8500: "Consul",
-            8530: "WSUS",
-            8531: "WSUS SSL",
-            8761: "Eureka",
-            8888: "Jupyter",
-            8983: "Solr",
-            9000: "SonarQube",
-            9001: "Tor",
-            9042: "Cassandra Native",
-            9060: "WebLogic Console",
-            9080: "WebSphere",
-            9090: "Prometheus",
-            9092: "Kafka",
-            9100: "Node Exporter",
-            9160: "Cassandra Thrift",
-            9200: "Elasticsearch",
-            9300: "Elasticsearch Transport",
-            9411: "Git",
-            9443: "VMware vSphere",
-            9999: "JIRA",
-            10000: "Webmin",
-            10050: "Zabbix Agent",
-            10051: "Zabbix Server",
-            10250: "Kubelet",
-            10255: "Kubelet Read-Only",
-            10256: "Kube Proxy",
-            11211: "Memcached",
-            12017: "MongoDB",
-            12201: "Splunk",
-            12489: "NSClient++",
-            15672: "RabbitMQ Management",
-            16379: "Redis Sentinel",
-            16509: "Kubernetes API",
-            18080: "Jenkins",
-            20000: "Docker Swarm",
-            20720: "Symantec AV",
-            24800: "Synergy",
-            25565: "Minecraft",
-            27017: "MongoDB",
-            27018: "MongoDB SSL",
-            27019: "MongoDB Shard",
-            28015: "RethinkDB",
-            28017: "MongoDB Web",
-            30000: "Kubernetes NodePort",
-            31337: "Back Orifice",
-            32768: "RPC",
-            37777: "Dahua CCTV",
-            50000: "SAP",
-            50070: "Hadoop NameNode",
-            50075: "Hadoop DataNode",
-            50090: "Hadoop SecondaryNameNode",
-            54328: "PostgreSQL",
-            60010: "HBase Master"
-        }
-        
         # Find common ports in use
-        common_in_use = {}
-        for conn in connections:
-            port = conn.get('local_port')
-            if port and port in common_ports and port not in common_in_use:
-                common_in_use[port] = common_ports[port]
+        common_in_use = {port: _COMMON_PORTS[port] for port in sorted(ports_seen & _COMMON_PORTS.keys())}
         
         # Display common ports if any
         if common_in_use:
             self.console.print("\n[bold]Common Ports in Use:[/bold]")
-            for port, service in sorted(common_in_use.items()):
+            for port, service in common_in_use.items():
                 self.console.print(f"  [cyan]{port:>5}[/cyan] - {service}")
 
-def execute(listening_only: bool = True, resolve: bool = False, process_info: bool = False, *args, **kwargs) -> CommandResult:
+def execute(listening_only: bool = True, resolve: bool = False, process_info: bool = False,
+            show_cmdline: bool = False, *args, **kwargs) -> CommandResult:
     """Execute the ports command.
     
     This is the entry point for the ports command.
@@ -429,6 +617,7 @@ def execute(listening_only: bool = True, resolve: bool = False, process_info: bo
         listening_only: Only show listening ports.
         resolve: Resolve IP addresses to hostnames.
         process_info: Show process information.
+        show_cmdline: Include the process command line with process information.
         
     Returns:
         CommandResult: The result of the command execution.
@@ -437,6 +626,7 @@ def execute(listening_only: bool = True, resolve: bool = False, process_info: bo
         listening_only=listening_only,
         resolve=resolve,
         process_info=process_info,
+        show_cmdline=show_cmdline,
         *args,
         **kwargs
     )
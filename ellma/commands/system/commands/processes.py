@@ -4,19 +4,56 @@ Process management command.
 This module provides the `processes` command which lists and manages running processes.
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, repeat
+from operator import itemgetter
 import os
 import psutil
 import signal
-from datetime import datetime
+import time
 
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress
 
-from ..commands import BaseCommand, CommandResult
-from ...core import get_process_info
+from ..commands import BaseCommand, CommandResult, _format_bytes
+from ..core import get_process_info
+
+# Upper bound on threads used to collect per-process details
+_DETAIL_WORKERS = 32
+
+# Extra fields only read for detailed output (num_fds only exists on POSIX)
+_DETAIL_ATTRS = ['exe', 'cwd', 'num_threads']
+if hasattr(psutil.Process, 'num_fds'):
+    _DETAIL_ATTRS.append('num_fds')
+
+# Colors used for the process status column
+STATUS_COLORS = {
+    "running": "green",
+    "sleeping": "blue",
+    "idle": "cyan",
+    "zombie": "red",
+    "stopped": "yellow",
+    "tracing stop": "yellow",
+    "dead": "red",
+}
+
+# Line format for each process in the tree view
+_TREE_FMT = "{prefix}├─ {pid} {cpu:5.1f}% {mem:5.1f}% {cmd}"
+
+# Sort keys for process summaries; every field is filled in by _get_process_list
+_SORT_KEYS = {
+    "cpu": itemgetter("cpu_percent"),
+    "memory": itemgetter("memory_percent"),
+    "pid": itemgetter("pid"),
+    "name": lambda p: p["name"].lower(),
+    "user": lambda p: p["username"].lower(),
+    "time": itemgetter("runtime"),
+    "status": lambda p: p["status"].lower(),
+}
 
 class ProcessesCommand(BaseCommand):
     """List and manage running processes."""
@@ -31,7 +68,7 @@ class ProcessesCommand(BaseCommand):
         
         Args:
             sort_by: Field to sort by (cpu, memory, pid, name, user, time).
-            limit: Maximum number of processes to display.
+            limit: Maximum number of processes to display (ignored with tree).
             tree: Display process tree instead of flat list.
             full: Show full command line arguments.
             
@@ -43,12 +80,15 @@ class ProcessesCommand(BaseCommand):
             process_data = get_process_info(detailed=True)
             processes = self._get_process_list(process_data)
             
-            # Sort processes
-            processes = self._sort_processes(processes, sort_by)
+            # The tree orders processes itself and needs every parent present,
+            # so only the flat list is sorted and limited
+            if not tree:
+                processes = self._sort_processes(processes, sort_by)
+                if limit > 0:
+                    processes = processes[:limit]
             
-            # Limit number of processes
-            if limit > 0:
-                processes = processes[:limit]
+            # Only the processes that made the cut pay for the full details
+            processes = self._get_process_details_list(processes, detailed=full)
             
             # Display processes
             if tree:
@@ -64,122 +104,165 @@ class ProcessesCommand(BaseCommand):
             return CommandResult(success=False, error=error_msg)
     
     def _get_process_list(self, process_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Convert process data to a list of process dictionaries.
+        """Convert process data to a list of lightweight process summaries.
+        
+        Only fields already gathered by get_process_info are used, which is
+        enough to sort and limit the list before any further /proc reads.
         
         Args:
             process_data: Raw process data from get_process_info.
             
         Returns:
-            List of process dictionaries with detailed information.
+            List of process summary dictionaries.
         """
         processes = []
+        now = time.time()
         
-        # Get top CPU and memory processes
-        top_processes = set()
-        for proc in process_data.get("top_cpu", []) + process_data.get("top_memory", []):
-            try:
-                pid = proc.get("pid")
-                if pid and pid not in top_processes:
-                    top_processes.add(pid)
-                    processes.append(self._get_process_details(pid))
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                continue
+        # Get top CPU and memory processes, deduplicated by PID
+        top_processes = {
+            proc["pid"]: proc
+            for proc in chain(process_data.get("top_cpu", []), process_data.get("top_memory", []))
+            if proc.get("pid")
+        }
+        for proc in top_processes.values():
+            create_time = proc.get("create_time")
+            summary = dict(proc)
+            summary.update({
+                "name": proc.get("name") or "",
+                "username": proc.get("username") or "",
+                "status": proc.get("status") or "",
+                "cpu_percent": proc.get("cpu_percent") or 0.0,
+                "memory_percent": proc.get("memory_percent") or 0.0,
+                "runtime": now - create_time if create_time else 0.0
+            })
+            processes.append(summary)
         
         return processes
     
-    def _get_process_details(self, pid: int) -> Dict[str, Any]:
+    def _get_process_details_list(self, processes: List[Dict[str, Any]], detailed: bool = False) -> List[Dict[str, Any]]:
+        """Build full details for the given processes, keeping their order.
+        
+        Args:
+            processes: Process summaries, already sorted and limited.
+            detailed: Also collect executable, cwd, thread/fd counts and connections.
+            
+        Returns:
+            List of process dictionaries with detailed information.
+        """
+        if not processes:
+            return []
+        
+        # Without --full everything is already in the summaries
+        if not detailed:
+            return [self._get_process_details(proc) for proc in processes]
+        
+        # Read the system-wide connection tables once instead of per process
+        conns_by_pid = self._get_connections_by_pid()
+        if conns_by_pid is not None:
+            connections = [conns_by_pid.get(proc["pid"], []) for proc in processes]
+        else:
+            connections = repeat(None)
+        
+        # Fetch the extra fields concurrently; each process costs several /proc reads
+        with ThreadPoolExecutor(max_workers=min(_DETAIL_WORKERS, len(processes))) as executor:
+            return list(executor.map(self._get_process_details, processes, repeat(detailed), connections))
+    
+    def _get_connections_by_pid(self) -> Optional[Dict[int, List[Any]]]:
+        """Get all inet connections grouped by owning process.
+        
+        Returns:
+            Dictionary mapping PIDs to their connections, or None if the
+            system-wide list is not accessible (e.g. on macOS without root).
+        """
+        try:
+            connections = psutil.net_connections(kind='inet')
+        except psutil.AccessDenied:
+            return None
+        
+        conns_by_pid = defaultdict(list)
+        for conn in connections:
+            if conn.pid is not None:
+                conns_by_pid[conn.pid].append(conn)
+        return conns_by_pid
+    
+    def _get_process_details(self, info: Dict[str, Any], detailed: bool = False,
+                             connections: Optional[List[Any]] = None) -> Dict[str, Any]:
         """Get detailed information about a process.
         
         Args:
-            pid: Process ID.
+            info: Process summary built from get_process_info data.
+            detailed: Also collect executable, cwd, thread/fd counts and connections.
+            connections: The process' connections if already known; they are
+                read from the process itself otherwise.
             
         Returns:
             Dictionary with process details.
         """
-        try:
-            proc = psutil.Process(pid)
+        pid = info["pid"]
+        memory_info = info.get("memory_info")
+        create_time = info.get("create_time") or 0.0
+        
+        # Format runtime
+        hours, remainder = divmod(int(info["runtime"]), 3600)
+        minutes, seconds = divmod(remainder, 60)
+        runtime_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        
+        cmdline = info.get("cmdline")
+        
+        details = {
+            "pid": pid,
+            "ppid": info.get("ppid"),
+            "name": info["name"],
+            "username": info["username"] or "N/A",
+            "status": info["status"] or "unknown",
+            "cpu_percent": info["cpu_percent"],
+            "memory_rss": memory_info.rss if memory_info else 0,
+            "memory_vms": memory_info.vms if memory_info else 0,
+            "memory_percent": info["memory_percent"],
+            "create_time": create_time,
+            "runtime": info["runtime"],
+            "runtime_str": runtime_str,
+            "cmdline": " ".join(cmdline) if cmdline is not None else "[Access Denied]"
+        }
+        
+        if detailed:
+            try:
+                proc = psutil.Process(pid)
+                
+                # Read the remaining fields in one oneshot() pass; fields we
+                # may not access come back as None instead of raising
+                extra = proc.as_dict(attrs=_DETAIL_ATTRS)
+            except psutil.NoSuchProcess:
+                return {
+                    "pid": pid,
+                    "error": "No such process"
+                }
             
-            # Get process info with error handling
-            with proc.oneshot():
-                try:
-                    cpu_percent = proc.cpu_percent()
-                    memory_info = proc.memory_info()
-                    memory_percent = proc.memory_percent()
-                    create_time = proc.create_time()
-                    
-                    # Calculate runtime
-                    runtime = datetime.now().timestamp() - create_time
-                    hours, remainder = divmod(int(runtime), 3600)
-                    minutes, seconds = divmod(remainder, 60)
-                    runtime_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                    
-                    # Get command line with error handling
-                    try:
-                        cmdline = " ".join(proc.cmdline())
-                    except (psutil.AccessDenied, psutil.ZombieProcess):
-                        cmdline = "[Access Denied]"
-                    
-                    # Get username with error handling
-                    try:
-                        username = proc.username()
-                    except (psutil.AccessDenied, KeyError):
-                        username = "N/A"
-                    
-                    # Get parent PID with error handling
-                    try:
-                        ppid = proc.ppid()
-                    except (psutil.AccessDenied, psutil.ZombieProcess):
-                        ppid = None
-                    
-                    # Get status with error handling
-                    try:
-                        status = proc.status()
-                    except (psutil.AccessDenied, psutil.ZombieProcess):
-                        status = "unknown"
-                    
-                    return {
-                        "pid": pid,
-                        "ppid": ppid,
-                        "name": proc.name(),
-                        "username": username,
-                        "status": status,
-                        "cpu_percent": cpu_percent,
-                        "memory_rss": memory_info.rss,
-                        "memory_vms": memory_info.vms,
-                        "memory_percent": memory_percent,
-                        "create_time": create_time,
-                        "runtime": runtime,
-                        "runtime_str": runtime_str,
-                        "cmdline": cmdline,
-                        "exe": proc.exe(),
-                        "cwd": proc.cwd(),
-                        "num_threads": proc.num_threads(),
-                        "num_fds": proc.num_fds() if hasattr(proc, 'num_fds') else 0,
-                        "connections": self._get_process_connections(pid)
-                    }
-                except (psutil.AccessDenied, psutil.ZombieProcess) as e:
-                    return {
-                        "pid": pid,
-                        "error": str(e)
-                    }
-        except psutil.NoSuchProcess:
-            return {
-                "pid": pid,
-                "error": "No such process"
-            }
+            details.update({
+                "exe": extra["exe"],
+                "cwd": extra["cwd"],
+                "num_threads": extra["num_threads"],
+                "num_fds": extra.get("num_fds") or 0,
+                "connections": self._get_process_connections(proc, connections)
+            })
+        
+        return details
     
-    def _get_process_connections(self, pid: int) -> List[Dict[str, Any]]:
+    def _get_process_connections(self, proc: psutil.Process,
+                                 connections: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
         """Get network connections for a process.
         
         Args:
-            pid: Process ID.
+            proc: Process to inspect.
+            connections: Already collected connections to format instead of
+                reading them from the process.
             
         Returns:
             List of connection dictionaries.
         """
         try:
-            proc = psutil.Process(pid)
-            connections = proc.connections()
+            if connections is None:
+                connections = proc.connections()
             
             result = []
             for conn in connections:
@@ -210,19 +293,8 @@ class ProcessesCommand(BaseCommand):
         sort_key = sort_by.lower()
         reverse = True  # Default to descending order for most fields
         
-        # Define sort key functions
-        sort_funcs = {
-            "cpu": lambda p: p.get("cpu_percent", 0),
-            "memory": lambda p: p.get("memory_percent", 0),
-            "pid": lambda p: p.get("pid", 0),
-            "name": lambda p: p.get("name", "").lower(),
-            "user": lambda p: p.get("username", "").lower(),
-            "time": lambda p: p.get("runtime", 0),
-            "status": lambda p: p.get("status", "").lower(),
-        }
-        
         # Get the appropriate sort function
-        sort_func = sort_funcs.get(sort_key, sort_funcs["cpu"])
+        sort_func = _SORT_KEYS.get(sort_key, _SORT_KEYS["cpu"])
         
         # Special case for name and user (ascending)
         if sort_key in ["name", "user"]:
@@ -260,29 +332,37 @@ class ProcessesCommand(BaseCommand):
         table.add_column("Command")
         
         # Add rows
+        for row in self._iter_process_rows(processes, full):
+            table.add_row(*row)
+        
+        self.console.print(table)
+        self.console.print(f"[dim]Showing {len(processes)} processes[/dim]")
+    
+    def _iter_process_rows(self, processes: List[Dict[str, Any]], full: bool = False) -> Iterator[Tuple[str, ...]]:
+        """Yield formatted table rows for the given processes.
+        
+        Args:
+            processes: List of process dictionaries.
+            full: Whether to show full command line.
+            
+        Yields:
+            Tuple of cell strings for each process that has no error.
+        """
         for proc in processes:
             if "error" in proc:
                 continue
                 
             # Format memory
-            rss = self._format_bytes(proc.get("memory_rss", 0))
+            rss = _format_bytes(proc.get("memory_rss", 0))
             
             # Get status with color
             status = proc.get("status", "unknown").lower()
-            status_color = {
-                "running": "green",
-                "sleeping": "blue",
-                "idle": "cyan",
-                "zombie": "red",
-                "stopped": "yellow",
-                "tracing stop": "yellow",
-                "dead": "red",
-            }.get(status, "white")
+            status_color = STATUS_COLORS.get(status, "white")
             
             # Get command (full or just name)
             cmd = proc["cmdline"] if full and proc.get("cmdline") else proc["name"]
             
-            table.add_row(
+            yield (
                 str(proc["pid"]),
                 proc.get("username", ""),
                 f"{proc.get('cpu_percent', 0):.1f}",
@@ -292,9 +372,6 @@ class ProcessesCommand(BaseCommand):
                 f"[{status_color}]{status.capitalize()}[/{status_color}]",
                 cmd[:100] + ("..." if len(cmd) > 100 else "")  # Truncate long commands
             )
-        
-        self.console.print(table)
-        self.console.print(f"[dim]Showing {len(processes)} processes[/dim]")
     
     def _display_process_tree(self, processes: List[Dict[str, Any]], full: bool = False) -> None:
         """Display processes in a tree structure.
@@ -309,71 +386,86 @@ class ProcessesCommand(BaseCommand):
         
         # Build process tree
         process_map = {p["pid"]: p for p in processes if "error" not in p}
-        children = {}
+        children = defaultdict(list)
+        roots = []
         
-        # Find all children
+        # Find children and root processes (parent not in our list) in one pass
         for pid, proc in process_map.items():
-            ppid = proc.get("ppid")
-            if ppid is not None:
-                if ppid not in children:
-                    children[ppid] = []
-                children[ppid].append(pid)
-        
-        # Find root processes (those with no parent in our list or parent doesn't exist)
-        roots = []
-        for pid in process_map:
-            proc = process_map[pid]
             ppid = proc.get("ppid")
             if ppid is None or ppid not in process_map:
                 roots.append(pid)
+            else:
+                children[ppid].append(pid)
         
         # If no roots found (unlikely), use all processes
         if not roots:
             roots = list(process_map.keys())
         
+        # Sort each child list once up front
+        for child_pids in children.values():
+            child_pids.sort()
+        
         # Display tree
         self.console.print("[bold]Process Tree:[/bold]")
-        for root in sorted(roots):
-            self._print_process_tree(root, process_map, children, "", full)
+        self._print_process_tree(sorted(roots), process_map, children, full)
     
-    def _print_process_tree(self, pid: int, 
+    def _print_process_tree(self, roots: List[int],
                           process_map: Dict[int, Dict], 
                           children: Dict[int, List[int]], 
-                          prefix: str,
                           full: bool) -> None:
-        """Recursively print process tree.
+        """Print the process tree depth-first.
+        
+        Uses an explicit stack rather than recursion so deep trees cannot
+        hit the interpreter's recursion limit.
         
         Args:
-            pid: Process ID.
+            roots: Root process IDs, in display order.
             process_map: Dictionary mapping PIDs to process info.
-            children: Dictionary mapping parent PIDs to child PIDs.
-            prefix: Prefix for indentation.
+            children: Dictionary mapping parent PIDs to sorted child PIDs.
             full: Whether to show full command line.
         """
-        if pid not in process_map:
-            return
-            
-        proc = process_map[pid]
+        # Stack of (pid, depth, connector); pushed in reverse so pops come
+        # out in order. prefix_parts holds the connectors of the current
+        # path, so each line's prefix is joined once instead of being
+        # rebuilt by concatenation at every level.
+        stack = [(root, 0, "") for root in reversed(roots)]
+        prefix_parts: List[str] = []
+        visited = set()
         
-        # Format process info
-        cpu = f"{proc.get('cpu_percent', 0):5.1f}%"
-        mem = f"{proc.get('memory_percent', 0):5.1f}%"
-        
-        # Get command (full or just name)
-        cmd = proc["cmdline"] if full and proc.get("cmdline") else proc["name"]
-        
-        # Print process info
-        self.console.print(
-            f"{prefix}├─ {pid} {cpu} {mem} {cmd}"
-        )
-        
-        # Print children
-        child_pids = children.get(pid, [])
-        for i, child_pid in enumerate(sorted(child_pids)):
-            is_last = i == len(child_pids) - 1
-            new_prefix = prefix + ("    " if is_last else "│   ")
-            child_prefix = prefix + ("    " if is_last else "│   ") + "└─ "
-            self._print_process_tree(child_pid, process_map, children, new_prefix, full)
+        while stack:
+            pid, depth, connector = stack.pop()
+            if pid not in process_map or pid in visited:
+                continue
+            visited.add(pid)
+            
+            # Trim the path back to this process' parent, then add its connector
+            del prefix_parts[max(depth - 1, 0):]
+            if depth:
+                prefix_parts.append(connector)
+            
+            proc = process_map[pid]
+            
+            # Get command (full or just name)
+            cmd = proc["cmdline"] if full and proc.get("cmdline") else proc["name"]
+            
+            # Print process info; the line is plain text, so skip markup parsing
+            self.console.print(
+                _TREE_FMT.format(
+                    prefix="".join(prefix_parts),
+                    pid=pid,
+                    cpu=proc.get("cpu_percent", 0),
+                    mem=proc.get("memory_percent", 0),
+                    cmd=cmd
+                ),
+                markup=False,
+                highlight=False
+            )
+            
+            # Queue children
+            child_pids = children.get(pid, [])
+            last = len(child_pids) - 1
+            for i in range(last, -1, -1):
+                stack.append((child_pids[i], depth + 1, "    " if i == last else "│   "))
 
 def execute(sort_by: str = "cpu", limit: int = 10, tree: bool = False, full: bool = False, *args, **kwargs) -> CommandResult:
     """Execute the processes command.
@@ -382,7 +474,7 @@ def execute(sort_by: str = "cpu", limit: int = 10, tree: bool = False, full: boo
     
     Args:
         sort_by: Field to sort by (cpu, memory, pid, name, user, time).
-        limit: Maximum number of processes to display.
+        limit: Maximum number of processes to display (ignored with tree).
         tree: Display process tree instead of flat list.
         full: Show full command line arguments.
         
@@ -1,15 +1,16 @@
-""
+"""
 System scan command.
 
 This module provides the `scan` command which performs a comprehensive system scan.
 """
 
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Mapping, Optional, Union
 from datetime import datetime, timedelta
+from types import MappingProxyType
+import asyncio
 import time
 import psutil
 import platform
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from rich.console import Console
 from rich.table import Table
@@ -17,28 +18,43 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ..commands import BaseCommand, CommandResult
-from ...core import (
-    get_platform_info,
-    get_hardware_info,
-    get_resource_usage,
-    get_network_info,
-    get_storage_info,
-    get_process_info,
-    get_services_info,
-    get_security_status,
+from ..core import (
+    SystemSnapshot,
+    gather_system_info,
+    get_collectors,
     get_load_average,
     get_uptime
 )
-from ...utils import calculate_health_score
+from ..utils import calculate_health_score
+
+# Shared read-only stand-in for missing sections of the scan results
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+def _get_section(scan_results: Dict[str, Any], *keys: str) -> Mapping[str, Any]:
+    """Look up a nested section of the scan results.
+    
+    Args:
+        scan_results: Dictionary containing the scan results.
+        *keys: Keys to follow, outermost first.
+        
+    Returns:
+        The nested mapping, or an empty mapping if any level is missing.
+    """
+    section = scan_results
+    for key in keys:
+        section = section.get(key) or _EMPTY
+    return section
 
 class ScanCommand(BaseCommand):
     """Perform a comprehensive system scan."""
     
-    def execute(self, quick: bool = False, *args, **kwargs) -> CommandResult:
+    def execute(self, quick: bool = False, detail: bool = False, *args, **kwargs) -> CommandResult:
         """Execute the scan command.
         
         Args:
             quick: If True, perform a quick scan with less detail.
+            detail: Show the detailed CPU/memory/storage/security panels.
+                Full scans always show them; quick scans only with this set.
             
         Returns:
             CommandResult: Contains the scan results.
@@ -46,51 +62,29 @@ class ScanCommand(BaseCommand):
         try:
             start_time = time.time()
             
+            # One snapshot shared by all collectors so readings they have in
+            # common (memory, swap, connections, I/O counters) are taken once
+            snapshot = SystemSnapshot()
+            
+            # Collectors to run; the heavier ones are skipped on a quick scan
+            collectors = get_collectors(snapshot, quick=quick)
+            
             with Progress(
                 SpinnerColumn(),
                 "* " + ("Quick " if quick else "Full ") + "System Scan in progress",
                 console=self.console,
                 transient=True
             ) as progress:
-                task = progress.add_task("Scanning...", total=7)  # Number of scan steps
-                
-                # Gather system information
-                scan_results = {}
-                
-                # Platform info
-                scan_results["platform"] = get_platform_info()
-                progress.update(task, advance=1, description="Gathering platform info...")
-                
-                # Hardware info
-                scan_results["hardware"] = get_hardware_info()
-                progress.update(task, advance=1, description="Gathering hardware info...")
-                
-                # Resource usage
-                scan_results["resources"] = get_resource_usage()
-                progress.update(task, advance=1, description="Checking resource usage...")
-                
-                # Network info
-                scan_results["network"] = get_network_info()
-                progress.update(task, advance=1, description="Checking network...")
-                
-                # Storage info
-                scan_results["storage"] = get_storage_info()
-                progress.update(task, advance=1, description="Checking storage...")
-                
-                # Process info (skip if quick scan)
-                if not quick:
-                    scan_results["processes"] = get_process_info(detailed=True)
-                progress.update(task, advance=1, description="Checking processes...")
-                
-                # Services info (skip if quick scan)
-                if not quick:
-                    scan_results["services"] = get_services_info()
-                progress.update(task, advance=1, description="Checking services...")
+                task = progress.add_task("Scanning...", total=len(collectors))
                 
-                # Security status (skip if quick scan)
-                if not quick:
-                    scan_results["security"] = get_security_status()
-                progress.update(task, advance=1, description="Checking security...")
+                # Gather system information concurrently; the collectors mostly
+                # wait on /proc reads and subprocesses, which release the GIL
+                scan_results = asyncio.run(gather_system_info(
+                    collectors=collectors,
+                    on_collected=lambda name: progress.update(
+                        task, advance=1, description=f"Gathered {name} info..."
+                    )
+                ))
                 
                 # Calculate health score
                 scan_results["health_score"] = calculate_health_score(scan_results)
@@ -100,7 +94,7 @@ class ScanCommand(BaseCommand):
                 scan_results["timestamp"] = datetime.now().isoformat()
                 
                 # Display the results
-                self._display_scan_summary(scan_results)
+                self._display_scan_summary(scan_results, detail=detail or not quick)
                 
                 return CommandResult(success=True, data=scan_results)
                 
@@ -109,11 +103,12 @@ class ScanCommand(BaseCommand):
             self.console.print(f"[red]Error:[/red] {error_msg}")
             return CommandResult(success=False, error=error_msg)
     
-    def _display_scan_summary(self, scan_results: Dict[str, Any]) -> None:
+    def _display_scan_summary(self, scan_results: Dict[str, Any], detail: bool = True) -> None:
         """Display a summary of the scan results.
         
         Args:
             scan_results: Dictionary containing the scan results.
+            detail: Also display the detailed information panels.
         """
         resources = scan_results.get("resources", {})
         health_score = scan_results.get("health_score", 0)
@@ -140,9 +135,9 @@ class ScanCommand(BaseCommand):
         table.add_row("Memory Usage", f"{memory_usage}%", memory_status)
 
         # Storage
-        storage = scan_results.get("storage", {}).get("disks", {})
+        storage = _get_section(scan_results, "storage", "disks")
         if "/" in storage:
-            disk_usage = storage["\"/\""]["percent"]
+            disk_usage = storage["/"]["percent"]
             disk_status = "🟢" if disk_usage < 80 else "🟡" if disk_usage < 95 else "🔴"
             table.add_row("Root Disk Usage", f"{disk_usage:.1f}%", disk_status)
 
@@ -167,7 +162,8 @@ class ScanCommand(BaseCommand):
         self.console.print(table)
         
         # Add detailed sections
-        self._display_detailed_info(scan_results)
+        if detail:
+            self._display_detailed_info(scan_results)
     
     def _display_detailed_info(self, scan_results: Dict[str, Any]) -> None:
         """Display detailed information from the scan.
@@ -176,7 +172,7 @@ class ScanCommand(BaseCommand):
             scan_results: Dictionary containing the scan results.
         """
         # CPU Details
-        cpu_info = scan_results.get("hardware", {}).get("cpu", {})
+        cpu_info = _get_section(scan_results, "hardware", "cpu")
         if cpu_info:
             cpu_table = Table(title="CPU Information", show_header=False, box=None)
             cpu_table.add_column("", style="dim", width=25)
@@ -194,7 +190,7 @@ class ScanCommand(BaseCommand):
             self.console.print(Panel(cpu_table, title="[bold]CPU Details[/bold]", border_style="blue"))
         
         # Memory Details
-        memory = scan_results.get("resources", {}).get("memory", {})
+        memory = _get_section(scan_results, "resources", "memory")
         if memory:
             mem_table = Table(title="Memory Information", show_header=False, box=None)
             mem_table.add_column("", style="dim", width=25)
@@ -205,7 +201,7 @@ class ScanCommand(BaseCommand):
             mem_table.add_row("Used", f"{self._format_bytes(memory.get('used', 0))} ({memory.get('percent', 0)}%)")
             mem_table.add_row("Free", self._format_bytes(memory.get("free", 0)))
             
-            swap = scan_results.get("resources", {}).get("swap", {})
+            swap = _get_section(scan_results, "resources", "swap")
             if swap:
                 mem_table.add_row("", "")
                 mem_table.add_row("[bold]Swap:[/bold]", "")
@@ -216,7 +212,7 @@ class ScanCommand(BaseCommand):
             self.console.print(Panel(mem_table, title="[bold]Memory Details[/bold]", border_style="green"))
         
         # Storage Details
-        storage = scan_results.get("storage", {}).get("disks", {})
+        storage = _get_section(scan_results, "storage", "disks")
         if storage:
             storage_table = Table(title="Storage Information", box=None)
             storage_table.add_column("Mount Point", style="cyan")
@@ -250,15 +246,16 @@ class ScanCommand(BaseCommand):
             
             self.console.print(Panel(sec_table, title="[bold]Security Status[/bold]", border_style="red"))
 
-def execute(quick: bool = False, *args, **kwargs) -> CommandResult:
+def execute(quick: bool = False, detail: bool = False, *args, **kwargs) -> CommandResult:
     """Execute the scan command.
     
     This is the entry point for the scan command.
     
     Args:
         quick: If True, perform a quick scan with less detail.
+        detail: Show the detailed information panels even on a quick scan.
         
     Returns:
         CommandResult: The result of the command execution.
     """
-    return ScanCommand().execute(quick=quick, *args, **kwargs)
+    return ScanCommand().execute(quick=quick, detail=detail, *args, **kwargs)
@@ -4,14 +4,21 @@ System services command.
 This module provides the `services` command which manages system services.
 """
 
+import codecs
+import functools
+import inspect
 import os
 import re
+import select
 import subprocess
-import platform
-import shlex
 import socket
+import sys
 import time
-from typing import Dict, Any, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
+
+import psutil
 
 from rich.console import Console
 from rich.table import Table
@@ -20,45 +27,211 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Confirm, Prompt
 
 from ..commands import BaseCommand, CommandResult
-from ...utils import get_services_info
+from ..core import get_services_info
+
+# Unit properties read by `systemctl show` for a single service
+_SYSTEMD_PROPERTIES = (
+    'Id', 'LoadState', 'Description', 'ActiveState', 'SubState', 'MainPID',
+    'MemoryCurrent', 'CPUUsageNSec', 'User', 'Group', 'ExecMainStartTimestamp',
+    'ExecStart'
+)
+_SYSTEMD_PROPERTY_SET = frozenset(_SYSTEMD_PROPERTIES)
+
+# Colors used for the service status column
+_STATUS_COLORS = {
+    'running': 'green',
+    'active': 'green',
+    'inactive': 'red',
+    'failed': 'red',
+    'dead': 'red',
+    'exited': 'yellow',
+}
+
+# Ready-made status cells for the statuses above
+_STATUS_MARKUP = {
+    status: f"[{color}]{status.upper()}[/{color}]"
+    for status, color in _STATUS_COLORS.items()
+}
+
+# Actions that can be performed on a service
+_VALID_ACTIONS = frozenset({'start', 'stop', 'restart', 'enable', 'disable'})
+
+# Commands for each (service manager, action), run in order and stopping
+# at the first failure
+_ACTION_CMDS: Dict[str, Dict[str, Callable[[str], List[List[str]]]]] = {
+    'systemd': {
+        action: (lambda name, action=action: [['systemctl', action, name]])
+        for action in _VALID_ACTIONS
+    },
+    'launchd': {  # macOS
+        'start': lambda name: [['launchctl', 'start', name]],
+        'stop': lambda name: [['launchctl', 'stop', name]],
+        'restart': lambda name: [['launchctl', 'stop', name], ['launchctl', 'start', name]],
+    },
+    'service': {  # SysV init
+        'start': lambda name: [['service', name, 'start']],
+        'stop': lambda name: [['service', name, 'stop']],
+        'restart': lambda name: [['service', name, 'restart']],
+        'enable': lambda name: [['update-rc.d', name, 'enable']],
+        'disable': lambda name: [['update-rc.d', name, 'disable']],
+    },
+    'sc': {  # Windows
+        'start': lambda name: [['net', 'start', name]],
+        'stop': lambda name: [['net', 'stop', name]],
+        'restart': lambda name: [['net', 'stop', name], ['net', 'start', name]],
+        'enable': lambda name: [['sc', 'config', name, 'start=', 'auto']],
+        'disable': lambda name: [['sc', 'config', name, 'start=', 'disabled']],
+    },
+}
+
+def _launchd_plist_commands(subcommand: str, name: str) -> List[List[str]]:
+    """Build launchctl commands for each location a service's plist may live in."""
+    return [
+        ['launchctl', subcommand, '-w', os.path.join(directory, f'{name}.plist')]
+        for directory in (
+            '/System/Library/LaunchDaemons',
+            '/Library/LaunchDaemons',
+            os.path.expanduser('~/Library/LaunchAgents')
+        )
+    ]
+
+# Commands for each (service manager, action), tried in order until one succeeds
+_ACTION_ALTERNATIVES: Dict[str, Dict[str, Callable[[str], List[List[str]]]]] = {
+    'launchd': {
+        'enable': lambda name: _launchd_plist_commands('load', name),
+        'disable': lambda name: _launchd_plist_commands('unload', name),
+    },
+}
+
+# Timeouts (seconds) for service manager queries, actions and log reads
+_COMMAND_TIMEOUT = 5
+_ACTION_TIMEOUT = 60
+_LOG_TIMEOUT = 30
+
+# Column headers of the services list
+_LIST_COLUMNS = ("Name", "Status", "Description", "PID", "Memory", "CPU %")
+
+# Bytes read per chunk when following logs
+_LOG_CHUNK_SIZE = 1 << 16
+
+# Threads used to look up service details while listing
+_LIST_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Window (seconds) over which listed services' CPU usage is measured
+_SERVICE_CPU_SAMPLE = 0.1
+
+def _detect_service_manager() -> str:
+    """Detect the system service manager.
+    
+    Returns:
+        Name of the service manager ('systemd', 'launchd', 'service', 'sc', 'unknown').
+    """
+    if sys.platform.startswith('linux'):
+        # Check for systemd (the common case)
+        if os.path.exists('/run/systemd/system'):
+            return 'systemd'
+        
+        # systemd running as PID 1 without /run/systemd (e.g. in some
+        # containers); anything else goes through the path checks below
+        try:
+            with open('/proc/1/comm') as f:
+                if f.read().strip() == 'systemd':
+                    return 'systemd'
+        except OSError:
+            pass
+        
+        # Check for SysV init
+        if os.path.exists('/etc/init.d'):
+            return 'service'
+        # Check for openrc
+        elif os.path.exists('/etc/init.d/rc'):
+            return 'openrc'
+        # Check for upstart
+        elif os.path.exists('/sbin/upstart-udev-bridge'):
+            return 'upstart'
+        else:
+            return 'unknown'
+    elif sys.platform == 'darwin':  # macOS
+        return 'launchd'
+    elif sys.platform.startswith('win'):
+        return 'sc'
+    else:
+        return 'unknown'
+
+# The service manager cannot change while we run, so detect it once
+_SERVICE_MANAGER = _detect_service_manager()
+
+def _format_memory(memory: int) -> str:
+    """Format a service's memory usage in MB, or "N/A" if unknown."""
+    return f"{memory / 1048576:.1f} MB" if memory > 0 else "N/A"
+
+@lru_cache(maxsize=256)
+def _resolve_log_path(service_manager: str, service_name: str) -> Optional[str]:
+    """Find the log file for a service.
+    
+    Results are cached; log files are not expected to appear or vanish
+    while we run (call `_resolve_log_path.cache_clear()` if they do).
+    
+    Args:
+        service_manager: Name of the service manager.
+        service_name: Name of the service.
+        
+    Returns:
+        Path of the first existing candidate log file, or None.
+    """
+    if service_manager == 'launchd':
+        log_paths = [
+            f'/var/log/{service_name}.log',
+            '/var/log/system.log',
+            os.path.expanduser(f'~/Library/Logs/{service_name}.log')
+        ]
+    elif service_manager == 'service':
+        log_paths = [
+            f'/var/log/{service_name}.log',
+            f'/var/log/{service_name}',
+            '/var/log/syslog',
+            '/var/log/messages'
+        ]
+    else:
+        return None
+    
+    return next((path for path in log_paths if os.path.exists(path)), None)
+
+def _reports_error(what: str) -> Callable[[Callable[..., CommandResult]], Callable[..., CommandResult]]:
+    """Turn exceptions raised by a command method into a failed CommandResult.
+    
+    Args:
+        what: Description of the operation for the error message; it is
+            formatted with the method's arguments, e.g. "{action} service".
+        
+    Returns:
+        Decorator for ServicesCommand methods.
+    """
+    def decorator(method: Callable[..., CommandResult]) -> Callable[..., CommandResult]:
+        signature = inspect.signature(method)
+        
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs) -> CommandResult:
+            try:
+                return method(self, *args, **kwargs)
+            except Exception as e:
+                arguments = signature.bind(self, *args, **kwargs)
+                arguments.apply_defaults()
+                error_msg = f"Failed to {what.format(**arguments.arguments)}: {str(e)}"
+                self.console.print(f"[red]Error:[/red] {error_msg}")
+                return CommandResult(success=False, error=error_msg)
+        
+        return wrapper
+    return decorator
 
 class ServicesCommand(BaseCommand):
     """Manage system services."""
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.service_manager = self._detect_service_manager()
-    
-    def _detect_service_manager(self) -> str:
-        """Detect the system service manager.
-        
-        Returns:
-            Name of the service manager ('systemd', 'launchd', 'service', 'sc', 'unknown').
-        """
-        system = platform.system().lower()
-        
-        if system == 'linux':
-            # Check for systemd
-            if os.path.exists('/run/systemd/system'):
-                return 'systemd'
-            # Check for SysV init
-            elif os.path.exists('/etc/init.d'):
-                return 'service'
-            # Check for openrc
-            elif os.path.exists('/etc/init.d/rc'):
-                return 'openrc'
-            # Check for upstart
-            elif os.path.exists('/sbin/upstart-udev-bridge'):
-                return 'upstart'
-            else:
-                return 'unknown'
-        elif system == 'darwin':  # macOS
-            return 'launchd'
-        elif system == 'windows':
-            return 'sc'
-        else:
-            return 'unknown'
+        self.service_manager = _SERVICE_MANAGER
     
+    @_reports_error("manage services")
     def execute(self, 
                list_all: bool = False,
                status: Optional[str] = None,
@@ -69,6 +242,7 @@ class ServicesCommand(BaseCommand):
                disable: Optional[str] = None,
                show_logs: Optional[str] = None,
                follow_logs: bool = False,
+               details: bool = False,
                *args, **kwargs) -> CommandResult:
         """Execute the services command.
         
@@ -82,104 +256,288 @@ class ServicesCommand(BaseCommand):
             disable: Disable a service from starting on boot.
             show_logs: Show logs for a service.
             follow_logs: Follow log output (only with --show-logs).
+            details: Look up PID, memory and CPU for each listed service
+                (one service manager query per service).
             
         Returns:
             CommandResult: Contains service information or operation result.
         """
-        try:
-            # If no action specified, default to listing all services
-            if not any([list_all, status, start, stop, restart, enable, disable, show_logs]):
-                list_all = True
-            
-            # Execute the requested action
-            if list_all:
-                return self._list_services()
-            elif status:
-                return self._service_status(status)
-            elif start:
-                return self._service_action(start, 'start')
-            elif stop:
-                return self._service_action(stop, 'stop')
-            elif restart:
-                return self._service_action(restart, 'restart')
-            elif enable:
-                return self._service_action(enable, 'enable')
-            elif disable:
-                return self._service_action(disable, 'disable')
-            elif show_logs:
-                return self._show_logs(show_logs, follow=follow_logs)
-            else:
-                return CommandResult(success=False, error="No valid action specified")
-                
-        except Exception as e:
-            error_msg = f"Failed to manage services: {str(e)}"
-            self.console.print(f"[red]Error:[/red] {error_msg}")
-            return CommandResult(success=False, error=error_msg)
+        # If no action specified, default to listing all services
+        if not any([list_all, status, start, stop, restart, enable, disable, show_logs]):
+            list_all = True
+        
+        # Execute the requested action
+        if list_all:
+            return self._list_services(details=details)
+        elif status:
+            return self._service_status(status)
+        elif start:
+            return self._service_action(start, 'start')
+        elif stop:
+            return self._service_action(stop, 'stop')
+        elif restart:
+            return self._service_action(restart, 'restart')
+        elif enable:
+            return self._service_action(enable, 'enable')
+        elif disable:
+            return self._service_action(disable, 'disable')
+        elif show_logs:
+            return self._show_logs(show_logs, follow=follow_logs)
+        else:
+            return CommandResult(success=False, error="No valid action specified")
     
-    def _list_services(self) -> CommandResult:
+    @_reports_error("list services")
+    def _list_services(self, details: bool = False) -> CommandResult:
         """List all system services.
         
+        Args:
+            details: Also look up PID, memory and CPU usage per service.
+        
         Returns:
             CommandResult: Contains list of services.
         """
+        services = get_services_info()["services"]
+        
+        if not services:
+            self.console.print("[yellow]No services found.[/yellow]")
+            return CommandResult(success=True, data={"services": []})
+        
+        if details:
+            # Each lookup is a service manager query; run them concurrently
+            # so threads hide most of the latency
+            with ThreadPoolExecutor(max_workers=min(_LIST_WORKERS, len(services))) as executor:
+                services = list(executor.map(self._fetch_one, services))
+            self._add_cpu_percent(services)
+        
+        # Format every row up front
+        rows = []
+        for service in services:
+            status = (service.get('status') or service.get('active') or 'unknown').lower()
+            
+            # Truncate long descriptions
+            description = service.get('description') or ''
+            if len(description) > 50:
+                description = description[:50] + '...'
+            
+            cpu_percent = service.get('cpu_percent')
+            
+            rows.append((
+                service.get('name', 'N/A'),
+                status,
+                description,
+                str(service.get('pid', 'N/A')),
+                _format_memory(service.get('memory', 0)),
+                f"{cpu_percent:.1f}%" if cpu_percent is not None else "N/A"
+            ))
+        
+        # Piped or redirected output: plain tab-separated lines, no Rich layout
+        if not self.console.is_terminal:
+            out = self.console.file
+            out.write("\t".join(_LIST_COLUMNS) + "\n")
+            out.writelines(
+                f"{name}\t{status.upper()}\t{description}\t{pid}\t{memory_str}\t{cpu_str}\n"
+                for name, status, description, pid, memory_str, cpu_str in rows
+            )
+            return CommandResult(success=True, data={"services": services, "count": len(services)})
+        
+        # Create table
+        table = Table(
+            title="System Services",
+            show_header=True,
+            header_style="bold magenta",
+            box=None
+        )
+        
+        # Add columns
+        table.add_column("Name", style="cyan")
+        table.add_column("Status", justify="center")
+        table.add_column("Description")
+        table.add_column("PID", justify="right")
+        table.add_column("Memory", justify="right")
+        table.add_column("CPU %", justify="right")
+        
+        # Add rows, coloring the status
+        for name, status, *cells in rows:
+            status_cell = _STATUS_MARKUP.get(status) or f"[white]{status.upper()}[/white]"
+            table.add_row(name, status_cell, *cells)
+        
+        self.console.print(table)
+        return CommandResult(success=True, data={"services": services, "count": len(services)})
+    
+    def _add_cpu_percent(self, services: List[Dict[str, Any]]) -> None:
+        """Measure the CPU usage of each service's main process.
+        
+        A process' first cpu_percent() reading is always 0.0, so every
+        process is primed and all of them are read after one shared window.
+        
+        Args:
+            services: Service records; those with a PID gain 'cpu_percent'.
+        """
+        processes = []
+        for service in services:
+            if not service.get('pid'):
+                continue
+            try:
+                process = psutil.Process(service['pid'])
+                process.cpu_percent(interval=None)
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+            processes.append((service, process))
+        
+        if not processes:
+            return
+        
+        time.sleep(_SERVICE_CPU_SAMPLE)
+        for service, process in processes:
+            try:
+                service['cpu_percent'] = process.cpu_percent(interval=None)
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+    
+    def _fetch_one(self, service: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge the targeted lookup of a listed service into its record.
+        
+        Args:
+            service: Service record from get_services_info.
+            
+        Returns:
+            The record updated with PID, memory, etc. where available.
+        """
+        name = service.get('name')
+        if not name or self.service_manager not in ('systemd', 'launchd', 'service', 'sc'):
+            return service
+        
         try:
-            services = get_services_info()
-            
-            if not services:
-                self.console.print("[yellow]No services found.[/yellow]")
-                return CommandResult(success=True, data={"services": []})
-            
-            # Create table
-            table = Table(
-                title="System Services",
-                show_header=True,
-                header_style="bold magenta",
-                box=None
+            details = self._get_one_service(name)
+        except (subprocess.SubprocessError, OSError):
+            details = None
+        
+        if not details:
+            return service
+        
+        # Keep the listed values where the lookup came back empty
+        return {**service, **{key: value for key, value in details.items() if value}}
+    
+    def _get_one_service(self, service_name: str) -> Optional[Dict[str, Any]]:
+        """Look up a single service without enumerating every service.
+        
+        Args:
+            service_name: Name of the service.
+            
+        Returns:
+            Service record, or None if the service does not exist.
+        """
+        if self.service_manager == 'systemd':
+            result = subprocess.run(
+                ['systemctl', 'show', '--property=' + ','.join(_SYSTEMD_PROPERTIES), '--', service_name],
+                capture_output=True,
+                text=True,
+                timeout=_COMMAND_TIMEOUT
             )
+            if result.returncode != 0:
+                return None
             
-            # Add columns
-            table.add_column("Name", style="cyan")
-            table.add_column("Status", justify="center")
-            table.add_column("Description")
-            table.add_column("PID", justify="right")
-            table.add_column("Memory", justify="right")
-            table.add_column("CPU %", justify="right")
-            
-            # Add rows
-            for service in services:
-                # Format status with color
-                status = service.get('status', 'unknown').lower()
-                status_color = {
-                    'running': 'green',
-                    'active': 'green',
-                    'inactive': 'red',
-                    'failed': 'red',
-                    'dead': 'red',
-                    'exited': 'yellow',
-                }.get(status, 'white')
-                
-                # Format memory
-                memory = service.get('memory', 0)
-                memory_str = f"{memory / 1024 / 1024:.1f} MB" if memory > 0 else "N/A"
-                
-                # Add row
-                table.add_row(
-                    service.get('name', 'N/A'),
-                    f"[{status_color}]{status.upper()}[/{status_color}]",
-                    service.get('description', '')[:50] + ('...' if len(service.get('description', '')) > 50 else ''),
-                    str(service.get('pid', 'N/A')),
-                    memory_str,
-                    f"{service.get('cpu_percent', 0):.1f}%" if service.get('cpu_percent') is not None else "N/A"
-                )
+            props = {}
+            for line in result.stdout.splitlines():
+                key, sep, value = line.partition('=')
+                if sep and key in _SYSTEMD_PROPERTY_SET:
+                    props[key] = value
             
-            self.console.print(table)
-            return CommandResult(success=True, data={"services": services, "count": len(services)})
+            if props.get('LoadState', 'not-found') == 'not-found':
+                return None
             
-        except Exception as e:
-            error_msg = f"Failed to list services: {str(e)}"
-            self.console.print(f"[red]Error:[/red] {error_msg}")
-            return CommandResult(success=False, error=error_msg)
+            service = {
+                'name': props.get('Id') or service_name,
+                'description': props.get('Description', ''),
+                'status': props.get('SubState') or props.get('ActiveState') or 'unknown',
+            }
+            
+            pid = props.get('MainPID', '0')
+            if pid.isdigit() and pid != '0':
+                service['pid'] = int(pid)
+            
+            memory = props.get('MemoryCurrent', '')
+            service['memory'] = int(memory) if memory.isdigit() else 0
+            
+            cpu_nsec = props.get('CPUUsageNSec', '')
+            if cpu_nsec.isdigit():
+                service['cpu_time'] = int(cpu_nsec) / 1e9
+            
+            for key, prop in (('user', 'User'), ('group', 'Group'), ('start_time', 'ExecMainStartTimestamp')):
+                if props.get(prop):
+                    service[key] = props[prop]
+            
+            # ExecStart looks like "{ path=... ; argv[]=/usr/bin/foo -x ; ... }"
+            match = re.search(r'argv\[\]=([^;]*)', props.get('ExecStart', ''))
+            if match:
+                service['cmd'] = match.group(1).strip()
+            
+            return service
+        
+        elif self.service_manager == 'launchd':  # macOS
+            result = subprocess.run(
+                ['launchctl', 'list', service_name],
+                capture_output=True,
+                text=True,
+                timeout=_COMMAND_TIMEOUT
+            )
+            if result.returncode != 0:
+                return None
+            
+            match = re.search(r'"PID"\s*=\s*(\d+);', result.stdout)
+            service = {
+                'name': service_name,
+                'status': 'running' if match else 'inactive',
+            }
+            if match:
+                service['pid'] = int(match.group(1))
+            return service
+        
+        elif self.service_manager == 'service':  # SysV init
+            result = subprocess.run(
+                ['service', service_name, 'status'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                timeout=_COMMAND_TIMEOUT
+            )
+            # LSB status codes: 0 running, 1-3 not running, 4 unknown service
+            if result.returncode == 4:
+                return None
+            return {
+                'name': service_name,
+                'status': 'running' if result.returncode == 0 else 'inactive',
+                'description': result.stdout.strip().splitlines()[0] if result.stdout.strip() else '',
+            }
+        
+        elif self.service_manager == 'sc':  # Windows
+            result = subprocess.run(
+                ['sc', 'query', service_name],
+                capture_output=True,
+                text=True,
+                timeout=_COMMAND_TIMEOUT
+            )
+            if result.returncode != 0:
+                return None
+            
+            match = re.search(r'STATE\s*:\s*\d+\s+(\w+)', result.stdout)
+            return {
+                'name': service_name,
+                'status': match.group(1).lower() if match else 'unknown',
+            }
+        
+        # No targeted lookup for this service manager; use the full list
+        return self._service_index.get(service_name)
     
+    @cached_property
+    def _service_index(self) -> Dict[str, Dict[str, Any]]:
+        """All services keyed by name, built on first use.
+        
+        Dropped after any action that changes a service's state.
+        """
+        return {s['name']: s for s in get_services_info()['services']}
+    
+    @_reports_error("get status for service '{service_name}'")
     def _service_status(self, service_name: str) -> CommandResult:
         """Get detailed status of a service.
         
@@ -189,54 +547,51 @@ class ServicesCommand(BaseCommand):
         Returns:
             CommandResult: Contains detailed service status.
         """
-        try:
-            # Get service info
-            services = get_services_info()
-            service = next((s for s in services if s.get('name') == service_name), None)
-            
-            if not service:
-                return CommandResult(success=False, error=f"Service '{service_name}' not found")
-            
-            # Create status panel
-            status = service.get('status', 'unknown').lower()
-            status_color = 'green' if status in ['running', 'active'] else 'red' if status in ['failed', 'dead'] else 'yellow'
-            
-            # Get additional details based on service manager
-            details = self._get_service_details(service_name)
-            
-            # Create info panel
-            info_panel = Panel(
-                f"[bold]Description:[/bold] {service.get('description', 'N/A')}\n"
-                f"[bold]Status:[/bold] [{status_color}]{status.upper()}[/{status_color}]\n"
-                f"[bold]PID:[/bold] {service.get('pid', 'N/A')}\n"
-                f"[bold]Memory:[/bold] {service.get('memory', 0) / 1024 / 1024:.1f} MB\n"
-                f"[bold]CPU %:[/bold] {service.get('cpu_percent', 0):.1f}%\n"
-                f"[bold]User:[/bold] {service.get('user', 'N/A')}\n"
-                f"[bold]Group:[/bold] {service.get('group', 'N/A')}\n"
-                f"[bold]Start Time:[/bold] {service.get('start_time', 'N/A')}\n"
-                f"[bold]Command:[/bold] {service.get('cmd', 'N/A')}",
-                title=f"Service: {service_name}",
+        # Get service info
+        service = self._get_one_service(service_name)
+        
+        if not service:
+            return CommandResult(success=False, error=f"Service '{service_name}' not found")
+        
+        # Create status panel
+        status = service.get('status', 'unknown').lower()
+        status_markup = _STATUS_MARKUP.get(status) or f"[yellow]{status.upper()}[/yellow]"
+        
+        # Get additional details based on service manager
+        details = self._get_service_details(service_name)
+        
+        # Create info panel
+        lines = [
+            f"[bold]Description:[/bold] {service.get('description', 'N/A')}",
+            f"[bold]Status:[/bold] {status_markup}",
+            f"[bold]PID:[/bold] {service.get('pid', 'N/A')}",
+            f"[bold]Memory:[/bold] {_format_memory(service.get('memory', 0))}",
+            f"[bold]CPU %:[/bold] {service.get('cpu_percent', 0):.1f}%",
+            f"[bold]User:[/bold] {service.get('user', 'N/A')}",
+            f"[bold]Group:[/bold] {service.get('group', 'N/A')}",
+            f"[bold]Start Time:[/bold] {service.get('start_time', 'N/A')}",
+            f"[bold]Command:[/bold] {service.get('cmd', 'N/A')}",
+        ]
+        info_panel = Panel(
+            "\n".join(lines),
+            title=f"Service: {service_name}",
+            border_style="blue"
+        )
+        
+        self.console.print(info_panel)
+        
+        # Show additional details if available
+        if details:
+            details_panel = Panel(
+                "\n".join(f"[bold]{k}:[/bold] {v}" for k, v in details.items() if v),
+                title="Additional Details",
                 border_style="blue"
             )
-            
-            self.console.print(info_panel)
-            
-            # Show additional details if available
-            if details:
-                details_panel = Panel(
-                    "\n".join(f"[bold]{k}:[/bold] {v}" for k, v in details.items() if v),
-                    title="Additional Details",
-                    border_style="blue"
-                )
-                self.console.print(details_panel)
-            
-            return CommandResult(success=True, data={"service": service, "details": details})
-            
-        except Exception as e:
-            error_msg = f"Failed to get status for service '{service_name}': {str(e)}"
-            self.console.print(f"[red]Error:[/red] {error_msg}")
-            return CommandResult(success=False, error=error_msg)
+            self.console.print(details_panel)
+        
+        return CommandResult(success=True, data={"service": service, "details": details})
     
+    @_reports_error("{action} service '{service_name}'")
     def _service_action(self, service_name: str, action: str) -> CommandResult:
         """Perform an action on a service (start, stop, restart, enable, disable).
         
@@ -247,50 +602,44 @@ class ServicesCommand(BaseCommand):
         Returns:
             CommandResult: Result of the action.
         """
-        try:
-            # Check if service exists
-            services = get_services_info()
-            service = next((s for s in services if s.get('name') == service_name), None)
-            
-            if not service:
-                return CommandResult(success=False, error=f"Service '{service_name}' not found")
-            
-            # Check if action is valid
-            if action not in ['start', 'stop', 'restart', 'enable', 'disable']:
-                return CommandResult(success=False, error=f"Invalid action: {action}")
-            
-            # Check if root/sudo is needed
-            if os.geteuid() != 0:
-                self.console.print("[yellow]Warning:[/yellow] This action may require root/sudo privileges.")
-                if not Confirm.ask(f"Continue as non-root user?"):
-                    return CommandResult(success=False, error="Operation cancelled by user")
-            
-            # Execute the action
-            success, output = self._execute_service_action(service_name, action)
-            
-            if success:
-                self.console.print(f"[green]✓ Successfully {action}ed service '{service_name}'[/green]")
-                if output:
-                    self.console.print(f"[dim]{output}[/dim]")
-                
-                # Show new status
-                if action in ['start', 'stop', 'restart']:
-                    time.sleep(1)  # Give the service a moment to update
-                    return self._service_status(service_name)
-                
-                return CommandResult(success=True, data={"service": service_name, "action": action, "output": output})
-            else:
-                error_msg = f"Failed to {action} service '{service_name}'"
-                if output:
-                    error_msg += f": {output}"
-                self.console.print(f"[red]Error:[/red] {error_msg}")
-                return CommandResult(success=False, error=error_msg)
-                
-        except Exception as e:
-            error_msg = f"Failed to {action} service '{service_name}': {str(e)}"
+        # No existence check up front: the service manager rejects
+        # unknown services itself and that error is reported below
+        
+        # Check if action is valid
+        if action not in _VALID_ACTIONS:
+            return CommandResult(success=False, error=f"Invalid action: {action}")
+        
+        # Check if root/sudo is needed
+        if os.geteuid() != 0:
+            self.console.print("[yellow]Warning:[/yellow] This action may require root/sudo privileges.")
+            if not Confirm.ask(f"Continue as non-root user?"):
+                return CommandResult(success=False, error="Operation cancelled by user")
+        
+        # Execute the action
+        success, output = self._execute_service_action(service_name, action)
+        
+        # Whatever happened, cached service records may now be stale
+        self.__dict__.pop('_service_index', None)
+        
+        if success:
+            self.console.print(f"[green]✓ Successfully {action}ed service '{service_name}'[/green]")
+            if output:
+                self.console.print(f"[dim]{output}[/dim]")
+            
+            # Show new status
+            if action in ['start', 'stop', 'restart']:
+                time.sleep(1)  # Give the service a moment to update
+                return self._service_status(service_name)
+            
+            return CommandResult(success=True, data={"service": service_name, "action": action, "output": output})
+        else:
+            error_msg = f"Failed to {action} service '{service_name}'"
+            if output:
+                error_msg += f": {output}"
             self.console.print(f"[red]Error:[/red] {error_msg}")
             return CommandResult(success=False, error=error_msg)
     
+    @_reports_error("show logs for service '{service_name}'")
     def _show_logs(self, service_name: str, follow: bool = False) -> CommandResult:
         """Show logs for a service.
         
@@ -301,69 +650,111 @@ class ServicesCommand(BaseCommand):
         Returns:
             CommandResult: Result of the log retrieval.
         """
+        # Check if service exists
+        service = self._get_one_service(service_name)
+        
+        if not service:
+            return CommandResult(success=False, error=f"Service '{service_name}' not found")
+        
+        # Get log command based on platform
+        log_cmd = self._get_log_command(service_name, follow)
+        
+        if not log_cmd:
+            return CommandResult(success=False, error=f"Log retrieval not supported for this service manager: {self.service_manager}")
+        
+        self.console.print(f"[bold]Showing logs for service:[/bold] {service_name}")
+        self.console.print("-" * 50)
+        
+        # SysV services log to shared files; keep only lines mentioning the service
+        keyword = service_name.lower() if self.service_manager == 'service' else None
+        
+        # Execute log command
         try:
-            # Check if service exists
-            services = get_services_info()
-            service = next((s for s in services if s.get('name') == service_name), None)
-            
-            if not service:
-                return CommandResult(success=False, error=f"Service '{service_name}' not found")
-            
-            # Get log command based on platform
-            log_cmd = self._get_log_command(service_name, follow)
-            
-            if not log_cmd:
-                return CommandResult(success=False, error=f"Log retrieval not supported for this service manager: {self.service_manager}")
-            
-            self.console.print(f"[bold]Showing logs for service:[/bold] {service_name}")
-            self.console.print("-" * 50)
-            
-            # Execute log command
-            try:
-                if follow:
-                    # Follow logs in real-time
-                    process = subprocess.Popen(
-                        log_cmd,
-                        shell=True,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT,
-                        universal_newlines=True
-                    )
-                    
-                    try:
-                        for line in iter(process.stdout.readline, ''):
-                            self.console.print(line.rstrip())
-                    except KeyboardInterrupt:
-                        self.console.print("\n[yellow]Stopping log follow...[/yellow]")
-                        process.terminate()
-                else:
-                    # Show recent logs
-                    result = subprocess.run(
-                        log_cmd,
-                        shell=True,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        universal_newlines=True
-                    )
-                    
-                    if result.returncode == 0:
-                        self.console.print(result.stdout)
-                    else:
-                        self.console.print(f"[red]Error:[/red] {result.stderr}")
-                        return CommandResult(success=False, error=result.stderr)
-                
-                return CommandResult(success=True)
+            if follow:
+                # Follow logs in real-time
+                process = subprocess.Popen(
+                    log_cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT
+                )
                 
-            except subprocess.CalledProcessError as e:
-                error_msg = f"Failed to retrieve logs: {str(e)}"
-                self.console.print(f"[red]Error:[/red] {error_msg}")
-                return CommandResult(success=False, error=error_msg)
+                try:
+                    self._stream_output(process, keyword)
+                except KeyboardInterrupt:
+                    self.console.print("\n[yellow]Stopping log follow...[/yellow]")
+                    process.terminate()
+            else:
+                # Show recent logs
+                result = subprocess.run(
+                    log_cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=_LOG_TIMEOUT
+                )
                 
-        except Exception as e:
-            error_msg = f"Failed to show logs for service '{service_name}': {str(e)}"
+                if result.returncode == 0:
+                    output = result.stdout
+                    if keyword is not None:
+                        output = "\n".join(line for line in output.splitlines() if keyword in line.lower())
+                    self.console.print(output)
+                else:
+                    self.console.print(f"[red]Error:[/red] {result.stderr}")
+                    return CommandResult(success=False, error=result.stderr)
+            
+            return CommandResult(success=True)
+            
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            error_msg = f"Failed to retrieve logs: {str(e)}"
             self.console.print(f"[red]Error:[/red] {error_msg}")
             return CommandResult(success=False, error=error_msg)
     
+    def _stream_output(self, process: subprocess.Popen, keyword: Optional[str] = None) -> None:
+        """Copy a process' output to the console until it exits.
+        
+        Output is read in large chunks and written straight to the console
+        file rather than line by line through Rich.
+        
+        Args:
+            process: Process started with stdout=PIPE in binary mode.
+            keyword: Only show lines containing this (lower-case) text.
+        """
+        out = self.console.file
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        pending = ''
+        
+        def write(data: bytes, final: bool = False) -> None:
+            nonlocal pending
+            text = decoder.decode(data, final)
+            if keyword is not None:
+                lines = (pending + text).split('\n')
+                pending = '' if final else lines.pop()
+                text = ''.join(line + '\n' for line in lines if keyword in line.lower())
+            if text:
+                out.write(text)
+                out.flush()
+        
+        if sys.platform.startswith('win'):
+            # Pipes cannot be select()ed on Windows; fall back to blocking reads
+            for data in iter(lambda: process.stdout.read1(_LOG_CHUNK_SIZE), b''):
+                write(data)
+            write(b'', final=True)
+            return
+        
+        fd = process.stdout.fileno()
+        os.set_blocking(fd, False)
+        while True:
+            ready, _, _ = select.select([fd], [], [], 1.0)
+            if not ready:
+                if process.poll() is not None:
+                    break
+                continue
+            
+            data = os.read(fd, _LOG_CHUNK_SIZE)
+            if not data:  # EOF
+                break
+            write(data)
+        write(b'', final=True)
+    
     def _get_service_details(self, service_name: str) -> Dict[str, str]:
         """Get additional details about a service.
         
@@ -378,30 +769,26 @@ class ServicesCommand(BaseCommand):
         try:
             if self.service_manager == 'systemd':
                 # Get systemd service details
-                cmd = f'systemctl show {shlex.quote(service_name)}'
                 result = subprocess.run(
-                    cmd,
-                    shell=True,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    universal_newlines=True
+                    ['systemctl', 'show', '--', service_name],
+                    capture_output=True,
+                    text=True,
+                    timeout=_COMMAND_TIMEOUT
                 )
                 
                 if result.returncode == 0:
                     for line in result.stdout.splitlines():
-                        if '=' in line:
-                            key, value = line.split('=', 1)
+                        key, sep, value = line.partition('=')
+                        if sep:
                             details[key] = value
             
             elif self.service_manager == 'launchd':  # macOS
                 # Get launchd service details
-                cmd = f'launchctl list {shlex.quote(service_name)}'
                 result = subprocess.run(
-                    cmd,
-                    shell=True,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    universal_newlines=True
+                    ['launchctl', 'list', service_name],
+                    capture_output=True,
+                    text=True,
+                    timeout=_COMMAND_TIMEOUT
                 )
                 
                 if result.returncode == 0:
@@ -426,65 +813,50 @@ class ServicesCommand(BaseCommand):
             Tuple of (success, output).
         """
         try:
-            cmd = ''
+            build_steps = _ACTION_CMDS.get(self.service_manager, {}).get(action)
+            build_alternatives = _ACTION_ALTERNATIVES.get(self.service_manager, {}).get(action)
             
-            if self.service_manager == 'systemd':
-                if action in ['start', 'stop', 'restart', 'enable', 'disable']:
-                    cmd = f'systemctl {action} {shlex.quote(service_name)}'
-            
-            elif self.service_manager == 'launchd':  # macOS
-                if action == 'start':
-                    cmd = f'launchctl start {shlex.quote(service_name)}'
-                elif action == 'stop':
-                    cmd = f'launchctl stop {shlex.quote(service_name)}'
-                elif action == 'restart':
-                    cmd = f'launchctl stop {shlex.quote(service_name)} && launchctl start {shlex.quote(service_name)}'
-                elif action == 'enable':
-                    cmd = f'launchctl load -w /System/Library/LaunchDaemons/{shlex.quote(service_name)}.plist 2>/dev/null || launchctl load -w /Library/LaunchDaemons/{shlex.quote(service_name)}.plist 2>/dev/null || launchctl load -w ~/Library/LaunchAgents/{shlex.quote(service_name)}.plist'
-                elif action == 'disable':
-                    cmd = f'launchctl unload -w /System/Library/LaunchDaemons/{shlex.quote(service_name)}.plist 2>/dev/null || launchctl unload -w /Library/LaunchDaemons/{shlex.quote(service_name)}.plist 2>/dev/null || launchctl unload -w ~/Library/LaunchAgents/{shlex.quote(service_name)}.plist'
+            # Commands run in order, stopping at the first failure
+            steps = build_steps(service_name) if build_steps else []
+            # Commands tried in order until one succeeds
+            alternatives = build_alternatives(service_name) if build_alternatives else []
             
-            elif self.service_manager == 'service':  # SysV init
-                if action in ['start', 'stop', 'restart']:
-                    cmd = f'service {shlex.quote(service_name)} {action}'
-                elif action == 'enable':
-                    cmd = f'update-rc.d {shlex.quote(service_name)} enable'
-                elif action == 'disable':
-                    cmd = f'update-rc.d {shlex.quote(service_name)} disable'
-            
-            elif self.service_manager == 'sc':  # Windows
-                if action in ['start', 'stop']:
-                    cmd = f'net {action} {shlex.quote(service_name)}'
-                elif action == 'restart':
-                    cmd = f'net stop {shlex.quote(service_name)} && net start {shlex.quote(service_name)}'
-                elif action == 'enable':
-                    cmd = f'sc config {shlex.quote(service_name)} start= auto'
-                elif action == 'disable':
-                    cmd = f'sc config {shlex.quote(service_name)} start= disabled'
-            
-            if not cmd:
+            if not steps and not alternatives:
                 return False, f"Action '{action}' not supported for service manager: {self.service_manager}"
             
-            # Execute the command
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True
-            )
-            
-            output = result.stdout.strip()
-            
-            if result.returncode != 0:
+            # Execute the commands
+            outputs = []
+            for argv in steps or alternatives:
+                try:
+                    result = subprocess.run(
+                        argv,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.STDOUT,
+                        text=True,
+                        timeout=_ACTION_TIMEOUT
+                    )
+                except subprocess.TimeoutExpired:
+                    return False, f"'{' '.join(argv)}' timed out after {_ACTION_TIMEOUT} seconds"
+                output = result.stdout.strip()
+                
+                if steps:
+                    if output:
+                        outputs.append(output)
+                    if result.returncode != 0:
+                        return False, "\n".join(outputs) or f"Failed to {action} service"
+                elif result.returncode == 0:
+                    return True, output
+            
+            if alternatives:
+                # Only the last attempt's error is worth reporting
                 return False, output or f"Failed to {action} service"
             
-            return True, output
+            return True, "\n".join(outputs)
             
         except Exception as e:
             return False, str(e)
     
-    def _get_log_command(self, service_name: str, follow: bool = False) -> Optional[str]:
+    def _get_log_command(self, service_name: str, follow: bool = False) -> Optional[List[str]]:
         """Get the command to show logs for a service.
         
         Args:
@@ -492,42 +864,29 @@ class ServicesCommand(BaseCommand):
             follow: Whether to follow the log output.
             
         Returns:
-            Command string or None if not supported.
+            Command argument list or None if not supported.
         """
         try:
             if self.service_manager == 'systemd':
-                return f'journalctl -u {shlex.quote(service_name)} ' + ('-f' if follow else '--no-pager -n 100')
+                return ['journalctl', '-u', service_name] + (['-f'] if follow else ['--no-pager', '-n', '100'])
             
             elif self.service_manager == 'launchd':  # macOS
                 # Try to find the log file for the service
-                log_paths = [
-                    f'/var/log/{service_name}.log',
-                    f'/var/log/system.log',
-                    f'~/Library/Logs/{service_name}.log'
-                ]
-                
-                for log_path in log_paths:
-                    log_path = os.path.expanduser(log_path)
-                    if os.path.exists(log_path):
-                        return f'tail ' + ('-f' if follow else '-n 100') + f' {shlex.quote(log_path)}'
+                log_path = _resolve_log_path(self.service_manager, service_name)
+                if log_path:
+                    return ['tail'] + (['-f'] if follow else ['-n', '100']) + [log_path]
                 
                 # If no log file found, try to get logs from system log
-                return f'log show --predicate "processImagePath contains \'{service_name}\'" --last 1h' + (' --style syslog --follow' if follow else '')
+                return ['log', 'show', '--predicate', f"processImagePath contains '{service_name}'", '--last', '1h'] + (['--style', 'syslog', '--follow'] if follow else [])
             
             elif self.service_manager == 'service':  # SysV init
-                log_paths = [
-                    f'/var/log/{service_name}.log',
-                    f'/var/log/{service_name}',
-                    f'/var/log/syslog',
-                    f'/var/log/messages'
-                ]
-                
-                for log_path in log_paths:
-                    if os.path.exists(log_path):
-                        return f'tail ' + ('-f' if follow else '-n 100') + f' {shlex.quote(log_path)} | grep -i {shlex.quote(service_name)}'
+                # Lines are filtered for the service name by the caller
+                log_path = _resolve_log_path(self.service_manager, service_name)
+                if log_path:
+                    return ['tail'] + (['-f'] if follow else ['-n', '100']) + [log_path]
             
             elif self.service_manager == 'sc':  # Windows
-                return f'Get-EventLog -LogName Application -Source {shlex.quote(service_name)} -Newest 100 | Format-Table TimeGenerated, Message -AutoSize -Wrap'
+                return ['powershell', '-NoProfile', '-Command', f"Get-EventLog -LogName Application -Source '{service_name}' -Newest 100 | Format-Table TimeGenerated, Message -AutoSize -Wrap"]
             
             return None
             
@@ -538,7 +897,8 @@ def execute(list_all: bool = False, status: Optional[str] = None,
            start: Optional[str] = None, stop: Optional[str] = None, 
            restart: Optional[str] = None, enable: Optional[str] = None, 
            disable: Optional[str] = None, show_logs: Optional[str] = None, 
-           follow_logs: bool = False, *args, **kwargs) -> CommandResult:
+           follow_logs: bool = False, details: bool = False,
+           *args, **kwargs) -> CommandResult:
     """Execute the services command.
     
     This is the entry point for the services command.
@@ -553,6 +913,7 @@ def execute(list_all: bool = False, status: Optional[str] = None,
         disable: Disable a service from starting on boot.
         show_logs: Show logs for a service.
         follow_logs: Follow log output (only with --show-logs).
+        details: Look up PID, memory and CPU for each listed service.
         
     Returns:
         CommandResult: The result of the command execution.
@@ -567,6 +928,7 @@ def execute(list_all: bool = False, status: Optional[str] = None,
         disable=disable,
         show_logs=show_logs,
         follow_logs=follow_logs,
+        details=details,
         *args,
         **kwargs
     )
@@ -5,21 +5,166 @@ This package contains core functionality for retrieving system information
 such as platform details, hardware information, resource usage, etc.
 """
 
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Callable, Dict, Any, Optional, List, Tuple
+import asyncio
+import copy
+import heapq
+import logging
+import os
 import platform
 import psutil
 import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 
-from ..models import SystemInfo, ProcessInfo, NetworkConnection, ServiceInfo
+from ellma.utils.helpers.decorators import memoize_decorator
 
-def get_platform_info() -> Dict[str, str]:
+from ..models import SystemInfo, ProcessInfo, NetworkConnection
+
+logger = logging.getLogger(__name__)
+
+try:
+    from pystemd.systemd1 import Manager as SystemdManager
+    PYSTEMD_AVAILABLE = True
+except ImportError:
+    PYSTEMD_AVAILABLE = False
+
+# Shortest window (seconds) a CPU usage figure may cover. Shorter deltas
+# between two /proc/stat reads are dominated by tick granularity and swing
+# between 0% and 100%.
+MIN_CPU_SAMPLE_INTERVAL = 1.0
+
+# Prime psutil's per-core CPU counters so that later non-blocking
+# cpu_percent() calls report usage since import. The time of each read is
+# kept so that no reading covers less than MIN_CPU_SAMPLE_INTERVAL.
+psutil.cpu_percent(interval=None, percpu=True)
+_cpu_sampled_at = time.monotonic()
+_cpu_reading: Optional[List[float]] = None
+_cpu_lock = threading.Lock()
+
+# Lifetime (seconds) of cached get_process_info() results
+PROCESS_INFO_TTL = 1.5
+
+# Lifetimes (seconds) of the cached interface list and mount point usage.
+# I/O counters and other live figures are always read fresh.
+NETWORK_INFO_TTL = 2
+STORAGE_INFO_TTL = 2
+
+# Lifetime (seconds) of the cached hostname -> IP address lookup
+IP_ADDRESS_TTL = 60.0
+
+# Upper bound on threads used to probe mount points concurrently
+_STORAGE_WORKERS = 8
+
+# Extra fields read only for the processes returned in top_cpu/top_memory
+_TOP_PROCESS_ATTRS = ['ppid', 'memory_info', 'cmdline', 'create_time']
+
+# Window (seconds) used to prime per-process CPU counters on first use
+_PROCESS_CPU_SAMPLE = 0.1
+_process_cpu_primed = False
+
+def _sample_cpu_per_core() -> List[float]:
     """
-    Get platform information.
+    Read per-core CPU usage over a window of at least MIN_CPU_SAMPLE_INTERVAL.
+
+    If the previous read is too recent, its reading is returned again; the
+    first call after import waits out the rest of the window instead.
 
     Returns:
-        Dictionary containing platform information.
+        Usage percentage for each logical core.
     """
+    global _cpu_sampled_at, _cpu_reading
+    with _cpu_lock:
+        elapsed = time.monotonic() - _cpu_sampled_at
+        if elapsed < MIN_CPU_SAMPLE_INTERVAL:
+            if _cpu_reading is not None:
+                return list(_cpu_reading)
+            time.sleep(MIN_CPU_SAMPLE_INTERVAL - elapsed)
+        _cpu_reading = psutil.cpu_percent(interval=None, percpu=True)
+        _cpu_sampled_at = time.monotonic()
+        return list(_cpu_reading)
+
+class SystemSnapshot:
+    """
+    Lazily memoized psutil readings shared between collectors.
+
+    Each reading is taken at most once per snapshot, so collectors that
+    need the same data (memory, swap, connections, I/O counters) during one
+    scan share a single read. Safe to use from several threads.
+    """
+
+    def __init__(self) -> None:
+        self._values: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _memoize(self, key: str, func: Callable[[], Any]) -> Any:
+        # One lock per reading so slow reads do not block unrelated ones
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            if key not in self._values:
+                self._values[key] = func()
+            return self._values[key]
+
+    def virtual_memory(self):
+        return self._memoize("virtual_memory", psutil.virtual_memory)
+
+    def swap_memory(self):
+        return self._memoize("swap_memory", psutil.swap_memory)
+
+    def cpu_percent(self) -> float:
+        # Derived from the per-core reading so /proc/stat is sampled once
+        per_core = self.cpu_per_core()
+        return sum(per_core) / len(per_core) if per_core else 0.0
+
+    def cpu_per_core(self) -> List[float]:
+        return self._memoize("cpu_per_core", _sample_cpu_per_core)
+
+    def net_io_counters(self):
+        return self._memoize("net_io_counters", psutil.net_io_counters)
+
+    def net_connections(self):
+        # TCP and UDP over IPv4/IPv6; UNIX sockets are not read
+        return self._memoize("net_connections", lambda: psutil.net_connections(kind='inet'))
+
+    def connection_summary(self) -> Tuple[int, int, List[int]]:
+        return self._memoize("connection_summary", lambda: _scan_connections(self.net_connections()))
+
+    def disk_io_counters(self):
+        return self._memoize("disk_io_counters", psutil.disk_io_counters)
+
+def _scan_connections(connections: List[Any]) -> Tuple[int, int, List[int]]:
+    """
+    Summarize a connection table in a single pass.
+
+    Args:
+        connections: Entries as returned by psutil.net_connections().
+
+    Returns:
+        Tuple of (total connections, established SSH connections, sorted
+        listening ports).
+    """
+    ssh_connections = 0
+    open_ports = set()
+    for conn in connections:
+        if not conn.laddr:
+            continue
+        if conn.status == 'LISTEN':
+            open_ports.add(conn.laddr.port)
+        elif conn.status == 'ESTABLISHED' and conn.laddr.port == 22:
+            ssh_connections += 1
+    return len(connections), ssh_connections, sorted(open_ports)
+
+@lru_cache(maxsize=1)
+def _get_static_platform_info() -> Dict[str, str]:
+    """Platform fields that cannot change while the process is running."""
     return {
         "system": platform.system(),
         "release": platform.release(),
@@ -27,58 +172,94 @@ def get_platform_info() -> Dict[str, str]:
         "machine": platform.machine(),
         "processor": platform.processor(),
         "architecture": platform.architecture()[0],
-        "python_version": platform.python_version(),
-        "hostname": socket.gethostname(),
-        "ip_address": socket.gethostbyname(socket.gethostname())
+        "python_version": platform.python_version()
     }
 
-def get_hardware_info() -> Dict[str, Any]:
+@memoize_decorator(IP_ADDRESS_TTL)
+def _get_ip_address(hostname: str) -> str:
+    """Resolve the host's address, reusing it for IP_ADDRESS_TTL seconds."""
+    return socket.gethostbyname(hostname)
+
+def get_platform_info() -> Dict[str, str]:
     """
-    Get hardware information.
+    Get platform information.
+
+    Static platform fields are read once per process and the IP address
+    lookup is cached for IP_ADDRESS_TTL seconds.
 
     Returns:
-        Dictionary containing hardware information.
+        Dictionary containing platform information.
     """
-    cpu_freq = psutil.cpu_freq()
+    hostname = socket.gethostname()
+    return {
+        **_get_static_platform_info(),
+        "hostname": hostname,
+        "ip_address": _get_ip_address(hostname)
+    }
+
+@memoize_decorator()
+def _get_static_hardware_info() -> Dict[str, Any]:
+    """Hardware fields that cannot change while the process is running."""
     return {
         "cpu_count_logical": psutil.cpu_count(logical=True),
         "cpu_count_physical": psutil.cpu_count(logical=False),
-        "cpu_freq": cpu_freq._asdict() if cpu_freq else {},
-        "memory_total": psutil.virtual_memory().total,
-        "memory_available": psutil.virtual_memory().available,
-        "swap_total": psutil.swap_memory().total,
         "boot_time": datetime.fromtimestamp(psutil.boot_time()).isoformat()
     }
 
-def get_resource_usage() -> Dict[str, Any]:
+def get_hardware_info(snapshot: Optional[SystemSnapshot] = None) -> Dict[str, Any]:
     """
-    Get current resource usage.
+    Get hardware information.
+
+    CPU counts and boot time are read once per process; frequency and
+    memory figures are read on every call.
+
+    Args:
+        snapshot: Shared snapshot to read from; a private one is used if omitted.
 
     Returns:
-        Dictionary containing resource usage information.
+        Dictionary containing hardware information.
     """
+    snapshot = snapshot or SystemSnapshot()
+    static_info = _get_static_hardware_info()
+    cpu_freq = psutil.cpu_freq()
+    memory = snapshot.virtual_memory()
     return {
-        "cpu_percent": psutil.cpu_percent(interval=1),
-        "cpu_per_core": psutil.cpu_percent(interval=1, percpu=True),
-        "memory": psutil.virtual_memory()._asdict(),
-        "swap": psutil.swap_memory()._asdict(),
-        "load_average": get_load_average()
+        "cpu_count_logical": static_info["cpu_count_logical"],
+        "cpu_count_physical": static_info["cpu_count_physical"],
+        "cpu_freq": cpu_freq._asdict() if cpu_freq else {},
+        "memory_total": memory.total,
+        "memory_available": memory.available,
+        "swap_total": snapshot.swap_memory().total,
+        "boot_time": static_info["boot_time"]
     }
 
-def get_network_info() -> Dict[str, Any]:
+def get_resource_usage(snapshot: Optional[SystemSnapshot] = None) -> Dict[str, Any]:
     """
-    Get network information.
+    Get current resource usage.
+
+    CPU figures cover the time since the previous reading, but never less
+    than MIN_CPU_SAMPLE_INTERVAL; the first call after import may block for
+    the rest of that window.
+
+    Args:
+        snapshot: Shared snapshot to read from; a private one is used if omitted.
 
     Returns:
-        Dictionary containing network information.
+        Dictionary containing resource usage information.
     """
-    network_info = {
-        "interfaces": {},
-        "connections": len(psutil.net_connections()),
-        "io_counters": psutil.net_io_counters()._asdict() if psutil.net_io_counters() else {}
+    snapshot = snapshot or SystemSnapshot()
+    return {
+        "cpu_percent": snapshot.cpu_percent(),
+        "cpu_per_core": snapshot.cpu_per_core(),
+        "memory": snapshot.virtual_memory()._asdict(),
+        "swap": snapshot.swap_memory()._asdict(),
+        "load_average": get_load_average()
     }
 
-    # Get interface information
+@memoize_decorator(NETWORK_INFO_TTL)
+def _get_interfaces() -> Dict[str, List[Dict[str, Any]]]:
+    """Addresses of each network interface, reused for NETWORK_INFO_TTL seconds."""
+    interfaces = {}
     for interface, addresses in psutil.net_if_addrs().items():
         interface_info = []
         for addr in addresses:
@@ -88,27 +269,53 @@ def get_network_info() -> Dict[str, Any]:
                 "netmask": addr.netmask,
                 "broadcast": addr.broadcast
             })
-        network_info["interfaces"][interface] = interface_info
+        interfaces[interface] = interface_info
+    return interfaces
 
-    return network_info
-
-def get_storage_info() -> Dict[str, Any]:
+def get_network_info(snapshot: Optional[SystemSnapshot] = None) -> Dict[str, Any]:
     """
-    Get storage information.
+    Get network information.
+
+    The interface list is cached for NETWORK_INFO_TTL seconds; connection
+    and I/O counters are read on every call.
+
+    Args:
+        snapshot: Shared snapshot to read from; a private one is used if omitted.
 
     Returns:
-        Dictionary containing storage information.
+        Dictionary containing network information.
     """
-    storage_info = {
-        "disks": {},
-        "io_counters": psutil.disk_io_counters()._asdict() if psutil.disk_io_counters() else {}
+    snapshot = snapshot or SystemSnapshot()
+    io_counters = snapshot.net_io_counters()
+    return {
+        "interfaces": copy.deepcopy(_get_interfaces()),
+        "connections": snapshot.connection_summary()[0],
+        "io_counters": io_counters._asdict() if io_counters else {}
     }
 
-    # Get disk usage for all mount points
-    for partition in psutil.disk_partitions():
-        try:
-            partition_usage = psutil.disk_usage(partition.mountpoint)
-            storage_info["disks"][partition.mountpoint] = {
+def _probe_partition(partition: Any) -> Optional[Any]:
+    """Return disk usage for a partition, or None if it cannot be read."""
+    try:
+        return psutil.disk_usage(partition.mountpoint)
+    except (PermissionError, OSError):
+        return None
+
+@memoize_decorator(STORAGE_INFO_TTL)
+def _get_disks() -> Dict[str, Dict[str, Any]]:
+    """Usage of each readable mount point, reused for STORAGE_INFO_TTL seconds."""
+    disks = {}
+
+    # Get disk usage for all mount points. statvfs() can block on network
+    # filesystems, so probe the mounts concurrently.
+    partitions = psutil.disk_partitions()
+    if partitions:
+        with ThreadPoolExecutor(max_workers=min(_STORAGE_WORKERS, len(partitions))) as executor:
+            usages = list(executor.map(_probe_partition, partitions))
+
+        for partition, partition_usage in zip(partitions, usages):
+            if partition_usage is None:
+                continue
+            disks[partition.mountpoint] = {
                 "device": partition.device,
                 "fstype": partition.fstype,
                 "total": partition_usage.total,
@@ -116,44 +323,125 @@ def get_storage_info() -> Dict[str, Any]:
                 "free": partition_usage.free,
                 "percent": (partition_usage.used / partition_usage.total) * 100 if partition_usage.total > 0 else 0
             }
-        except (PermissionError, OSError):
-            continue
 
-    return storage_info
+    return disks
+
+def get_storage_info(snapshot: Optional[SystemSnapshot] = None) -> Dict[str, Any]:
+    """
+    Get storage information.
+
+    Mount point usage is cached for STORAGE_INFO_TTL seconds; I/O counters
+    are read on every call.
+
+    Args:
+        snapshot: Shared snapshot to read from; a private one is used if omitted.
+
+    Returns:
+        Dictionary containing storage information.
+    """
+    snapshot = snapshot or SystemSnapshot()
+    io_counters = snapshot.disk_io_counters()
+    return {
+        "disks": copy.deepcopy(_get_disks()),
+        "io_counters": io_counters._asdict() if io_counters else {}
+    }
+
+def _count_pids_linux() -> int:
+    """Count running processes from the numeric entries in /proc."""
+    return sum(1 for name in os.listdir('/proc') if name.isdigit())
 
 def get_process_info(detailed: bool = True) -> Dict[str, Any]:
     """
     Get process information.
 
+    Results are cached for PROCESS_INFO_TTL seconds so that back-to-back
+    callers (e.g. `scan` and `processes`) share a single walk over all
+    processes.
+
     Args:
         detailed: Whether to include detailed process information.
 
     Returns:
         Dictionary containing process information.
     """
+    return copy.deepcopy(_collect_process_info(detailed))
+
+@memoize_decorator(PROCESS_INFO_TTL)
+def _collect_process_info(detailed: bool) -> Dict[str, Any]:
+    """Process counts and top processes, reused for PROCESS_INFO_TTL seconds."""
     process_info = {
-        "total_processes": len(psutil.pids()),
+        "total_processes": _count_pids_linux() if sys.platform.startswith("linux") else len(psutil.pids()),
         "top_cpu": [],
         "top_memory": []
     }
 
     if detailed:
-        # Get top processes by CPU and memory
-        processes = list(psutil.process_iter(['pid', 'name', 'username', 'cpu_percent', 'memory_percent', 'create_time']))
+        global _process_cpu_primed
+        if not _process_cpu_primed:
+            # A Process' first cpu_percent() reading is always 0.0. Prime
+            # every process once and wait a single short window; process_iter
+            # reuses these Process objects, so later reads are meaningful.
+            for proc in psutil.process_iter():
+                try:
+                    proc.cpu_percent(interval=None)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+            time.sleep(_PROCESS_CPU_SAMPLE)
+            _process_cpu_primed = True
+
+        # Get top processes by CPU and memory. With an attrs list psutil
+        # collects each process' fields via as_dict() inside oneshot(), so
+        # /proc/<pid>/stat is read once per process rather than per field.
+        processes = list(psutil.process_iter(['pid', 'name', 'username', 'status', 'cpu_percent', 'memory_percent']))
+
+        # Only five of each are needed, so select them without a full sort
+        top_cpu = heapq.nlargest(5, processes, key=lambda p: p.info['cpu_percent'] or 0)
+        top_memory = heapq.nlargest(5, processes, key=lambda p: p.info['memory_percent'] or 0)
+
+        # Complete the top processes' records so callers need not reopen them
+        for proc in {p.pid: p for p in top_cpu + top_memory}.values():
+            try:
+                proc.info.update(proc.as_dict(attrs=_TOP_PROCESS_ATTRS))
+            except psutil.NoSuchProcess:
+                proc.info.update(dict.fromkeys(_TOP_PROCESS_ATTRS))
+
+        process_info["top_cpu"] = [p.info for p in top_cpu]
+        process_info["top_memory"] = [p.info for p in top_memory]
 
-        # Sort by CPU usage
-        processes_by_cpu = sorted(processes,
-                                key=lambda x: x.info.get('cpu_percent', 0),
-                                reverse=True)
-        process_info["top_cpu"] = [p.info for p in processes_by_cpu[:5]]
+    return process_info
+
+def _list_systemd_services() -> Optional[List[Dict[str, str]]]:
+    """
+    List service units through systemd's D-Bus API.
 
-        # Sort by memory usage
-        processes_by_memory = sorted(processes,
-                                   key=lambda x: x.info.get('memory_percent', 0),
-                                   reverse=True)
-        process_info["top_memory"] = [p.info for p in processes_by_memory[:5]]
+    Mirrors `systemctl list-units --type=service`: inactive units without a
+    pending job are left out.
 
-    return process_info
+    Returns:
+        List of service records (ServiceInfo fields), or None if systemd
+        could not be queried.
+    """
+    try:
+        with SystemdManager() as manager:
+            units = manager.Manager.ListUnits()
+    except Exception as e:
+        logger.debug(f"Failed to list units over D-Bus: {e}")
+        return None
+
+    services = []
+    for name, description, load, active, sub, _following, _path, job_id, *_ in units:
+        name = name.decode()
+        active = active.decode()
+        if not name.endswith('.service') or (active == 'inactive' and not job_id):
+            continue
+        services.append({
+            "name": name,
+            "load": load.decode(),
+            "active": active,
+            "sub": sub.decode(),
+            "description": description.decode()
+        })
+    return services
 
 def get_services_info() -> Dict[str, Any]:
     """
@@ -162,31 +450,36 @@ def get_services_info() -> Dict[str, Any]:
     Returns:
         Dictionary containing services information.
     """
-    import subprocess
-    from ..models import ServiceInfo
-    
-    services = []
+    # Records are built as plain dicts with the ServiceInfo fields, which is
+    # the form they are returned in
+    services: List[Dict[str, str]] = []
     
     try:
-        if platform.system() == "Linux":
-            # Use systemctl to list services
-            result = subprocess.run(
-                ['systemctl', 'list-units', '--type=service', '--no-pager'],
-                capture_output=True, text=True, check=True
-            )
-            for line in result.stdout.split('\n')[1:]:  # Skip header
-                if line.strip() and not line.startswith('●'):
-                    parts = line.split()
-                    if len(parts) >= 4:
-                        services.append(ServiceInfo(
-                            name=parts[0],
-                            load=parts[1],
-                            active=parts[2],
-                            sub=parts[3],
-                            description=" ".join(parts[4:]) if len(parts) > 4 else ""
-                        ))
-
-        elif platform.system() == "Darwin":  # macOS
+        if sys.platform.startswith("linux"):
+            # Ask systemd over D-Bus when possible to avoid spawning systemctl
+            systemd_services = _list_systemd_services() if PYSTEMD_AVAILABLE else None
+            if systemd_services is not None:
+                services = systemd_services
+            else:
+                # Use systemctl to list services
+                result = subprocess.run(
+                    ['systemctl', 'list-units', '--type=service', '--no-pager'],
+                    capture_output=True, text=True, check=True
+                )
+                for line in result.stdout.split('\n')[1:]:  # Skip header
+                    if line.strip() and not line.startswith('●'):
+                        # At most five fields; the description keeps its spaces
+                        parts = line.split(None, 4)
+                        if len(parts) >= 4:
+                            services.append({
+                                "name": parts[0],
+                                "load": parts[1],
+                                "active": parts[2],
+                                "sub": parts[3],
+                                "description": parts[4] if len(parts) > 4 else ""
+                            })
+
+        elif sys.platform == "darwin":  # macOS
             # Use launchctl to list services
             result = subprocess.run(
                 ['launchctl', 'list'],
@@ -194,34 +487,38 @@ def get_services_info() -> Dict[str, Any]:
             )
             for line in result.stdout.split('\n')[1:]:  # Skip header
                 if line.strip():
-                    parts = line.split('\t')
+                    parts = line.split('\t', 2)
                     if len(parts) >= 3:
-                        services.append(ServiceInfo(
-                            name=parts[2],
-                            load=parts[0] if parts[0] != '-' else "-",
-                            active=parts[1],
-                            sub="",
-                            description=parts[2]
-                        ))
+                        services.append({
+                            "name": parts[2],
+                            "load": parts[0] if parts[0] != '-' else "-",
+                            "active": parts[1],
+                            "sub": "",
+                            "description": parts[2]
+                        })
 
     except (subprocess.SubprocessError, FileNotFoundError) as e:
-        import logging
-        logging.warning(f"Failed to retrieve service information: {e}")
+        logger.warning(f"Failed to retrieve service information: {e}")
 
+    states = Counter(service["active"] for service in services)
     return {
         "total_services": len(services),
-        "active_services": sum(1 for s in services if getattr(s, 'active', '') == 'active'),
-        "failed_services": sum(1 for s in services if getattr(s, 'active', '') == 'failed'),
-        "services": [s.__dict__ for s in services]
+        "active_services": states["active"],
+        "failed_services": states["failed"],
+        "services": services
     }
 
-def get_security_status() -> Dict[str, Any]:
+def get_security_status(snapshot: Optional[SystemSnapshot] = None) -> Dict[str, Any]:
     """
     Get basic security status.
 
+    Args:
+        snapshot: Shared snapshot to read from; a private one is used if omitted.
+
     Returns:
         Dictionary containing security status information.
     """
+    snapshot = snapshot or SystemSnapshot()
     security_status = {
         "firewall_enabled": False,
         "ssh_connections": 0,
@@ -230,24 +527,12 @@ def get_security_status() -> Dict[str, Any]:
     }
 
     try:
-        # Check for SSH connections
-        ssh_connections = [
-            conn for conn in psutil.net_connections()
-            if conn.laddr and conn.laddr.port == 22 and conn.status == 'ESTABLISHED'
-        ]
-        security_status["ssh_connections"] = len(ssh_connections)
-
-        # List open ports
-        open_ports = [
-            conn.laddr.port 
-            for conn in psutil.net_connections()
-            if conn.status == 'LISTEN' and conn.laddr
-        ]
-        security_status["open_ports"] = sorted(set(open_ports))
+        _, ssh_connections, open_ports = snapshot.connection_summary()
+        security_status["ssh_connections"] = ssh_connections
+        security_status["open_ports"] = list(open_ports)
 
     except Exception as e:
-        import logging
-        logging.warning(f"Failed to get security status: {e}")
+        logger.warning(f"Failed to get security status: {e}")
 
     return security_status
 
@@ -275,3 +560,60 @@ def get_uptime() -> str:
     boot_time = datetime.fromtimestamp(psutil.boot_time())
     uptime = datetime.now() - boot_time
     return str(uptime).split('.')[0]  # Remove microseconds
+
+def get_collectors(snapshot: Optional[SystemSnapshot] = None,
+                   quick: bool = False) -> Dict[str, Callable[[], Dict[str, Any]]]:
+    """
+    Get the collectors that make up a system scan.
+
+    Args:
+        snapshot: Snapshot shared by the collectors; a new one is used if omitted.
+        quick: Leave out the heavier process, service and security collectors.
+
+    Returns:
+        Dictionary mapping each scan section to a zero-argument collector.
+    """
+    snapshot = snapshot or SystemSnapshot()
+    collectors = {
+        "platform": get_platform_info,
+        "hardware": partial(get_hardware_info, snapshot=snapshot),
+        "resources": partial(get_resource_usage, snapshot=snapshot),
+        "network": partial(get_network_info, snapshot=snapshot),
+        "storage": partial(get_storage_info, snapshot=snapshot)
+    }
+    if not quick:
+        collectors["processes"] = partial(get_process_info, detailed=True)
+        collectors["services"] = get_services_info
+        collectors["security"] = partial(get_security_status, snapshot=snapshot)
+    return collectors
+
+async def gather_system_info(quick: bool = False,
+                             collectors: Optional[Dict[str, Callable[[], Dict[str, Any]]]] = None,
+                             on_collected: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    """
+    Collect every scan section concurrently.
+
+    Each collector runs in a worker thread via asyncio.to_thread, so the
+    blocking /proc reads, statvfs() calls and subprocesses overlap and the
+    wall time is that of the slowest collector.
+
+    Args:
+        quick: Leave out the heavier process, service and security collectors.
+        collectors: Collectors to run; get_collectors(quick=quick) if omitted.
+        on_collected: Called with each section's name as soon as it is collected.
+
+    Returns:
+        Dictionary mapping each scan section to its collected information,
+        in collector order.
+    """
+    if collectors is None:
+        collectors = get_collectors(quick=quick)
+
+    async def collect(name: str, collector: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        result = await asyncio.to_thread(collector)
+        if on_collected is not None:
+            on_collected(name)
+        return result
+
+    results = await asyncio.gather(*(collect(name, collector) for name, collector in collectors.items()))
+    return dict(zip(collectors, results))
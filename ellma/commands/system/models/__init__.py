@@ -4,11 +4,12 @@ Data models for system commands.
 This module contains the data models used throughout the system commands module.
 """
 
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
 
-@dataclass
+@dataclass(slots=True)
 class SystemInfo:
     """System information data model."""
     hostname: str
@@ -23,7 +24,7 @@ class SystemInfo:
     health_score: int = 0
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
-@dataclass
+@dataclass(slots=True)
 class ProcessInfo:
     """Process information data model."""
     pid: int
@@ -35,7 +36,7 @@ class ProcessInfo:
     runtime: str
     runtime_str: str
 
-@dataclass
+@dataclass(slots=True)
 class NetworkConnection:
     """Network connection information data model."""
     protocol: str
@@ -45,7 +46,7 @@ class NetworkConnection:
     pid: Optional[int] = None
     process_name: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ServiceInfo:
     """Service information data model."""
     name: str
@@ -54,7 +55,7 @@ class ServiceInfo:
     sub: str
     description: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class HealthStatus:
     """System health status data model."""
     status: str
@@ -67,12 +68,13 @@ class HealthStatus:
     alerts: List[str] = field(default_factory=list)
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
-@dataclass
+@dataclass(slots=True)
 class MonitoringData:
     """System monitoring data model."""
     timestamps: List[str] = field(default_factory=list)
-    cpu_usage: List[float] = field(default_factory=list)
-    memory_usage: List[float] = field(default_factory=list)
+    # Percent samples stored as C doubles rather than one object per sample
+    cpu_usage: array = field(default_factory=lambda: array('d'))
+    memory_usage: array = field(default_factory=lambda: array('d'))
     disk_io: List[Dict[str, float]] = field(default_factory=list)
     network_io: List[Dict[str, float]] = field(default_factory=list)
     statistics: Dict[str, float] = field(default_factory=dict)
@@ -7,14 +7,23 @@ including logging, cleanup, and validation.
 
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Tuple, Dict, Any
+from fnmatch import fnmatch
+from typing import Iterator, List, Optional, Tuple, Dict, Any
 import gzip
+import os
 import re
 import logging
+import time
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Bytes read per step when scanning a log file backwards
+_REVERSE_BLOCK_SIZE = 1 << 16
+
+# Example log format: 2023-11-15 12:34:56,789 - module.name - LEVEL - Message
+_LOG_LINE_RE = re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) - ([^ ]+) - ([A-Z]+) - (.+)')
+
 def parse_log_line(line: str) -> Optional[Tuple[datetime, str, str, str]]:
     """
     Parse a log line into timestamp, level, logger, and message.
@@ -25,20 +34,28 @@ def parse_log_line(line: str) -> Optional[Tuple[datetime, str, str, str]]:
     Returns:
         Tuple of (timestamp, level, logger_name, message) or None if parsing fails.
     """
-    # Example log format: 2023-11-15 12:34:56,789 - module.name - LEVEL - Message
-    pattern = r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) - ([^ ]+) - ([A-Z]+) - (.+)'
-    match = re.match(pattern, line)
+    match = _LOG_LINE_RE.match(line)
     if not match:
         return None
         
     timestamp_str, logger_name, level, message = match.groups()
     try:
-        # Convert timestamp string to datetime object
-        timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S,%f')
+        # The pattern fixes every field's position, so slice instead of strptime
+        timestamp = datetime(
+            int(timestamp_str[0:4]), int(timestamp_str[5:7]), int(timestamp_str[8:10]),
+            int(timestamp_str[11:13]), int(timestamp_str[14:16]), int(timestamp_str[17:19]),
+            int(timestamp_str[20:23]) * 1000
+        )
         return timestamp, level, logger_name, message
     except ValueError:
         return None
 
+# File name patterns for each log type
+_LOG_FILE_PATTERNS = {'system': 'system.log*', 'chat': 'chat.log*'}
+
+# get_log_files() listings keyed by (log dir, log type): (dir mtime_ns, files)
+_log_files_cache: Dict[Tuple[str, str], Tuple[int, List[Path]]] = {}
+
 def get_log_files(log_type: str = 'system') -> List[Path]:
     """
     Get log files for the specified log type.
@@ -49,12 +66,59 @@ def get_log_files(log_type: str = 'system') -> List[Path]:
     Returns:
         List of Path objects for the log files.
     """
+    pattern = _LOG_FILE_PATTERNS.get(log_type)
+    if pattern is None:
+        return []
+
     log_dir = Path.home() / ".ellma" / "logs"
-    if log_type == 'system':
-        return sorted(log_dir.glob('system.log*'))
-    elif log_type == 'chat':
-        return sorted(log_dir.glob('chat.log*'))
-    return []
+    try:
+        mtime_ns = log_dir.stat().st_mtime_ns
+    except OSError:
+        return []
+
+    # Creating, removing or renaming (rotating) a log updates the directory
+    # mtime, so an unchanged mtime means the listing is still valid
+    cache_key = (str(log_dir), log_type)
+    cached = _log_files_cache.get(cache_key)
+    if cached is None or cached[0] != mtime_ns:
+        cached = (mtime_ns, sorted(log_dir.glob(pattern)))
+        _log_files_cache[cache_key] = cached
+    return list(cached[1])
+
+def _reverse_lines(path: Path, block_size: int = _REVERSE_BLOCK_SIZE) -> Iterator[str]:
+    """
+    Yield the lines of a log file from last to first.
+
+    Plain files are read backwards in blocks, so only the part of the file
+    that is consumed is ever read. Compressed logs cannot be read backwards
+    and are decompressed in full.
+
+    Args:
+        path: Log file to read.
+        block_size: Number of bytes to read per seek.
+
+    Returns:
+        Iterator over the file's lines, newest first.
+    """
+    # Handle compressed logs
+    if path.suffix == '.gz':
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            yield from reversed(f.readlines())
+        return
+
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b''
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + remainder).split(b'\n')
+            # The first piece may continue in the previous block
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                yield line.decode('utf-8')
+        yield remainder.decode('utf-8')
 
 def read_logs(log_type: str = 'system', since: Optional[timedelta] = None) -> List[str]:
     """
@@ -76,16 +140,8 @@ def read_logs(log_type: str = 'system', since: Optional[timedelta] = None) -> Li
     
     for log_file in reversed(log_files):  # Start from most recent logs first
         try:
-            # Handle compressed logs
-            if log_file.suffix == '.gz':
-                with gzip.open(log_file, 'rt', encoding='utf-8') as f:
-                    lines = f.readlines()
-            else:
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-            
             # Process lines in reverse order (newest first)
-            for line in reversed(lines):
+            for line in _reverse_lines(log_file):
                 line = line.strip()
                 if not line:
                     continue
@@ -125,6 +181,16 @@ def get_level_style(level: str) -> str:
     }
     return styles.get(level, '')
 
+# Numeric levels (logging module constants) by level name
+_LEVEL_NUMBERS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL
+}
+_LEVEL_RE = re.compile(r' - (DEBUG|INFO|WARNING|ERROR|CRITICAL) - ')
+
 def get_numeric_log_level(log_entry: str) -> int:
     """
     Get numeric log level from log entry.
@@ -135,47 +201,93 @@ def get_numeric_log_level(log_entry: str) -> int:
     Returns:
         Numeric log level (matching logging module constants).
     """
-    level_map = {
-        'DEBUG': logging.DEBUG,
-        'INFO': logging.INFO,
-        'WARNING': logging.WARNING,
-        'ERROR': logging.ERROR,
-        'CRITICAL': logging.CRITICAL
-    }
-    
-    for level_name, level_num in level_map.items():
-        if f" - {level_name} - " in log_entry:
-            return level_num
+    match = _LEVEL_RE.search(log_entry)
+    if match:
+        return _LEVEL_NUMBERS[match.group(1)]
     return logging.DEBUG  # Default to DEBUG if level not found
 
-def cleanup_temp_files() -> int:
+def _walk_old_files(root: str, cutoff: float, pattern: str = '*') -> Iterator[os.DirEntry]:
     """
-    Clean temporary files.
+    Yield regular files under a directory last modified before a cutoff.
+
+    Uses os.scandir so file types and modification times come from the
+    directory listing instead of separate stat() calls per path. Symlinks
+    are neither followed nor yielded, and subdirectories that cannot be
+    read are skipped.
+
+    Args:
+        root: Directory to walk.
+        cutoff: Epoch timestamp; files modified before it are yielded.
+        pattern: Glob pattern file names must match.
 
     Returns:
-        Number of files cleaned up.
+        Iterator over matching directory entries.
+
+    Raises:
+        OSError: If `root` itself cannot be read.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            if directory == root:
+                raise
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif (entry.is_file(follow_symlinks=False)
+                          and fnmatch(entry.name, pattern)
+                          and entry.stat(follow_symlinks=False).st_mtime < cutoff):
+                        yield entry
+                except OSError:
+                    continue
+
+def _remove_old_files(directories: List[str], max_age: float, pattern: str = '*') -> int:
+    """
+    Remove files older than `max_age` seconds from the given directories.
+
+    Args:
+        directories: Directories to clean; missing ones are skipped.
+        max_age: Minimum age in seconds of files to remove.
+        pattern: Glob pattern file names must match.
+
+    Returns:
+        Number of files removed.
     """
     cleaned_count = 0
-    temp_dirs = ["/tmp", "/var/tmp", str(Path.home() / "tmp")]
+    cutoff = time.time() - max_age
 
-    for temp_dir in temp_dirs:
-        temp_path = Path(temp_dir)
-        if temp_path.exists():
-            try:
-                for file_path in temp_path.rglob("*"):
-                    if file_path.is_file():
-                        try:
-                            # Only remove files older than 7 days
-                            if file_path.stat().st_mtime < (time.time() - 7 * 24 * 3600):
-                                file_path.unlink()
-                                cleaned_count += 1
-                        except (OSError, PermissionError):
-                            continue
-            except (OSError, PermissionError) as e:
-                logger.warning(f"Error cleaning temp directory {temp_dir}: {e}")
+    for directory in directories:
+        if not os.path.isdir(directory):
+            continue
+        try:
+            for entry in _walk_old_files(directory, cutoff, pattern):
+                try:
+                    os.unlink(entry.path)
+                    cleaned_count += 1
+                except OSError:
+                    continue
+        except OSError as e:
+            logger.warning(f"Error cleaning directory {directory}: {e}")
 
     return cleaned_count
 
+def cleanup_temp_files() -> int:
+    """
+    Clean temporary files.
+
+    Returns:
+        Number of files cleaned up.
+    """
+    temp_dirs = ["/tmp", "/var/tmp", str(Path.home() / "tmp")]
+    # Only remove files older than 7 days
+    return _remove_old_files(temp_dirs, 7 * 24 * 3600)
+
 def cleanup_old_logs() -> int:
     """
     Clean old log files.
@@ -183,26 +295,12 @@ def cleanup_old_logs() -> int:
     Returns:
         Number of log files cleaned up.
     """
-    cleaned_count = 0
     log_dirs = ["/var/log", str(Path.home() / ".local" / "share" / "logs")]
+    # Remove log files older than 30 days
+    return _remove_old_files(log_dirs, 30 * 24 * 3600, "*.log*")
 
-    for log_dir in log_dirs:
-        log_path = Path(log_dir)
-        if log_path.exists():
-            try:
-                for file_path in log_path.rglob("*.log*"):
-                    if file_path.is_file():
-                        try:
-                            # Remove log files older than 30 days
-                            if file_path.stat().st_mtime < (time.time() - 30 * 24 * 3600):
-                                file_path.unlink()
-                                cleaned_count += 1
-                        except (OSError, PermissionError):
-                            continue
-            except (OSError, PermissionError) as e:
-                logger.warning(f"Error cleaning log directory {log_dir}: {e}")
-
-    return cleaned_count
+# (usage percent, penalty) pairs for disks, checked from the highest threshold
+_DISK_PENALTY_THRESHOLDS = ((95, 20), (85, 10), (75, 3))
 
 def calculate_health_score(scan_results: Dict[str, Any]) -> int:
     """
@@ -239,12 +337,8 @@ def calculate_health_score(scan_results: Dict[str, Any]) -> int:
     storage = scan_results.get("storage", {}).get("disks", {})
     for disk_info in storage.values():
         disk_usage = disk_info.get("percent", 0)
-        if disk_usage > 95:
-            score -= 20
-        elif disk_usage > 85:
-            score -= 10
-        elif disk_usage > 75:
-            score -= 3
+        score -= next((penalty for threshold, penalty in _DISK_PENALTY_THRESHOLDS
+                       if disk_usage > threshold), 0)
 
     # Security considerations
     security = scan_results.get("security", {})
@@ -5,9 +5,15 @@ This module provides web-related commands for HTTP requests, web scraping,
 content extraction, and web automation tasks.
 """
 
+import asyncio
+import os
 import re
+import ssl
+import threading
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import Dict, List, Any, Optional, Union
 from urllib.parse import urljoin, urlparse, parse_qs
 from datetime import datetime
@@ -31,6 +37,14 @@ except ImportError:
     HAS_BS4 = False
     BeautifulSoup = None
 
+try:
+    import aiohttp
+
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+    aiohttp = None
+
 try:
     from selenium import webdriver
     from selenium.webdriver.common.by import By
@@ -42,6 +56,11 @@ except ImportError:
     HAS_SELENIUM = False
 
 
+# Concurrency limits for link checks and multi-URL monitoring
+LINK_CHECK_WORKERS = 20
+MAX_REQUESTS_PER_HOST = 4
+
+
 class WebCommands(BaseCommand):
     """
     Web Commands Module
@@ -86,6 +105,10 @@ class WebCommands(BaseCommand):
         self._cache = {}
         self._cache_ttl = 300  # 5 minutes
 
+        # Per-host request limits for concurrent link checks
+        self._host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_semaphores_lock = threading.Lock()
+
     @validate_args(str)
     @log_execution
     @timeout(30)
@@ -101,14 +124,22 @@ class WebCommands(BaseCommand):
         Returns:
             Response data including status, headers, and content
         """
-        cache_key = f"GET:{url}:{json.dumps(params, sort_keys=True)}"
+        return self._get(url, headers=headers, params=params)
+
+    def _get(self, url: str, headers: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Perform HTTP GET request without the SIGALRM command timeout
+
+        The request timeout bounds the call instead, so this is safe to use
+        from worker threads, where signal handlers cannot be installed.
+        """
+        cache_key = self._cache_key(url, params)
 
         # Check cache
-        if cache_key in self._cache:
-            cached_response, timestamp = self._cache[cache_key]
-            if time.time() - timestamp < self._cache_ttl:
-                logger.debug(f"Returning cached response for {url}")
-                return cached_response
+        cached_response = self._cached_response(cache_key)
+        if cached_response is not None:
+            logger.debug(f"Returning cached response for {url}")
+            return cached_response
 
         try:
             response = self.session.get(
@@ -119,31 +150,115 @@ class WebCommands(BaseCommand):
                 allow_redirects=True
             )
 
-            result = {
-                'url': response.url,
-                'status_code': response.status_code,
-                'headers': dict(response.headers),
-                'content': response.text,
-                'content_length': len(response.content),
-                'encoding': response.encoding,
-                'elapsed': response.elapsed.total_seconds(),
-                'timestamp': datetime.now().isoformat()
-            }
+            result = self._build_response(
+                url=response.url,
+                status_code=response.status_code,
+                headers=response.headers,
+                content=response.text,
+                content_length=len(response.content),
+                encoding=response.encoding,
+                elapsed=response.elapsed.total_seconds()
+            )
+            self._cache_response(cache_key, result)
+            return result
+
+        except requests.RequestException as e:
+            logger.error(f"HTTP GET failed for {url}: {e}")
+            return self._error_response(url, e)
 
-            # Cache successful responses
-            if response.status_code == 200:
-                self._cache[cache_key] = (result, time.time())
+    @log_execution
+    def get_many(self, urls: List[str], headers: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """
+        Perform HTTP GET requests for several URLs concurrently
+
+        Requires aiohttp and must be called outside a running event loop;
+        otherwise the URLs are fetched one after another with get(). Code
+        running in an event loop should await aget_many() instead. Cached
+        responses are reused either way.
+
+        Args:
+            urls: Target URLs
+            headers: Optional custom headers sent with every request
+
+        Returns:
+            Response data for each URL, in the order given
+        """
+        if HAS_AIOHTTP:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self._fetch_many(urls, headers))
+            # asyncio.run cannot be nested inside a running event loop
+            logger.debug("get_many called from a running event loop, fetching serially; use aget_many")
+
+        return [self._get_page(url, headers=headers) for url in urls]
+
+    async def aget_many(self, urls: List[str], headers: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """
+        Perform HTTP GET requests for several URLs concurrently from a coroutine
+
+        Awaitable counterpart of get_many() for callers already running in an
+        event loop. Without aiohttp the URLs are fetched one after another in
+        a worker thread, so the loop is never blocked.
+
+        Args:
+            urls: Target URLs
+            headers: Optional custom headers sent with every request
 
+        Returns:
+            Response data for each URL, in the order given
+        """
+        if HAS_AIOHTTP:
+            return await self._fetch_many(urls, headers)
+
+        return await asyncio.to_thread(lambda: [self._get(url, headers=headers) for url in urls])
+
+    async def _fetch_many(self, urls: List[str], headers: Optional[Dict]) -> List[Dict[str, Any]]:
+        """Fetch URLs over one pooled aiohttp session"""
+        # The session lives for one batch: aiohttp sessions are bound to the
+        # event loop, and asyncio.run creates a new loop per batch. It takes
+        # the requests session's headers, TLS verification and proxy settings
+        # so both paths fetch a URL the same way.
+        connector = aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=30,
+                                         ssl=self._ssl_setting())
+        async with aiohttp.ClientSession(
+            connector=connector,
+            headers=dict(self.session.headers),
+            timeout=aiohttp.ClientTimeout(total=30),
+            trust_env=self.session.trust_env
+        ) as session:
+            return await asyncio.gather(*(self._fetch(session, url, headers) for url in urls))
+
+    async def _fetch(self, session, url: str, headers: Optional[Dict]) -> Dict[str, Any]:
+        """Fetch a single URL, returning the same response data as get()"""
+        cache_key = self._cache_key(url)
+
+        # Check cache
+        cached_response = self._cached_response(cache_key)
+        if cached_response is not None:
+            logger.debug(f"Returning cached response for {url}")
+            return cached_response
+
+        try:
+            start_time = time.time()
+            async with session.get(url, headers=headers, allow_redirects=True,
+                                   proxy=self._proxy_for(url)) as response:
+                body = await response.read()
+                result = self._build_response(
+                    url=str(response.url),
+                    status_code=response.status,
+                    headers=response.headers,
+                    content=await response.text(errors='replace'),
+                    content_length=len(body),
+                    encoding=response.charset,
+                    elapsed=time.time() - start_time
+                )
+            self._cache_response(cache_key, result)
             return result
 
-        except requests.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"HTTP GET failed for {url}: {e}")
-            return {
-                'url': url,
-                'status_code': 0,
-                'error': str(e),
-                'timestamp': datetime.now().isoformat()
-            }
+            return self._error_response(url, e)
 
     @validate_args(str)
     @log_execution
@@ -246,14 +361,14 @@ class WebCommands(BaseCommand):
         # Get the page
         response_data = None
         try:
-            response_data = self.get(url)
+            response_data = self._get_page(url)
         except requests.exceptions.MissingSchema as e:
             # If https:// fails, try with http://
             if url.startswith('https://'):
                 http_url = url.replace('https://', 'http://', 1)
                 logger.info(f"HTTPS failed, trying HTTP - URL: {http_url}")
                 try:
-                    response_data = self.get(http_url)
+                    response_data = self._get_page(http_url)
                 except Exception as http_error:
                     # Log both errors
                     log_command_error(
@@ -417,12 +532,13 @@ class WebCommands(BaseCommand):
 
     @validate_args(str)
     @log_execution
-    def analyze_links(self, url: str) -> Dict[str, Any]:
+    def analyze_links(self, url: str, check_links: bool = False) -> Dict[str, Any]:
         """
         Analyze all links on a webpage
 
         Args:
             url: Target URL
+            check_links: Request every http(s) link to count broken ones
 
         Returns:
             Link analysis results
@@ -472,30 +588,122 @@ class WebCommands(BaseCommand):
                 if any(social in link_domain for social in social_domains):
                     analysis['social_links'] += 1
 
+        # Optionally check the web links concurrently; each unique URL is requested once
+        web_links = [link.get('url', '') for link in links
+                     if link.get('url', '').startswith(('http://', 'https://'))]
+        unique_links = list(dict.fromkeys(web_links))
+        if check_links and unique_links:
+            with ThreadPoolExecutor(max_workers=min(LINK_CHECK_WORKERS, len(unique_links))) as executor:
+                broken = dict(zip(unique_links, executor.map(self._is_broken_link, unique_links)))
+            analysis['broken_links'] = sum(1 for link_url in web_links if broken[link_url])
+
         # Convert set to list for JSON serialization
         analysis['domains'] = list(analysis['domains'])
 
         return analysis
 
     @log_execution
-    def monitor_changes(self, url: str, check_interval: int = 300, max_checks: int = 10) -> List[Dict[str, Any]]:
+    def monitor_changes(self, url: Union[str, List[str]], check_interval: int = 300,
+                        max_checks: int = 10) -> List[Dict[str, Any]]:
         """
-        Monitor a webpage for changes
+        Monitor one or more webpages for changes
+
+        Several URLs are monitored concurrently, each on its own schedule
+        and thread; requests to one host are limited to
+        MAX_REQUESTS_PER_HOST at a time.
 
         Args:
-            url: URL to monitor
+            url: URL, or list of URLs, to monitor
             check_interval: Check interval in seconds
             max_checks: Maximum number of checks
 
         Returns:
             List of change events
         """
+        if isinstance(url, str):
+            return self._monitor_url(url, check_interval, max_checks)
+
+        if not url:
+            return []
+
+        # One thread per page: each runs its whole monitoring loop, so a
+        # smaller pool would leave the remaining pages unchecked until then
+        with ThreadPoolExecutor(max_workers=len(url)) as executor:
+            results = executor.map(lambda target: self._monitor_url(target, check_interval, max_checks), url)
+            return list(chain.from_iterable(results))
+
+    # Helper methods
+
+    def _cache_key(self, url: str, params: Optional[Dict] = None) -> str:
+        """Build the response cache key for a GET request"""
+        return f"GET:{url}:{json.dumps(params, sort_keys=True)}"
+
+    def _cached_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached response if it is still within the cache TTL"""
+        if cache_key in self._cache:
+            cached_response, timestamp = self._cache[cache_key]
+            if time.time() - timestamp < self._cache_ttl:
+                return cached_response
+        return None
+
+    def _cache_response(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """Cache a GET response if it was successful"""
+        if result['status_code'] == 200:
+            self._cache[cache_key] = (result, time.time())
+
+    def _build_response(self, url: str, status_code: int, headers, content: str,
+                        content_length: int, encoding: Optional[str], elapsed: float) -> Dict[str, Any]:
+        """Build the response data returned by get() and get_many()"""
+        return {
+            'url': url,
+            'status_code': status_code,
+            'headers': dict(headers),
+            'content': content,
+            'content_length': content_length,
+            'encoding': encoding,
+            'elapsed': elapsed,
+            'timestamp': datetime.now().isoformat()
+        }
+
+    def _error_response(self, url: str, error: Exception) -> Dict[str, Any]:
+        """Build the response data for a request that failed"""
+        return {
+            'url': url,
+            'status_code': 0,
+            'error': str(error),
+            'timestamp': datetime.now().isoformat()
+        }
+
+    def _ssl_setting(self) -> Union[bool, ssl.SSLContext]:
+        """Translate the requests session's verify setting for aiohttp"""
+        verify = self.session.verify
+        if isinstance(verify, str):
+            # A CA bundle file or a directory of certificates
+            if os.path.isdir(verify):
+                return ssl.create_default_context(capath=verify)
+            return ssl.create_default_context(cafile=verify)
+        return bool(verify)
+
+    def _proxy_for(self, url: str) -> Optional[str]:
+        """Get the proxy the requests session would use for a URL"""
+        proxies = self.session.proxies or {}
+        return proxies.get(urlparse(url).scheme) or proxies.get('all')
+
+    def _get_page(self, url: str, headers: Optional[Dict] = None) -> Dict[str, Any]:
+        """GET a page, using the command timeout only on the main thread"""
+        if threading.current_thread() is threading.main_thread():
+            return self.get(url, headers=headers)
+        return self._get(url, headers=headers)
+
+    def _monitor_url(self, url: str, check_interval: int, max_checks: int) -> List[Dict[str, Any]]:
+        """Poll a single webpage and collect its change events"""
         changes = []
         previous_content = None
 
         for check in range(max_checks):
             try:
-                current_data = self.read(url, extract_text=True)
+                with self._host_semaphore(url):
+                    current_data = self.read(url, extract_text=True)
                 current_content = current_data.get('text', '')
                 current_hash = hash(current_content)
 
@@ -523,7 +731,27 @@ class WebCommands(BaseCommand):
 
         return changes
 
-    # Helper methods
+    def _host_semaphore(self, url: str) -> threading.BoundedSemaphore:
+        """Get the semaphore limiting concurrent requests to a URL's host"""
+        # read() accepts URLs without a scheme, which urlparse sees as a path
+        host = urlparse(url if '://' in url else f'https://{url}').netloc
+        with self._host_semaphores_lock:
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST)
+            return self._host_semaphores[host]
+
+    def _is_broken_link(self, url: str) -> bool:
+        """Check whether a link fails to load, without downloading the page"""
+        with self._host_semaphore(url):
+            try:
+                response = self.session.head(url, timeout=5, allow_redirects=True)
+                # Some servers do not implement HEAD; ask for the headers via GET
+                if response.status_code in (405, 501):
+                    response = self.session.get(url, timeout=5, allow_redirects=True, stream=True)
+                    response.close()
+                return response.status_code >= 400
+            except requests.RequestException:
+                return True
 
     def _parse_bool(self, value) -> bool:
         """Parse boolean values from various string representations"""
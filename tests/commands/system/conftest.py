@@ -0,0 +1,46 @@
+"""
+Fixtures for the system command package tests.
+
+ellma/commands/system/ has no __init__.py and is shadowed by the
+ellma/commands/system.py module, so its modules cannot be imported as
+ellma.commands.system.*. They are loaded under a separate package name.
+"""
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+import ellma
+
+SYSTEM_PACKAGE_DIR = Path(ellma.__file__).parent / "commands" / "system"
+SYSTEM_PACKAGE = "_ellma_system"
+
+
+def _import_system_module(name: str) -> types.ModuleType:
+    """Import a module of the system command package by its relative name."""
+    if SYSTEM_PACKAGE not in sys.modules:
+        package = types.ModuleType(SYSTEM_PACKAGE)
+        package.__path__ = [str(SYSTEM_PACKAGE_DIR)]
+        sys.modules[SYSTEM_PACKAGE] = package
+    return importlib.import_module(f"{SYSTEM_PACKAGE}.{name}")
+
+
+@pytest.fixture
+def system_core():
+    """The system core collectors module."""
+    return _import_system_module("core")
+
+
+@pytest.fixture
+def system_utils():
+    """The system utilities module."""
+    return _import_system_module("utils")
+
+
+@pytest.fixture
+def load_command():
+    """Return a loader for modules of the system commands package."""
+    return lambda name: _import_system_module(f"commands.{name}")
@@ -0,0 +1,63 @@
+"""
+Tests for the system cleanup command.
+"""
+
+import pytest
+from rich.console import Console
+
+
+@pytest.fixture
+def cleanup_command(load_command):
+    """Create a cleanup command that records its console output."""
+    cleanup = load_command("cleanup")
+    return cleanup.CleanupCommand(console=Console(record=True, width=120))
+
+
+def _summary_results(dry_run):
+    return {
+        "tasks": {
+            "temp_files": {"deleted": 3, "freed": 2048, "failed": 1},
+            "log_files": {"deleted": 2, "freed": 1024, "failed": 0},
+        },
+        "total_files": 5,
+        "total_freed": 3072,
+        "dry_run": dry_run,
+    }
+
+
+def test_dry_run_summary_reports_failures(cleanup_command):
+    """Test that a dry run summary shows files that could not be checked."""
+    cleanup_command._display_summary(_summary_results(dry_run=True))
+    output = cleanup_command.console.export_text()
+
+    assert "DRY RUN" in output
+    assert "Would Delete" in output
+    assert "Space To Free" in output
+    assert "Failed" in output
+    assert "Some operations failed" in output
+    assert "Temp Files" in output
+    assert "Total space to free: 3.0 KB" in output
+
+
+def test_dry_run_summary_without_failures(cleanup_command):
+    """Test that a dry run without failures leaves out the failed column."""
+    results = _summary_results(dry_run=True)
+    results["tasks"]["temp_files"]["failed"] = 0
+    cleanup_command._display_summary(results)
+    output = cleanup_command.console.export_text()
+
+    assert "Would Delete" in output
+    assert "Failed" not in output
+    assert "Some operations failed" not in output
+
+
+def test_summary_reports_failures(cleanup_command):
+    """Test that a real run summary includes the failed column and warning."""
+    cleanup_command._display_summary(_summary_results(dry_run=False))
+    output = cleanup_command.console.export_text()
+
+    assert "DRY RUN" not in output
+    assert "Files Deleted" in output
+    assert "Failed" in output
+    assert "Some operations failed" in output
+    assert "Total space freed: 3.0 KB" in output
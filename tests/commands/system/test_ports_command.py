@@ -0,0 +1,125 @@
+"""
+Tests for the system ports command.
+"""
+
+import socket
+import threading
+import time
+from collections import namedtuple
+from unittest.mock import MagicMock
+
+import pytest
+from rich.console import Console
+
+Addr = namedtuple("Addr", ["ip", "port"])
+Conn = namedtuple("Conn", ["fd", "family", "type", "laddr", "raddr", "status", "pid"])
+
+
+@pytest.fixture
+def ports(load_command):
+    return load_command("ports")
+
+
+@pytest.fixture
+def net_connections(ports, monkeypatch):
+    """Replace psutil.net_connections with a mock returning a small table."""
+    mock = MagicMock(return_value=[
+        Conn(3, socket.AF_INET, socket.SOCK_STREAM, Addr("0.0.0.0", 22), (), "LISTEN", None),
+        Conn(4, socket.AF_INET, socket.SOCK_STREAM, Addr("10.0.0.2", 22),
+             Addr("10.0.0.3", 50000), "ESTABLISHED", None),
+        Conn(5, socket.AF_INET, socket.SOCK_DGRAM, Addr("0.0.0.0", 53), (), "NONE", None),
+    ])
+    monkeypatch.setattr(ports.psutil, "net_connections", mock)
+    return mock
+
+
+def test_listening_only_reads_tcp_sockets(ports, net_connections):
+    """Test that listing listening ports only asks psutil for TCP sockets."""
+    command = ports.PortsCommand(console=Console(record=True))
+
+    connections = list(command._get_connections(listening_only=True, resolve=False, process_info=False))
+
+    net_connections.assert_called_once_with(kind="tcp")
+    assert [conn["local_endpoint"] for conn in connections] == ["0.0.0.0:22"]
+
+
+def test_all_connections_read_inet_sockets(ports, net_connections):
+    """Test that listing all connections includes UDP sockets."""
+    command = ports.PortsCommand(console=Console(record=True))
+
+    connections = list(command._get_connections(listening_only=False, resolve=False, process_info=False))
+
+    net_connections.assert_called_once_with(kind="inet")
+    assert [conn["local_port"] for conn in connections] == [22, 22, 53]
+    assert connections[1]["remote_endpoint"] == "10.0.0.3:50000"
+
+
+@pytest.fixture
+def established(ports, monkeypatch):
+    """Replace psutil.net_connections with six established connections."""
+    mock = MagicMock(return_value=[
+        Conn(3 + i, socket.AF_INET, socket.SOCK_STREAM, Addr("10.0.0.2", 40000 + i),
+             Addr(f"192.0.2.{i + 1}", 443), "ESTABLISHED", None)
+        for i in range(6)
+    ])
+    monkeypatch.setattr(ports.psutil, "net_connections", mock)
+    monkeypatch.setattr(ports, "_hostname_cache", {})
+    monkeypatch.setattr(ports, "_pending_lookups", {})
+    return mock
+
+
+@pytest.fixture
+def hanging_resolver(ports, monkeypatch):
+    """Make every reverse lookup hang until the test finishes."""
+    release = threading.Event()
+    calls = []
+
+    def getnameinfo(sockaddr, flags):
+        calls.append(sockaddr[0])
+        release.wait(10)
+        raise socket.herror("no name")
+
+    monkeypatch.setattr(ports.socket, "getnameinfo", getnameinfo)
+    yield calls
+    release.set()
+    # Let the lookups finish before the next test swaps the hostname cache
+    deadline = time.monotonic() + 5
+    while ports._pending_lookups and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_hanging_resolver_costs_one_deadline(ports, established, hanging_resolver):
+    """Test that hung lookups delay a listing by one shared deadline, not one per row."""
+    command = ports.PortsCommand(console=Console(record=True))
+
+    start = time.monotonic()
+    connections = list(command._get_connections(listening_only=False, resolve=True, process_info=False))
+    elapsed = time.monotonic() - start
+
+    assert elapsed < ports._RESOLVE_TIMEOUT + 0.5
+    assert [conn["remote_endpoint"] for conn in connections] == [
+        f"192.0.2.{i + 1}:443" for i in range(6)
+    ]
+    # Each unique address was looked up once
+    assert sorted(hanging_resolver) == ["10.0.0.2"] + [f"192.0.2.{i + 1}" for i in range(6)]
+
+
+def test_pending_lookups_are_not_resubmitted(ports, established, hanging_resolver):
+    """Test that a later listing waits on lookups still running instead of queueing more."""
+    command = ports.PortsCommand(console=Console(record=True))
+
+    list(command._get_connections(listening_only=False, resolve=True, process_info=False))
+    list(command._get_connections(listening_only=False, resolve=True, process_info=False))
+
+    assert len(hanging_resolver) == 7
+
+
+def test_resolved_hostnames_are_shown(ports, established, monkeypatch):
+    """Test that prefetched hostnames are used for the endpoints."""
+    monkeypatch.setattr(ports.socket, "getnameinfo", lambda sockaddr, flags: (f"host-{sockaddr[0]}", "0"))
+    command = ports.PortsCommand(console=Console(record=True))
+
+    connections = list(command._get_connections(listening_only=False, resolve=True, process_info=False))
+
+    assert connections[0]["local_endpoint"] == "host-10.0.0.2 (10.0.0.2):40000"
+    assert connections[0]["remote_endpoint"] == "host-192.0.2.1 (192.0.2.1):443"
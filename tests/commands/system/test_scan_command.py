@@ -0,0 +1,26 @@
+"""
+Tests for the system scan command.
+"""
+
+import io
+
+from rich.console import Console
+
+
+def test_scan_gathers_every_section(load_command, monkeypatch):
+    """Test that a scan collects its sections through gather_system_info."""
+    scan = load_command("scan")
+    collectors = {
+        "resources": lambda: {"cpu_percent": 5.0, "memory": {"percent": 10.0}},
+        "network": lambda: {"connections": 3},
+    }
+    monkeypatch.setattr(scan, "get_collectors", lambda snapshot, quick=False: collectors)
+    command = scan.ScanCommand(console=Console(file=io.StringIO(), width=120))
+
+    result = command.execute(quick=True)
+
+    assert result.success, result.error
+    assert result.data["resources"]["cpu_percent"] == 5.0
+    assert result.data["network"] == {"connections": 3}
+    assert "health_score" in result.data
+    assert "Network Connections" in command.console.file.getvalue()
@@ -0,0 +1,154 @@
+"""
+Tests for the system services command.
+"""
+
+import io
+import os
+import subprocess
+from unittest.mock import MagicMock, call
+
+import pytest
+from rich.console import Console
+
+
+@pytest.fixture
+def services(load_command):
+    return load_command("services")
+
+
+@pytest.fixture
+def run(services, monkeypatch):
+    """Replace subprocess.run with a mock whose calls succeed by default."""
+    mock = MagicMock(return_value=subprocess.CompletedProcess([], 0, stdout="ok"))
+    monkeypatch.setattr(services.subprocess, "run", mock)
+    return mock
+
+
+def _command(services, service_manager):
+    command = services.ServicesCommand(console=Console(file=io.StringIO()))
+    command.service_manager = service_manager
+    return command
+
+
+def _argvs(run):
+    return [c.args[0] for c in run.call_args_list]
+
+
+def test_systemd_action_runs_systemctl(services, run):
+    """Test that systemd actions map to a single systemctl call."""
+    command = _command(services, "systemd")
+
+    assert command._execute_service_action("nginx", "restart") == (True, "ok")
+    assert _argvs(run) == [["systemctl", "restart", "nginx"]]
+
+
+def test_steps_stop_at_first_failure(services, run):
+    """Test that multi-step actions stop when a step fails."""
+    run.return_value = subprocess.CompletedProcess([], 1, stdout="no such service")
+    command = _command(services, "launchd")
+
+    success, output = command._execute_service_action("com.example", "restart")
+
+    assert not success
+    assert output == "no such service"
+    assert _argvs(run) == [["launchctl", "stop", "com.example"]]
+
+
+def test_steps_run_in_order(services, run):
+    """Test that multi-step actions run every step and join their output."""
+    command = _command(services, "launchd")
+
+    assert command._execute_service_action("com.example", "restart") == (True, "ok\nok")
+    assert _argvs(run) == [
+        ["launchctl", "stop", "com.example"],
+        ["launchctl", "start", "com.example"],
+    ]
+
+
+def test_alternatives_stop_at_first_success(services, run):
+    """Test that alternatives are tried until one succeeds."""
+    run.side_effect = [
+        subprocess.CompletedProcess([], 1, stdout="not found"),
+        subprocess.CompletedProcess([], 0, stdout="loaded"),
+    ]
+    command = _command(services, "launchd")
+
+    assert command._execute_service_action("com.example", "enable") == (True, "loaded")
+    assert _argvs(run) == [
+        ["launchctl", "load", "-w", "/System/Library/LaunchDaemons/com.example.plist"],
+        ["launchctl", "load", "-w", "/Library/LaunchDaemons/com.example.plist"],
+    ]
+
+
+def test_alternatives_report_last_error(services, run):
+    """Test that only the last alternative's error is reported when all fail."""
+    run.side_effect = [
+        subprocess.CompletedProcess([], 1, stdout=f"error {i}") for i in range(3)
+    ]
+    command = _command(services, "launchd")
+
+    assert command._execute_service_action("com.example", "disable") == (False, "error 2")
+    assert run.call_count == 3
+
+
+def test_unsupported_action(services, run):
+    """Test that actions without commands for the service manager are rejected."""
+    command = _command(services, "openrc")
+
+    success, output = command._execute_service_action("sshd", "restart")
+
+    assert not success
+    assert "not supported" in output
+    run.assert_not_called()
+
+
+def test_action_timeout(services, run):
+    """Test that a service manager call that times out is reported as a failure."""
+    run.side_effect = subprocess.TimeoutExpired(["systemctl"], services._ACTION_TIMEOUT)
+    command = _command(services, "systemd")
+
+    success, output = command._execute_service_action("nginx", "stop")
+
+    assert not success
+    assert "timed out" in output
+    assert run.call_args == call(
+        ["systemctl", "stop", "nginx"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        timeout=services._ACTION_TIMEOUT
+    )
+
+
+def test_list_services_details_include_cpu(services, run, monkeypatch):
+    """Test that detailed listings measure CPU usage of each service's process."""
+    monkeypatch.setattr(services, "get_services_info", lambda: {"services": [
+        {"name": "ellma.service", "active": "active", "sub": "running", "description": "ELLMa"},
+    ]})
+    run.return_value = subprocess.CompletedProcess([], 0, stdout=(
+        "Id=ellma.service\nLoadState=loaded\nDescription=ELLMa\nActiveState=active\n"
+        f"SubState=running\nMainPID={os.getpid()}\nMemoryCurrent=1048576\n"
+    ))
+    command = _command(services, "systemd")
+
+    result = command._list_services(details=True)
+
+    service = result.data["services"][0]
+    assert service["pid"] == os.getpid()
+    assert service["cpu_percent"] >= 0.0
+    row = command.console.file.getvalue().splitlines()[1].split("\t")
+    assert row[3] == str(os.getpid())
+    assert row[5].endswith("%")
+
+
+def test_list_services_without_details_skips_lookups(services, run, monkeypatch):
+    """Test that a plain listing does not query the service manager per service."""
+    monkeypatch.setattr(services, "get_services_info", lambda: {"services": [
+        {"name": "ellma.service", "active": "active", "sub": "running", "description": "ELLMa"},
+    ]})
+    command = _command(services, "systemd")
+
+    result = command._list_services()
+
+    assert result.data["count"] == 1
+    run.assert_not_called()
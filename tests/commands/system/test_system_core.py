@@ -0,0 +1,244 @@
+"""
+Tests for the system information collectors.
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+from collections import namedtuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from ellma.utils.helpers import decorators
+
+Addr = namedtuple("Addr", ["ip", "port"])
+Conn = namedtuple("Conn", ["laddr", "raddr", "status"])
+Partition = namedtuple("Partition", ["device", "mountpoint", "fstype"])
+Usage = namedtuple("Usage", ["total", "used", "free"])
+Snic = namedtuple("Snic", ["family", "address", "netmask", "broadcast"])
+Counters = namedtuple("Counters", ["read_bytes", "write_bytes"])
+Memory = namedtuple("Memory", ["total", "available"])
+
+# Each clock fixture starts a day after the previous one, past every entry
+# cached by earlier tests
+_CLOCK_DAYS = itertools.count(1)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Drive the clock used by memoize_decorator."""
+    fake = MagicMock()
+    fake.time.return_value = time.time() + next(_CLOCK_DAYS) * 24 * 3600
+    monkeypatch.setattr(decorators, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def cpu_percent(system_core, monkeypatch):
+    """Replace psutil.cpu_percent with a mock returning a fixed reading."""
+    mock = MagicMock(return_value=[50.0, 70.0])
+    monkeypatch.setattr(system_core.psutil, "cpu_percent", mock)
+    return mock
+
+
+def test_cpu_reading_within_interval_is_reused(system_core, cpu_percent, monkeypatch):
+    """Test that CPU usage is not re-sampled less than the minimum interval apart."""
+    monkeypatch.setattr(system_core, "_cpu_sampled_at", time.monotonic())
+    monkeypatch.setattr(system_core, "_cpu_reading", [10.0, 30.0])
+
+    snapshot = system_core.SystemSnapshot()
+
+    assert snapshot.cpu_per_core() == [10.0, 30.0]
+    assert snapshot.cpu_percent() == 20.0
+    cpu_percent.assert_not_called()
+
+
+def test_first_cpu_reading_waits_for_interval(system_core, cpu_percent, monkeypatch):
+    """Test that the first reading after priming covers the minimum interval."""
+    sleep = MagicMock()
+    monkeypatch.setattr(system_core.time, "sleep", sleep)
+    monkeypatch.setattr(system_core, "_cpu_sampled_at", time.monotonic())
+    monkeypatch.setattr(system_core, "_cpu_reading", None)
+
+    snapshot = system_core.SystemSnapshot()
+
+    assert snapshot.cpu_percent() == 60.0
+    sleep.assert_called_once()
+    assert 0 < sleep.call_args[0][0] <= system_core.MIN_CPU_SAMPLE_INTERVAL
+    # The snapshot shares a single reading between its CPU figures
+    assert snapshot.cpu_per_core() == [50.0, 70.0]
+    cpu_percent.assert_called_once_with(interval=None, percpu=True)
+
+
+def test_cpu_reading_after_interval_is_fresh(system_core, cpu_percent, monkeypatch):
+    """Test that CPU usage is sampled again once the minimum interval has passed."""
+    sleep = MagicMock()
+    monkeypatch.setattr(system_core.time, "sleep", sleep)
+    monkeypatch.setattr(system_core, "_cpu_sampled_at",
+                        time.monotonic() - system_core.MIN_CPU_SAMPLE_INTERVAL)
+    monkeypatch.setattr(system_core, "_cpu_reading", [10.0, 30.0])
+
+    assert system_core.SystemSnapshot().cpu_per_core() == [50.0, 70.0]
+    sleep.assert_not_called()
+
+
+def test_scan_connections(system_core):
+    """Test that the connection table is summarized in one pass."""
+    connections = [
+        Conn(Addr("0.0.0.0", 22), (), "LISTEN"),
+        Conn(Addr("::", 22), (), "LISTEN"),
+        Conn(Addr("0.0.0.0", 8080), (), "LISTEN"),
+        Conn(Addr("10.0.0.2", 22), Addr("10.0.0.3", 50000), "ESTABLISHED"),
+        Conn(Addr("10.0.0.2", 22), Addr("10.0.0.4", 50001), "ESTABLISHED"),
+        Conn(Addr("10.0.0.2", 40000), Addr("10.0.0.5", 22), "ESTABLISHED"),
+        Conn(Addr("10.0.0.2", 22), Addr("10.0.0.6", 50002), "TIME_WAIT"),
+        Conn((), (), "NONE"),
+    ]
+
+    total, ssh_connections, open_ports = system_core._scan_connections(connections)
+
+    # Entries without a local address still count towards the total
+    assert total == 8
+    # Only inbound established connections to port 22 are SSH sessions
+    assert ssh_connections == 2
+    assert open_ports == [22, 8080]
+
+
+def test_scan_connections_empty(system_core):
+    """Test summarizing an empty connection table."""
+    assert system_core._scan_connections([]) == (0, 0, [])
+
+
+@pytest.fixture
+def storage(system_core, monkeypatch):
+    """Mock the psutil storage readings behind get_storage_info."""
+    mocks = {
+        "disk_partitions": MagicMock(return_value=[Partition("/dev/sda1", "/", "ext4")]),
+        "disk_usage": MagicMock(return_value=Usage(100, 25, 75)),
+        "disk_io_counters": MagicMock(side_effect=[Counters(1, 2), Counters(3, 4), Counters(5, 6)]),
+    }
+    for name, mock in mocks.items():
+        monkeypatch.setattr(system_core.psutil, name, mock)
+    return mocks
+
+
+def test_storage_usage_cached_within_ttl(system_core, storage, clock):
+    """Test that mount point usage is reused while I/O counters stay live."""
+    first = system_core.get_storage_info()
+    first["disks"]["/"]["used"] = 0
+    clock.time.return_value += system_core.STORAGE_INFO_TTL / 2
+    second = system_core.get_storage_info()
+
+    assert storage["disk_usage"].call_count == 1
+    # Callers get copies, so modifying one result does not leak into the next
+    assert second["disks"]["/"]["used"] == 25
+    assert second["disks"]["/"]["percent"] == 25.0
+    assert first["io_counters"] == {"read_bytes": 1, "write_bytes": 2}
+    assert second["io_counters"] == {"read_bytes": 3, "write_bytes": 4}
+
+
+def test_storage_usage_expires(system_core, storage, clock):
+    """Test that mount point usage is probed again once the TTL has passed."""
+    system_core.get_storage_info()
+    clock.time.return_value += system_core.STORAGE_INFO_TTL
+    system_core.get_storage_info()
+
+    assert storage["disk_usage"].call_count == 2
+
+
+def test_network_interfaces_cached_within_ttl(system_core, clock, monkeypatch):
+    """Test that interface addresses are reused while counters stay live."""
+    net_if_addrs = MagicMock(return_value={"eth0": [Snic(2, "10.0.0.2", "255.0.0.0", None)]})
+    net_io_counters = MagicMock(side_effect=[Counters(1, 2), Counters(3, 4), Counters(5, 6)])
+    monkeypatch.setattr(system_core.psutil, "net_if_addrs", net_if_addrs)
+    monkeypatch.setattr(system_core.psutil, "net_io_counters", net_io_counters)
+    monkeypatch.setattr(system_core.psutil, "net_connections", MagicMock(return_value=[]))
+
+    first = system_core.get_network_info()
+    first["interfaces"]["eth0"].clear()
+    second = system_core.get_network_info()
+
+    net_if_addrs.assert_called_once()
+    assert second["interfaces"]["eth0"][0]["address"] == "10.0.0.2"
+    assert second["io_counters"] == {"read_bytes": 3, "write_bytes": 4}
+
+    clock.time.return_value += system_core.NETWORK_INFO_TTL
+    system_core.get_network_info()
+    assert net_if_addrs.call_count == 2
+
+
+def test_hardware_info_reads_memory_live(system_core, monkeypatch):
+    """Test that static hardware fields are cached but memory is read per call."""
+    monkeypatch.setattr(system_core.psutil, "virtual_memory",
+                        MagicMock(side_effect=[Memory(1000, 600), Memory(1000, 400)]))
+
+    first = system_core.get_hardware_info()
+    second = system_core.get_hardware_info()
+
+    assert system_core._get_static_hardware_info() is system_core._get_static_hardware_info()
+    assert first["boot_time"] == second["boot_time"]
+    assert (first["memory_available"], second["memory_available"]) == (600, 400)
+
+
+def test_gather_system_info_runs_collectors_concurrently(system_core):
+    """Test that scan sections are collected in worker threads at the same time."""
+    threads = {}
+
+    def collector(name):
+        def collect():
+            threads[name] = threading.current_thread()
+            time.sleep(0.2)
+            return {"section": name}
+        return collect
+
+    collectors = {name: collector(name) for name in ("platform", "hardware", "storage")}
+    collected = []
+
+    start = time.monotonic()
+    results = asyncio.run(system_core.gather_system_info(collectors=collectors, on_collected=collected.append))
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.5
+    assert list(results) == ["platform", "hardware", "storage"]
+    assert results["storage"] == {"section": "storage"}
+    assert sorted(collected) == ["hardware", "platform", "storage"]
+    assert threading.main_thread() not in threads.values()
+
+
+def test_gather_system_info_defaults_to_scan_collectors(system_core, monkeypatch):
+    """Test that the quick scan collectors are used when none are given."""
+    monkeypatch.setattr(system_core, "get_collectors",
+                        lambda snapshot=None, quick=False: {"quick": lambda: {"quick": quick}})
+
+    assert asyncio.run(system_core.gather_system_info(quick=True)) == {"quick": {"quick": True}}
+
+
+def test_ip_address_is_reused_within_ttl(system_core, clock, monkeypatch):
+    """Test that the host address is looked up again only after IP_ADDRESS_TTL."""
+    gethostbyname = MagicMock(side_effect=["10.0.0.2", "10.0.0.3"])
+    monkeypatch.setattr(system_core.socket, "gethostbyname", gethostbyname)
+
+    assert system_core._get_ip_address("ellma-host") == "10.0.0.2"
+    assert system_core._get_ip_address("ellma-host") == "10.0.0.2"
+    clock.time.return_value += system_core.IP_ADDRESS_TTL
+    assert system_core._get_ip_address("ellma-host") == "10.0.0.3"
+    assert gethostbyname.call_count == 2
+
+
+def test_process_info_is_shared_within_ttl(system_core, clock, monkeypatch):
+    """Test that process info is walked once per PROCESS_INFO_TTL and returned as copies."""
+    pids = MagicMock(return_value=[1, 2, 3])
+    monkeypatch.setattr(system_core.sys, "platform", "darwin")
+    monkeypatch.setattr(system_core.psutil, "pids", pids)
+
+    first = system_core.get_process_info(detailed=False)
+    first["top_cpu"].append({"pid": 1})
+    second = system_core.get_process_info(detailed=False)
+
+    assert second == {"total_processes": 3, "top_cpu": [], "top_memory": []}
+    assert pids.call_count == 1
+    clock.time.return_value += system_core.PROCESS_INFO_TTL
+    system_core.get_process_info(detailed=False)
+    assert pids.call_count == 2
@@ -0,0 +1,115 @@
+"""
+Tests for the system command utilities.
+"""
+
+import gzip
+import os
+import time
+
+import pytest
+
+# Modification time of files the cleanup helpers treat as old
+OLD_MTIME = time.time() - 10 * 24 * 3600
+
+
+@pytest.fixture
+def old_files_tree(tmp_path):
+    """Create a directory tree mixing old and recent files."""
+    nested = tmp_path / "nested" / "deeper"
+    nested.mkdir(parents=True)
+    for path in (tmp_path / "old.tmp", tmp_path / "old.log", nested / "old.log.1"):
+        path.write_text("old")
+        os.utime(path, (OLD_MTIME, OLD_MTIME))
+    (tmp_path / "new.log").write_text("new")
+    # Symlinks are never followed nor removed, whatever their target's age
+    os.symlink(tmp_path / "old.log", tmp_path / "link.log")
+    return tmp_path
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 1 << 16])
+def test_reverse_lines_without_final_newline(system_utils, tmp_path, block_size):
+    """Test reading a file backwards whose last line has no newline."""
+    log_file = tmp_path / "ellma.log"
+    log_file.write_bytes(b"first\nsecond\nthird")
+
+    lines = list(system_utils._reverse_lines(log_file, block_size=block_size))
+
+    assert lines == ["third", "second", "first"]
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 1 << 16])
+def test_reverse_lines_with_final_newline(system_utils, tmp_path, block_size):
+    """Test that a trailing newline yields an empty last line first."""
+    log_file = tmp_path / "ellma.log"
+    log_file.write_bytes(b"first\nsecond\n")
+
+    lines = list(system_utils._reverse_lines(log_file, block_size=block_size))
+
+    assert lines == ["", "second", "first"]
+
+
+def test_reverse_lines_multibyte_across_blocks(system_utils, tmp_path):
+    """Test that characters split across block boundaries are decoded intact."""
+    log_file = tmp_path / "ellma.log"
+    log_file.write_text("zażółć\ngęślą jaźń", encoding="utf-8")
+
+    lines = list(system_utils._reverse_lines(log_file, block_size=2))
+
+    assert lines == ["gęślą jaźń", "zażółć"]
+
+
+def test_reverse_lines_empty_file(system_utils, tmp_path):
+    """Test reading an empty file backwards."""
+    log_file = tmp_path / "ellma.log"
+    log_file.write_bytes(b"")
+
+    assert list(system_utils._reverse_lines(log_file)) == [""]
+
+
+def test_reverse_lines_compressed(system_utils, tmp_path):
+    """Test that compressed logs are read newest line first."""
+    log_file = tmp_path / "ellma.log.1.gz"
+    with gzip.open(log_file, "wt", encoding="utf-8") as f:
+        f.write("first\nsecond\n")
+
+    lines = [line.strip() for line in system_utils._reverse_lines(log_file)]
+
+    assert lines == ["second", "first"]
+
+
+def test_walk_old_files(system_utils, old_files_tree):
+    """Test that only old regular files are yielded, including nested ones."""
+    cutoff = time.time() - 24 * 3600
+
+    names = {entry.name for entry in system_utils._walk_old_files(str(old_files_tree), cutoff)}
+
+    assert names == {"old.tmp", "old.log", "old.log.1"}
+
+
+def test_walk_old_files_pattern(system_utils, old_files_tree):
+    """Test that file names are filtered by the glob pattern."""
+    cutoff = time.time() - 24 * 3600
+
+    entries = system_utils._walk_old_files(str(old_files_tree), cutoff, "*.log*")
+
+    assert {entry.name for entry in entries} == {"old.log", "old.log.1"}
+
+
+def test_walk_old_files_missing_root(system_utils, tmp_path):
+    """Test that an unreadable root directory raises OSError."""
+    with pytest.raises(OSError):
+        list(system_utils._walk_old_files(str(tmp_path / "missing"), time.time()))
+
+
+def test_remove_old_files(system_utils, old_files_tree, tmp_path_factory):
+    """Test that old matching files are removed and missing directories skipped."""
+    missing = tmp_path_factory.mktemp("gone") / "missing"
+
+    removed = system_utils._remove_old_files([str(old_files_tree), str(missing)], 24 * 3600, "*.log*")
+
+    assert removed == 2
+    assert not (old_files_tree / "old.log").exists()
+    assert not (old_files_tree / "nested" / "deeper" / "old.log.1").exists()
+    assert (old_files_tree / "old.tmp").exists()
+    assert (old_files_tree / "new.log").exists()
+    assert os.path.islink(old_files_tree / "link.log")
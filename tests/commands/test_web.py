@@ -0,0 +1,325 @@
+"""
+Tests for the web commands.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ellma.commands import web as web_module
+from ellma.commands.web import WebCommands
+
+
+def _response(url, status_code=200, text="<html><body>ok</body></html>"):
+    """Create a mock requests response."""
+    response = MagicMock()
+    response.url = url
+    response.status_code = status_code
+    response.headers = {"Content-Type": "text/html"}
+    response.text = text
+    response.content = text.encode()
+    response.encoding = "utf-8"
+    response.elapsed = timedelta(milliseconds=5)
+    return response
+
+
+@pytest.fixture
+def web():
+    """Create web commands with a mocked HTTP session."""
+    commands = WebCommands(MagicMock())
+    commands.session = MagicMock()
+    commands.session.get.side_effect = lambda url, **kwargs: _response(url)
+    return commands
+
+
+def test_get_many_without_aiohttp_fetches_serially(web, monkeypatch):
+    """Test that get_many falls back to get() when aiohttp is missing."""
+    monkeypatch.setattr(web_module, "HAS_AIOHTTP", False)
+    urls = ["https://example.com/a", "https://example.com/b"]
+
+    results = web.get_many(urls)
+
+    assert [result["url"] for result in results] == urls
+    assert all(result["status_code"] == 200 for result in results)
+    assert web.session.get.call_count == 2
+
+
+def test_get_many_reuses_cached_responses(web, monkeypatch):
+    """Test that get_many and get share the response cache."""
+    monkeypatch.setattr(web_module, "HAS_AIOHTTP", False)
+    web.get("https://example.com/a")
+
+    results = web.get_many(["https://example.com/a", "https://example.com/b"])
+
+    assert len(results) == 2
+    assert [c.args[0] for c in web.session.get.call_args_list] == [
+        "https://example.com/a",
+        "https://example.com/b",
+    ]
+
+
+def test_get_many_uses_aiohttp_outside_event_loop(web, monkeypatch):
+    """Test that get_many fetches concurrently when no event loop is running."""
+    monkeypatch.setattr(web_module, "HAS_AIOHTTP", True)
+    fetched = [{"url": "https://example.com/a", "status_code": 200}]
+    web._fetch_many = AsyncMock(return_value=fetched)
+
+    assert web.get_many(["https://example.com/a"]) == fetched
+    web.session.get.assert_not_called()
+
+
+def test_get_many_inside_event_loop_fetches_serially(web, monkeypatch):
+    """Test that get_many does not nest asyncio.run inside a running loop."""
+    monkeypatch.setattr(web_module, "HAS_AIOHTTP", True)
+    web._fetch_many = AsyncMock()
+    urls = ["https://example.com/a", "https://example.com/b"]
+
+    async def main():
+        return web.get_many(urls)
+
+    results = asyncio.run(main())
+
+    assert [result["url"] for result in results] == urls
+    web._fetch_many.assert_not_called()
+
+
+def test_aget_many_without_aiohttp_runs_in_thread(web, monkeypatch):
+    """Test that aget_many fetches serially off the event loop thread without aiohttp."""
+    monkeypatch.setattr(web_module, "HAS_AIOHTTP", False)
+    loop_threads = []
+    fetch_threads = []
+
+    def get(url, **kwargs):
+        fetch_threads.append(threading.current_thread())
+        return _response(url)
+
+    web.session.get.side_effect = get
+    urls = ["https://example.com/a", "https://example.com/b"]
+
+    async def main():
+        loop_threads.append(threading.current_thread())
+        return await web.aget_many(urls)
+
+    results = asyncio.run(main())
+
+    assert [result["url"] for result in results] == urls
+    assert loop_threads[0] not in fetch_threads
+
+
+def test_aget_many_uses_aiohttp(web, monkeypatch):
+    """Test that aget_many awaits the pooled aiohttp fetch when available."""
+    monkeypatch.setattr(web_module, "HAS_AIOHTTP", True)
+    fetched = [{"url": "https://example.com/a", "status_code": 200}]
+    web._fetch_many = AsyncMock(return_value=fetched)
+
+    assert asyncio.run(web.aget_many(["https://example.com/a"], headers={"X-Test": "1"})) == fetched
+    web._fetch_many.assert_awaited_once_with(["https://example.com/a"], {"X-Test": "1"})
+
+
+class _AiohttpResponse:
+    """Minimal stand-in for an aiohttp response context manager."""
+
+    def __init__(self, url, body=b"<html>ok</html>"):
+        self.url = url
+        self.status = 200
+        self.headers = {"Content-Type": "text/html"}
+        self.charset = "utf-8"
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def read(self):
+        return self._body
+
+    async def text(self, errors="strict"):
+        return self._body.decode(self.charset, errors)
+
+
+def test_fetch_uses_session_proxy(web):
+    """Test that the aiohttp path uses the requests session's proxy for the URL's scheme."""
+    web.session.proxies = {"https": "http://proxy.example:3128"}
+    session = MagicMock()
+    session.get.return_value = _AiohttpResponse("https://example.com/a")
+
+    result = asyncio.run(web._fetch(session, "https://example.com/a", None))
+
+    assert result["status_code"] == 200
+    assert result["content"] == "<html>ok</html>"
+    session.get.assert_called_once_with(
+        "https://example.com/a", headers=None, allow_redirects=True, proxy="http://proxy.example:3128"
+    )
+    assert web._proxy_for("http://example.com/") is None
+
+
+def test_ssl_setting_follows_session_verify(web, tmp_path):
+    """Test that TLS verification for aiohttp mirrors the requests session."""
+    web.session.verify = True
+    assert web._ssl_setting() is True
+    web.session.verify = False
+    assert web._ssl_setting() is False
+    web.session.verify = str(tmp_path)
+    assert isinstance(web._ssl_setting(), web_module.ssl.SSLContext)
+
+
+def test_get_error_response(web):
+    """Test that failed requests return an error entry instead of raising."""
+    web.session.get.side_effect = web_module.requests.ConnectionError("refused")
+
+    result = web.get("https://example.com/a")
+
+    assert result["status_code"] == 0
+    assert result["error"] == "refused"
+    assert web._cached_response(web._cache_key("https://example.com/a")) is None
+
+
+@pytest.fixture
+def links_page(web):
+    """Make read() return a page with internal, external and mail links."""
+    web.read = MagicMock(return_value={"links": [
+        {"url": "https://example.com/about"},
+        {"url": "https://example.com/about"},
+        {"url": "https://example.com/old"},
+        {"url": "https://other.org/page"},
+        {"url": "mailto:info@example.com"},
+    ]})
+    return web
+
+
+def _head_statuses(statuses):
+    """Create a session.head side effect answering with per-URL status codes."""
+    return lambda url, **kwargs: _response(url, status_code=statuses[url])
+
+
+def test_analyze_links_does_not_check_links_by_default(links_page):
+    """Test that analyze_links sends no requests for the links unless asked."""
+    analysis = links_page.analyze_links("https://example.com")
+
+    links_page.session.head.assert_not_called()
+    assert analysis["broken_links"] == 0
+    assert analysis["internal_links"] == 3
+    assert analysis["external_links"] == 1
+    assert analysis["email_links"] == 1
+
+
+def test_analyze_links_counts_broken_links(links_page):
+    """Test that each unique link is checked once and failures are counted."""
+    links_page.session.head.side_effect = _head_statuses({
+        "https://example.com/about": 200,
+        "https://example.com/old": 404,
+        "https://other.org/page": 500,
+    })
+
+    analysis = links_page.analyze_links("https://example.com", check_links=True)
+
+    assert analysis["broken_links"] == 2
+    assert sorted(c.args[0] for c in links_page.session.head.call_args_list) == [
+        "https://example.com/about",
+        "https://example.com/old",
+        "https://other.org/page",
+    ]
+
+
+def test_analyze_links_retries_rejected_head_with_get(links_page):
+    """Test that links whose server rejects HEAD are checked with GET."""
+    links_page.session.head.side_effect = _head_statuses({
+        "https://example.com/about": 405,
+        "https://example.com/old": 200,
+        "https://other.org/page": 200,
+    })
+
+    analysis = links_page.analyze_links("https://example.com", check_links=True)
+
+    assert analysis["broken_links"] == 0
+    links_page.session.get.assert_called_once_with(
+        "https://example.com/about", timeout=5, allow_redirects=True, stream=True
+    )
+
+
+def test_analyze_links_counts_unreachable_links(links_page):
+    """Test that links failing with a request error count as broken."""
+    links_page.session.head.side_effect = web_module.requests.ConnectionError("refused")
+
+    analysis = links_page.analyze_links("https://example.com", check_links=True)
+
+    # Every occurrence of a broken link is counted, not just unique ones
+    assert analysis["broken_links"] == 4
+    assert links_page.session.head.call_count == 3
+
+
+def test_monitor_changes_with_several_urls(web):
+    """Test that several pages are monitored concurrently from worker threads."""
+    pages = {
+        "https://example.com/a": iter(["first", "second", "second"]),
+        "https://example.com/b": iter(["same", "same", "same"]),
+    }
+    web.session.get.side_effect = lambda url, **kwargs: _response(url, text=next(pages[url]))
+    web._cache_ttl = 0
+
+    changes = web.monitor_changes(list(pages), check_interval=0, max_checks=3)
+
+    # Each page was read on every check, so no check failed on a worker thread
+    assert web.session.get.call_count == 6
+    assert [(change["url"], change["check_number"]) for change in changes] == [
+        ("https://example.com/a", 2)
+    ]
+
+
+def test_monitor_changes_with_empty_list(web):
+    """Test that monitoring no pages returns no changes."""
+    assert web.monitor_changes([], check_interval=0) == []
+
+
+def test_monitor_changes_checks_every_page_at_once(web):
+    """Test that every page is monitored concurrently, beyond the link check pool size."""
+    urls = [f"https://site{i}.example/" for i in range(web_module.LINK_CHECK_WORKERS + 5)]
+    # Each page's first check waits until all pages have started
+    started = threading.Barrier(len(urls), timeout=5)
+    first_checks = set()
+    lock = threading.Lock()
+
+    def get(url, **kwargs):
+        with lock:
+            first = url not in first_checks
+            first_checks.add(url)
+        if first:
+            started.wait()
+        return _response(url)
+
+    web.session.get.side_effect = get
+    web._cache_ttl = 0
+
+    assert web.monitor_changes(urls, check_interval=0, max_checks=2) == []
+    assert web.session.get.call_count == 2 * len(urls)
+
+
+def test_monitor_changes_limits_requests_per_host(web):
+    """Test that pages on the same host share the per-host request limit."""
+    urls = [f"https://example.com/{i}" for i in range(web_module.MAX_REQUESTS_PER_HOST * 2)]
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def get(url, **kwargs):
+        with lock:
+            active.append(url)
+            peak.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.remove(url)
+        return _response(url)
+
+    web.session.get.side_effect = get
+    web._cache_ttl = 0
+
+    web.monitor_changes(urls, check_interval=0, max_checks=2)
+
+    assert web.session.get.call_count == 2 * len(urls)
+    assert max(peak) <= web_module.MAX_REQUESTS_PER_HOST